@@ -14,6 +14,7 @@
 
 
 from pyclarify.client import Client
+from pyclarify.async_client import AsyncClient
 from pyclarify.views import (
     Signal,
     SignalInfo,
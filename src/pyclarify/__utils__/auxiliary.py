@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+import builtins
 import importlib
 from .exceptions import ImportError
 
@@ -20,5 +21,5 @@ from .exceptions import ImportError
 def local_import(module: str):
     try:
         return importlib.import_module(module)
-    except ImportError as e:
-        raise ImportError(modulue=module.split(".")[0]) from e
+    except builtins.ImportError as e:
+        raise ImportError(module=module.split(".")[0]) from e
@@ -115,3 +115,15 @@ class CredentialError(PyClarifyException):
         return (
             f"Credentials error: {self.error}. Description: {self.error_description}"
         )
+
+
+class ResponseError(PyClarifyException):
+    """
+    Error class that is generated when the Clarify API responds with an error where no Response is returned
+    """
+
+    def __init__(self, error):
+        self.error = error
+
+    def __str__(self):
+        return f"Response error: {self.error}"
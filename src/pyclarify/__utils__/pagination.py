@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import timedelta
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
 from pyclarify.query.filter import DataFilter
 
 from pyclarify.views.generics import Request
@@ -146,17 +147,81 @@ class TimeIterator:
 
 
 
+class Page(NamedTuple):
+    """
+    Lightweight description of a single page of a paginated request. Pages are independent of each
+    other and of the request they were planned from, so they can be fetched in any order.
+
+    Parameters
+    ----------
+    index: int
+        The position of the page in the plan.
+
+    skip: int, default None
+        The starting point of where to retrieve resources. None if the request has no resource query.
+
+    limit: int, default None
+        The number of resources to retrieve. None if the request has no resource query.
+
+    gte: datetime, default None
+        The inclusive start of the time window. None if the request has no data query.
+
+    lt: datetime, default None
+        The exclusive end of the time window. None if the request has no data query.
+    """
+
+    index: int
+    skip: Optional[int] = None
+    limit: Optional[int] = None
+    gte: Optional[datetime] = None
+    lt: Optional[datetime] = None
+
+    def apply(self, request: Request) -> Request:
+        """
+        Creates the request for this page. The original request is not modified.
+
+        Parameters
+        ----------
+        request: Request
+            The request the page was planned from.
+
+        Returns
+        -------
+        Request
+            A shallow copy of the request, with new query and data objects for this page.
+        """
+        update = {}
+        if hasattr(request.params, "query") and self.limit is not None:
+            update["query"] = request.params.query.model_copy(
+                update={"skip": self.skip, "limit": self.limit}
+            )
+        data = getattr(request.params, "data", None)
+        if hasattr(data, "filter") and self.gte is not None:
+            times = DataFilter(gte=self.gte, lt=self.lt).to_query()["times"]
+            update["data"] = data.model_copy(
+                update={"filter": {**data.filter, "times": times}}
+            )
+        if not update:
+            return request.model_copy()
+        return request.model_copy(update={"params": request.params.model_copy(update=update)})
+
+
 class SelectIterator:
     """
-    Computes the next request for select queries. 
+    Computes the requests for select queries. Every iteration returns a new request,
+    the request given as input is never modified.
 
     Parameters
     ----------
-    request: dict/Request
+    request: Request
+        The request to paginate.
+
+    window_size: `RFC3339 duration <https://docs.clarify.io/api/1.1beta2/types/fields#fixed-duration>`__, default None
+        Paging size of time windows, instead of default API limits.
 
     Returns
     -------
-    request: dict/Request
+    request: Request
     """
 
     def __init__(self, request: Request, window_size=None):
@@ -175,46 +240,32 @@ class SelectIterator:
         if self.user_limit == None:
             self.user_limit = self.API_LIMIT
 
-        self.segment_iterator = iter(SegmentIterator(
-                user_limit=self.user_limit, 
-                limit_per_call=self.API_LIMIT, 
-                skip=self.skip
-        ))
-        self.current_time_iterator = iter(TimeIterator(
-            start_time=self.user_gte, 
-            end_time=self.user_lt, 
-            rollup=self.rollup, 
-            window_size=self.window_size
-        ))
-
+    def pages(self):
+        """
+        Plans the pages of the request, ordered by resource segment and then by time window.
+
+        Returns
+        -------
+        Iterator[Page]
+            A new, independent page descriptor for every call to the API.
+        """
+        has_data = hasattr(getattr(self.request.params, "data", None), "filter")
+        index = 0
+        for skip, limit in SegmentIterator(
+            user_limit=self.user_limit, limit_per_call=self.API_LIMIT, skip=self.skip
+        ):
+            if not has_data:
+                yield Page(index=index, skip=skip, limit=limit)
+                index += 1
+                continue
+            for gte, lt in TimeIterator(
+                start_time=self.user_gte,
+                end_time=self.user_lt,
+                rollup=self.rollup,
+                window_size=self.window_size,
+            ):
+                yield Page(index=index, skip=skip, limit=limit, gte=gte, lt=lt)
+                index += 1
 
     def __iter__(self):
-        self.stopping_condition = False
-        self.first_iteration = True
-        self.skip, self.limit = next(self.segment_iterator)
-        return self
-
-    def __next__(self):
-        if hasattr(self.request.params, "query"):
-            self.request.params.query.skip = self.skip
-            self.request.params.query.limit = self.limit
-        try:
-            start_time, end_time = next(self.current_time_iterator)
-            dq = DataFilter(gte=start_time, lt=end_time)
-            self.request.params.data.filter["times"] = dq.to_query()["times"]
-        except:            
-            try:
-                self.skip, self.limit = next(self.segment_iterator)
-                self.current_time_iterator = iter(TimeIterator(
-                    start_time=self.user_gte, 
-                    end_time=self.user_lt, 
-                    rollup=self.rollup, 
-                    window_size=self.window_size
-                ))
-            except:
-                self.stopping_condition = True
-        if self.stopping_condition and not self.first_iteration:
-            raise StopIteration
-        else:
-            self.first_iteration = False
-            return self.request
+        return (page.apply(self.request) for page in self.pages())
@@ -27,9 +27,9 @@ def unpack_params(request: Request):
     # Data Query
     data = getattr(request.params, "data") if hasattr(request.params, "data") else None
     if data:
-        times = data.filter["times"]
-        user_gte = times.pop("$gte", None)
-        user_lt = times.pop("$lt", None)
+        times = data.filter.get("times", {})
+        user_gte = times.get("$gte", None)
+        user_lt = times.get("$lt", None)
         rollup = data.rollup
 
     if request.method == ApiMethod.select_items:
@@ -36,7 +36,7 @@ Yoinked from pydantic V1.10 after they removed it in V2
 """
 import re
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Dict, Optional, Type, Union
+from typing import Dict, List, Optional, Type, Union
 
 date_expr = r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})'
 time_expr = (
@@ -228,6 +228,27 @@ def parse_datetime(value: Union[datetime, StrBytesIntFloat]) -> datetime:
         raise ValueError
 
 
+def parse_datetimes(values: List) -> List[datetime]:
+    """
+    Parse a list of timestamps in bulk.
+
+    Uses the C implementation of datetime.fromisoformat, and falls back to parse_datetime
+    for the whole list if any of the values is not an ISO 8601 string.
+    """
+    try:
+        return [datetime.fromisoformat(value) for value in values]
+    except (TypeError, ValueError):
+        pass
+    try:
+        # datetime.fromisoformat does not accept the Z suffix before python 3.11
+        return [
+            datetime.fromisoformat(value[:-1] + "+00:00" if value[-1:] == "Z" else value)
+            for value in values
+        ]
+    except (TypeError, ValueError):
+        return [parse_datetime(value) for value in values]
+
+
 def parse_duration(value: StrBytesIntFloat) -> timedelta:
     """
     Parse a duration int/float/string and return a datetime.timedelta.
@@ -269,6 +290,18 @@ def time_to_string(time):
     return time.astimezone().isoformat()
 
 
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def datetime_to_epoch_ns(time: datetime) -> int:
+    """
+    Nanoseconds since the unix epoch. Naive datetimes are taken as local time, like in time_to_string.
+    """
+    if time.tzinfo is None:
+        time = time.astimezone()
+    return (time - EPOCH_UTC) // timedelta(microseconds=1) * 1000
+
+
 def compute_iso_timewindow(start_time, end_time):
     if not start_time and end_time:
         end_time = parse_datetime(end_time)
@@ -0,0 +1,391 @@
+# Copyright 2023-2024 Searis AS
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Async client module of PyClarify.
+
+The module provides an asyncio version of the Client. All RPC methods share request building,
+pagination and response models with the Client, but the requests are sent with a non-blocking
+http client (`httpx <https://www.python-httpx.org/>`__), which has to be installed separately.
+"""
+import asyncio
+import logging
+from collections import deque
+from datetime import timedelta
+from itertools import islice
+from typing import Callable, List
+from pyclarify.batch import Batch, BatchResult, active_batch
+from pyclarify.client import Client
+from pyclarify.jsonrpc.client import logger, payload_preview
+from pyclarify.views.generics import Request, Response
+from pyclarify.fields.error import Error
+from pyclarify.__utils__.auxiliary import local_import
+from pyclarify.__utils__.exceptions import ResponseError
+
+
+class AsyncClient(Client):
+    """
+    The class containing all rpc methods for talking to Clarify from an asyncio event loop.
+    Takes the same methods and arguments as Client, but every rpc method returns an awaitable,
+    and ``iter_data_frame`` and ``iter_evaluate`` return async iterators.
+    Requires `httpx` to be installed.
+
+    Parameters
+    ----------
+    clarify_credentials: path to json file
+        Path to the Clarify credentials json file from the integrations page in clarify. See user guide for more information.
+
+    max_connections: int, default 100
+        The maximum number of concurrent connections to Clarify.
+
+    max_keepalive_connections: int, default 20
+        The maximum number of idle connections kept alive between requests.
+
+    serializer: JSONSerializer, default None
+        The serializer used to encode requests and decode responses, see `pyclarify.jsonrpc.serializer`.
+
+    trust_responses: bool, default False
+        If True, data frames in responses from Clarify are not validated, and their timestamps are parsed in bulk.
+
+    retry_policy: RetryPolicy, default None
+        Decides which failed requests are sent again, see `pyclarify.jsonrpc.retry`.
+
+    throttle: Throttle, default None
+        Limits the rate and concurrency of requests, see `pyclarify.jsonrpc.throttle`.
+
+    token_cache: FileTokenCache, default None
+        Shares access tokens with other processes using the same credentials, see `pyclarify.jsonrpc.token_cache`.
+
+    compression: Compression, default None
+        Compresses large request bodies, see `pyclarify.jsonrpc.compression`.
+
+    refresh_margin: float, default 60
+        Seconds before expiry at which the access token is refreshed.
+
+    background_refresh: bool, default False
+        If True, the access token is refreshed in a background thread while the current one is still valid.
+
+    Example
+    -------
+        >>> import asyncio
+        >>> from pyclarify import AsyncClient
+        >>> async def main():
+        ...     async with AsyncClient("./clarify-credentials.json") as client:
+        ...         return await asyncio.gather(
+        ...             client.select_items(limit=5),
+        ...             client.data_frame(gte="2022-01-01T00:00:00Z", lt="2022-01-02T00:00:00Z"),
+        ...         )
+        >>> items, data = asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        clarify_credentials,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        serializer=None,
+        trust_responses: bool = False,
+        retry_policy=None,
+        throttle=None,
+        token_cache=None,
+        compression=None,
+        refresh_margin: float = 60.0,
+        background_refresh: bool = False,
+    ):
+        super().__init__(
+            clarify_credentials,
+            serializer=serializer,
+            trust_responses=trust_responses,
+            retry_policy=retry_policy,
+            throttle=throttle,
+            token_cache=token_cache,
+            compression=compression,
+            refresh_margin=refresh_margin,
+            background_refresh=background_refresh,
+        )
+        httpx = local_import("httpx")
+        self.async_session = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            )
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes all pooled connections of the client.
+        """
+        await self.async_session.aclose()
+        self.close()
+
+    def writer(self, **kwargs):
+        """
+        Not available on the AsyncClient, the BufferedWriter inserts from a background thread with a Client.
+
+        Raises
+        ------
+        TypeError
+            Always.
+        """
+        raise TypeError("The BufferedWriter needs a Client, it cannot insert with an AsyncClient.")
+
+    async def make_request(self, payload, method=None, headers=None):
+        """
+        Uses post request to send JSON RPC payload without blocking the event loop.
+        Failed requests are sent again as decided by the retry policy of the client.
+
+        Parameters
+        ----------
+        payload : JSON RPC dictionary
+            A dictionary in the form of a JSONRPC request.
+        method : ApiMethod, default None
+            The RPC method of the payload, used to decide if the request can be retried.
+        headers : dict, default None
+            The headers of this request. If None, the headers of the client are used.
+
+        Returns
+        -------
+        httpx.Response
+            The http response.
+        """
+        httpx = local_import("httpx")
+        self.retry_policy.record_request()
+        attempt = 0
+        while True:
+            self.report_throttle(method, await self.throttle.acquire_async())
+            try:
+                res = await self.post(payload, headers)
+            except httpx.TransportError as e:
+                sent = not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                delay = self.retry_delay(method, attempt, exception=e, sent=sent)
+                if delay is None:
+                    raise
+            else:
+                if res.is_success:
+                    return res
+                delay = self.retry_delay(
+                    method, attempt, res.status_code, res.headers.get("Retry-After")
+                )
+                if delay is None:
+                    return res
+            finally:
+                self.throttle.release()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def post(self, payload, headers=None):
+        """
+        :meta private:
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        headers = headers if headers is not None else self.headers
+        if debug:
+            logger.debug(
+                "--> %s, req: %s",
+                self.base_url, payload_preview(payload, encoding=headers.get("Content-Encoding")),
+            )
+        res = await self.async_session.post(self.base_url, content=payload, headers=headers)
+        if debug:
+            logger.debug(
+                "<-- %s (%s) res: %s", self.base_url, res.status_code, payload_preview(res.content)
+            )
+        return res
+
+    @staticmethod
+    def received_bytes(response) -> int:
+        """
+        :meta private:
+        """
+        received = getattr(response, "num_bytes_downloaded", None)
+        return received if isinstance(received, int) else len(response.content or b"")
+
+    def handle_response(self, request: Request, response) -> Response:
+        """
+        :meta private:
+        """
+        if not response.is_success:
+            err = {
+                "code": response.status_code,
+                "message": f"HTTP Response Error: {response.reason_phrase}",
+                "data": response.text,
+            }
+            return Response(id=request.id, error=Error(**err))
+        return self.decode_response(request, response.content)
+
+    def handle_batch_response(self, requests: List[Request], response) -> List[Response]:
+        """
+        :meta private:
+        """
+        if not response.is_success:
+            return [self.handle_response(request, response) for request in requests]
+        return self.decode_batch_response(requests, response.content)
+
+    async def send_batch(self, batch: Batch) -> List[BatchResult]:
+        """
+        :meta private:
+        """
+        requests = batch.plan()
+        if requests:
+            batch.resolve(await self.send_requests(requests, await self.current_headers()))
+        return batch.calls
+
+    async def send_requests(self, requests: List[Request], headers: dict = None) -> List[Response]:
+        """
+        :meta private:
+        """
+        event = self.instrumentation.start_request("batch")
+        try:
+            with event.measure("serialize_time"):
+                payload = self.create_batch_payload(requests)
+                event.request_bytes = len(payload)
+                payload, headers = self.compress(payload, headers)
+            event.sent_bytes = len(payload)
+            with event.measure("network_time"):
+                rpc_response = await self.make_request(payload, self.batch_method(requests), headers)
+            event.status_code = rpc_response.status_code
+            event.response_bytes = len(rpc_response.content or b"")
+            event.received_bytes = self.received_bytes(rpc_response)
+            with event.measure("validation_time"):
+                responses = self.handle_batch_response(requests, rpc_response)
+            event.error = [response.error for response in responses if response.error] or None
+            return responses
+        except Exception as e:
+            event.exception = e
+            raise
+        finally:
+            self.instrumentation.end_request(event)
+
+    async def send_request(self, request: Request, page: int = None, headers: dict = None) -> Response:
+        """
+        :meta private:
+        """
+        request = request.model_copy(update={"id": self.next_id()})
+        event = self.instrumentation.start_request(request.method, request.id, page)
+        try:
+            with event.measure("serialize_time"):
+                payload = self.serializer.dump_model(request)
+                event.request_bytes = len(payload)
+                payload, headers = self.compress(payload, headers)
+            event.sent_bytes = len(payload)
+            with event.measure("network_time"):
+                rpc_response = await self.make_request(payload, request.method, headers)
+            event.status_code = rpc_response.status_code
+            event.response_bytes = len(rpc_response.content or b"")
+            event.received_bytes = self.received_bytes(rpc_response)
+            with event.measure("validation_time"):
+                response = self.handle_response(request, rpc_response)
+            event.error = response.error
+            return response
+        except Exception as e:
+            event.exception = e
+            raise
+        finally:
+            self.instrumentation.end_request(event)
+
+    async def iterate_pages(
+        self,
+        request: Request,
+        window_size: timedelta = None,
+        max_concurrency: int = 1,
+    ):
+        """
+        :meta private:
+        """
+        iterator = enumerate(self.plan_requests(request, window_size))
+        if max_concurrency <= 1:
+            for index, page in iterator:
+                yield await self.send_page(page, index)
+            return
+
+        # keep at most max_concurrency pages in flight, and yield them in planned order
+        in_flight = deque(
+            asyncio.ensure_future(self.send_page(page, index))
+            for index, page in islice(iterator, max_concurrency)
+        )
+        try:
+            while in_flight:
+                response = await in_flight.popleft()
+                for index, page in islice(iterator, 1):
+                    in_flight.append(asyncio.ensure_future(self.send_page(page, index)))
+                yield response
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def current_headers(self) -> dict:
+        """
+        Returns the headers of a request with the current token.
+
+        :meta private:
+        """
+        token = self.authentication.valid_token()
+        if token is None:
+            # token refresh uses a blocking call, keep it away from the event loop
+            loop = asyncio.get_running_loop()
+            token = await loop.run_in_executor(None, self.authentication.get_token)
+        return self.request_headers(token)
+
+    async def send_page(self, page: Request, index: int) -> Response:
+        """
+        :meta private:
+        """
+        return await self.send_request(page, index, await self.current_headers())
+
+    async def iterate_requests(
+        self,
+        request: Request,
+        stopping_condition: Callable = None,
+        window_size: timedelta = None,
+        max_concurrency: int = 1,
+    ):
+        """
+        :meta private:
+        """
+        batch = active_batch(self)
+        if batch is not None:
+            return batch.add(request, stopping_condition, window_size)
+
+        # pages are combined once at the end, instead of merging a growing response per page
+        responses = []
+        pages = self.iterate_pages(request, window_size, max_concurrency)
+        try:
+            async for response in pages:
+                responses.append(response)
+                if stopping_condition(response) if isinstance(stopping_condition, Callable) else False:
+                    break
+        finally:
+            await pages.aclose()
+        return Response.merge(responses)
+
+    async def iterate_data_frames(
+        self,
+        request: Request,
+        window_size: timedelta = None,
+        max_concurrency: int = 1,
+    ):
+        """
+        :meta private:
+        """
+        async for response in self.iterate_pages(request, window_size, max_concurrency):
+            if response.error:
+                raise ResponseError(response.error)
+            if response.result:
+                yield response.result.data
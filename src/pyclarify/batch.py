@@ -0,0 +1,204 @@
+# Copyright 2023-2024 Searis AS
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Batch module of PyClarify.
+
+JSON RPC 2.0 allows several calls to be sent as an array in one http request. While a Batch is open,
+the RPC methods of its client queue their requests and return a BatchResult instead of a Response.
+All queued requests, including every page of paginated requests, are sent in one POST when the batch
+is closed, and the responses are routed back to their calls by JSON RPC id.
+"""
+
+import asyncio
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+from pyclarify.views.generics import Request, Response
+
+
+# the open batch of the current thread or task
+current_batch: ContextVar[Optional["Batch"]] = ContextVar("current_batch", default=None)
+
+
+class BatchResult:
+    """
+    Placeholder for the Response of a call queued in a Batch, available once the batch is sent.
+    """
+
+    def __init__(self, request: Request, stopping_condition: Callable = None, window_size=None):
+        self.request = request
+        self.stopping_condition = stopping_condition
+        self.window_size = window_size
+        self.pages: List[Request] = []
+        self.response: Optional[Response] = None
+
+    def done(self) -> bool:
+        """
+        Whether the batch has been sent and the response is available.
+        """
+        return self.response is not None
+
+    def result(self) -> Response:
+        """
+        Returns the Response of the call, with all pages merged.
+
+        Raises
+        ------
+        RuntimeError
+            If the batch has not been sent yet.
+        """
+        if self.response is None:
+            raise RuntimeError("The batch has not been sent, close it before reading its results.")
+        return self.response
+
+    def resolve(self, responses: List[Response]):
+        """
+        :meta private:
+        """
+        # pages are combined like in Client.iterate_requests, up to the stopping condition
+        kept = []
+        for response in responses:
+            kept.append(response)
+            if self.stopping_condition(response) if isinstance(self.stopping_condition, Callable) else False:
+                break
+        self.response = Response.merge(kept)
+
+
+class Batch:
+    """
+    Collects the calls of a client and sends them in a single JSON RPC batch request. Created with `Client.batch()`.
+
+    Calls made from other threads or tasks than the one that opened the batch are sent as usual.
+    The batch is sent when the `with` block exits without an exception, or with `send()`.
+
+    Parameters
+    ----------
+    client : Client
+        The client sending the batch.
+
+    Example
+    -------
+        >>> client = Client("./clarify-credentials.json")
+        >>> with client.batch():
+        ...     items = client.select_items(limit=10)
+        ...     frames = [client.evaluate(items=[item], rollup="PT1H", gte="2024-01-01T00:00:00Z") for item in aggregations]
+        >>> items.result().result.data
+
+        Using the AsyncClient.
+
+        >>> async with client.batch():
+        ...     items = await client.select_items(limit=10)
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.calls: List[BatchResult] = []
+        self.sent = False
+        self.token = None
+
+    def __enter__(self):
+        if self.is_async():
+            raise TypeError("A batch of the AsyncClient is sent when it is awaited, use `async with client.batch()`.")
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        current_batch.reset(self.token)
+        if exc_type is None:
+            self.send()
+
+    async def __aenter__(self):
+        if not self.is_async():
+            raise TypeError("A batch of the Client is sent synchronously, use `with client.batch()`.")
+        return self.open()
+
+    def is_async(self) -> bool:
+        """
+        :meta private:
+        """
+        return asyncio.iscoroutinefunction(self.client.send_batch)
+
+    def open(self):
+        """
+        :meta private:
+        """
+        self.token = current_batch.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        current_batch.reset(self.token)
+        if exc_type is None:
+            await self.send()
+
+    def add(self, request: Request, stopping_condition: Callable = None, window_size=None) -> BatchResult:
+        """
+        Queues a request.
+
+        :meta private:
+        """
+        if self.sent:
+            raise RuntimeError("The batch has already been sent.")
+        call = BatchResult(request, stopping_condition, window_size)
+        self.calls.append(call)
+        return call
+
+    def plan(self) -> List[Request]:
+        """
+        Plans the pages of all queued calls, each with its own JSON RPC id.
+
+        :meta private:
+        """
+        requests = []
+        for call in self.calls:
+            call.pages = [
+                page.model_copy(update={"id": self.client.next_id()})
+                for page in self.client.plan_requests(call.request, call.window_size)
+            ]
+            requests.extend(call.pages)
+        return requests
+
+    def resolve(self, responses: List[Response]):
+        """
+        Hands the responses, in the order of the planned requests, to the queued calls.
+
+        :meta private:
+        """
+        offset = 0
+        for call in self.calls:
+            call.resolve(responses[offset:offset + len(call.pages)])
+            offset += len(call.pages)
+
+    def send(self):
+        """
+        Sends all queued calls in one request. With the AsyncClient, the result must be awaited.
+
+        Returns
+        -------
+        List[BatchResult]
+            The results of the queued calls, in the order they were made.
+        """
+        if self.sent:
+            raise RuntimeError("The batch has already been sent.")
+        self.sent = True
+        return self.client.send_batch(self)
+
+
+def active_batch(client) -> Optional[Batch]:
+    """
+    Returns the batch of the client opened in the current thread or task, if any.
+
+    :meta private:
+    """
+    batch = current_batch.get()
+    return batch if batch is not None and batch.client is client else None
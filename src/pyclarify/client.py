@@ -23,12 +23,17 @@ help of jsonrpcclient framework.
 import logging
 import pyclarify
 import requests
-import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pyclarify.__utils__.stopping_conditions import select_stopping_condition
 from datetime import timedelta, datetime
 from pydantic import validate_arguments
-from typing import Dict, List, Union, Callable, Optional
+from typing import Dict, Iterator, List, Union, Callable, Optional
 from pyclarify.jsonrpc.client import JSONRPCClient
+from pyclarify.jsonrpc.compression import ACCEPT_ENCODING
+from pyclarify.batch import Batch, BatchResult, active_batch
+from pyclarify.writer import BufferedWriter
 from pyclarify.views.dataframe import DataFrame, DataFrameParams
 from pyclarify.views.evaluate import Calculation, GroupAggregation, ItemAggregation
 from pyclarify.views.items import Item, ItemSaveView
@@ -45,6 +50,12 @@ from pyclarify.query import Filter, DataFilter
 from pyclarify.query.query import ResourceQuery, DataQuery
 from pyclarify.__utils__.pagination import SelectIterator
 from pyclarify.fields.error import Error
+from pyclarify.__utils__.exceptions import ResponseError
+
+
+# default limits of the parts a data frame is split into by Client.insert
+INSERT_MAX_POINTS = 200_000
+INSERT_MAX_BYTES = 10 * 2**20
 
 
 class Client(JSONRPCClient):
@@ -56,16 +67,94 @@ class Client(JSONRPCClient):
     clarify_credentials: path to json file
         Path to the Clarify credentials json file from the integrations page in clarify. See user guide for more information.
 
+    pool_connections: int, default 10
+        The number of host connection pools to keep alive.
+
+    pool_maxsize: int, default 10
+        The maximum number of connections kept alive per host.
+
+    pool_block: bool, default False
+        If True, requests wait for a free connection when the per host limit is reached.
+
+    serializer: JSONSerializer, default None
+        The serializer used to encode requests and decode responses, see `pyclarify.jsonrpc.serializer`.
+        Uses orjson when it is installed.
+
+    trust_responses: bool, default False
+        If True, data frames in responses from Clarify are not validated, and their timestamps are parsed in bulk.
+        Speeds up large selections, but malformed responses are not detected.
+
+    retry_policy: RetryPolicy, default None
+        Decides which failed requests are sent again, with exponential backoff and support for Retry-After headers.
+        Reading methods are retried on 429, 502, 503 and 504, writing methods only when rejected with 429.
+        If None, `pyclarify.jsonrpc.retry.RetryPolicy()` is used. Use `RetryPolicy(max_retries=0)` to disable retries.
+
+    throttle: Throttle, default None
+        Limits the rate of requests and the number of requests in flight, for all threads using the client
+        and every page of paginated requests. The limits can be changed at runtime with `client.throttle.set_rate`
+        and `client.throttle.set_max_in_flight`. If None, requests are not limited. See `pyclarify.jsonrpc.throttle`.
+
+    token_cache: FileTokenCache, default None
+        Stores access tokens on disk and shares them with other processes using the same credentials,
+        so that short-lived processes do not each request a new token. See `pyclarify.jsonrpc.token_cache`.
+
+    refresh_margin: float, default 60
+        Seconds before expiry at which the access token is refreshed, limited to half the lifetime of the token.
+
+    background_refresh: bool, default False
+        If True, the access token is refreshed in a background thread once it is within the refresh margin,
+        while requests keep using the current token. Otherwise the first request in the margin waits for the refresh.
+
+    compression: Compression, default None
+        Compresses request bodies above a size threshold with gzip or deflate, which cuts the bytes sent for inserts
+        several times over. Only use it with an API that accepts compressed requests. If None, requests are sent
+        uncompressed. Responses are always requested compressed. See `pyclarify.jsonrpc.compression`.
+
     Example
     -------
         >>> client = Client("./clarify-credentials.json")
+
+        Closing the pooled connections when done.
+
+        >>> with Client("./clarify-credentials.json") as client:
+        ...     client.select_items()
     """
 
-    def __init__(self, clarify_credentials):
-        super().__init__(None)
+    def __init__(
+        self,
+        clarify_credentials,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        serializer=None,
+        trust_responses: bool = False,
+        retry_policy=None,
+        throttle=None,
+        token_cache=None,
+        compression=None,
+        refresh_margin: float = 60.0,
+        background_refresh: bool = False,
+    ):
+        super().__init__(
+            None,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            serializer=serializer,
+            retry_policy=retry_policy,
+            throttle=throttle,
+            compression=compression,
+        )
+        self.trust_responses = trust_responses
         self.update_headers({"X-API-Version": pyclarify.__API_version__})
         self.update_headers({"User-Agent": f"PyClarify/{pyclarify.__version__}"})
-        self.authenticate(clarify_credentials)
+        self.update_headers({"Accept-Encoding": ACCEPT_ENCODING})
+        self.authenticate(
+            clarify_credentials,
+            token_cache=token_cache,
+            refresh_margin=refresh_margin,
+            background_refresh=background_refresh,
+        )
         self.base_url = f"{self.authentication.api_url}rpc"
     
     def __post_init__(self):
@@ -84,47 +173,279 @@ class Client(JSONRPCClient):
                 "data": response.text,
             }
             return Response(id=request.id, error=Error(**err))
-        response = response.json()
-        if hasattr(response, "error"):
-            return Response(id=request.id, error=response["error"])
-        response["method"] = request.method
-        return Response(**response)
+        return self.decode_response(request, response.content)
 
-    def iterate_requests(
-        self,
-        request: Request,
-        stopping_condition: Callable = None,
-        window_size: timedelta = None,
-    ):
+    def decode_response(self, request: Request, content: bytes) -> Response:
+        """
+        :meta private:
         """
+        # decode the bytes straight into the result type of the method
+        context = {"method": request.method, "trusted": self.trust_responses}
+        return self.serializer.load_model(Response, content, context=context)
+
+    def handle_batch_response(self, requests: List[Request], response) -> List[Response]:
+        """
+        :meta private:
+        """
+        if not response.ok:
+            return [self.handle_response(request, response) for request in requests]
+        return self.decode_batch_response(requests, response.content)
+
+    def decode_batch_response(self, requests: List[Request], content: bytes) -> List[Response]:
+        """
+        Decodes the responses of a batch request and orders them like the requests, matching them by id.
+
         :meta private:
         """
+        decoded = self.serializer.loads(content)
+        if isinstance(decoded, dict):
+            # the server rejected the batch as a whole
+            decoded = [{**decoded, "id": request.id} for request in requests]
+        by_id = {str(item.get("id")): item for item in decoded}
+        responses = []
+        for request in requests:
+            item = by_id.get(str(request.id))
+            if item is None:
+                error = Error(code=-32603, message=f"No response for request {request.id} in batch")
+                responses.append(Response(id=request.id, error=error))
+                continue
+            context = {"method": request.method, "trusted": self.trust_responses}
+            responses.append(Response.model_validate(item, context=context))
+        return responses
+
+    def create_batch_payload(self, requests: List[Request]) -> bytes:
+        """
+        :meta private:
+        """
+        return b"[" + b",".join(self.serializer.dump_model(request) for request in requests) + b"]"
+
+    def batch_method(self, requests: List[Request]):
+        """
+        Returns the method deciding if a batch can be retried: a writing method if the batch contains one.
+
+        :meta private:
+        """
+        for request in requests:
+            if not self.retry_policy.is_idempotent(request.method):
+                return request.method
+        return requests[0].method
+
+    def batch(self) -> Batch:
+        """
+        Opens a batch. While the batch is open, calls to select_items, select_signals, data_frame and evaluate
+        (and the other RPC methods) made from the same thread are queued, and return a BatchResult instead of a Response.
+        All queued calls are sent in a single http request when the batch is closed.
+        With the AsyncClient, use ``async with client.batch()``.
+
+        Returns
+        -------
+        Batch
+            Context manager collecting the calls.
+
+        Examples
+        --------
+            >>> client = Client("./clarify-credentials.json")
+
+            Refreshing a dashboard in one round trip.
+
+            >>> with client.batch():
+            ...     results = [
+            ...         client.evaluate(items=[item], rollup="PT1H", gte="2024-01-01T00:00:00Z", lt="2024-01-02T00:00:00Z")
+            ...         for item in items
+            ...     ]
+            >>> frames = [result.result().result.data for result in results]
+        """
+        return Batch(self)
+
+    def writer(self, **kwargs) -> BufferedWriter:
+        """
+        Creates a BufferedWriter, which collects data points from any number of threads and inserts them
+        in the background, instead of sending one request per point. Requires `numpy` to be installed.
+
+        Parameters
+        ----------
+        **kwargs
+            Options of the writer: max_points, max_delay, max_pending, max_concurrency, on_error, spool and retry_interval.
+            See `pyclarify.writer.BufferedWriter`.
+
+        Returns
+        -------
+        BufferedWriter
+            The writer. Close it, or use it as a context manager, to write the remaining points.
+
+        Examples
+        --------
+            >>> client = Client("./clarify-credentials.json")
+            >>> with client.writer(max_points=5000, max_delay=2) as writer:
+            ...     for sample in collector:
+            ...         writer.write(sample.input_id, sample.time, sample.value)
+        """
+        return BufferedWriter(self, **kwargs)
+
+    def send_batch(self, batch: Batch) -> List[BatchResult]:
+        """
+        :meta private:
+        """
+        requests = batch.plan()
+        if requests:
+            headers = self.request_headers(self.authentication.get_token())
+            batch.resolve(self.send_requests(requests, headers))
+        return batch.calls
+
+    def send_requests(self, requests: List[Request], headers: dict = None) -> List[Response]:
+        """
+        Sends several requests in one JSON RPC batch request.
+
+        :meta private:
+        """
+        event = self.instrumentation.start_request("batch")
+        try:
+            with event.measure("serialize_time"):
+                payload = self.create_batch_payload(requests)
+                event.request_bytes = len(payload)
+                payload, headers = self.compress(payload, headers)
+            event.sent_bytes = len(payload)
+            with event.measure("network_time"):
+                rpc_response = self.make_request(payload, self.batch_method(requests), headers)
+            event.status_code = rpc_response.status_code
+            event.response_bytes = len(rpc_response.content or b"")
+            event.received_bytes = self.received_bytes(rpc_response)
+            with event.measure("validation_time"):
+                responses = self.handle_batch_response(requests, rpc_response)
+            event.error = [response.error for response in responses if response.error] or None
+            return responses
+        except Exception as e:
+            event.exception = e
+            raise
+        finally:
+            self.instrumentation.end_request(event)
+
+    def plan_requests(self, request: Union[Request, List[Request]], window_size: timedelta = None):
+        """
+        :meta private:
+        """
+        if isinstance(request, list):
+            # already split into parts by the caller
+            return request
         if request.method in [
             ApiMethod.data_frame,
             ApiMethod.select_items,
             ApiMethod.select_signals,
             ApiMethod.evaluate,
         ]:
-            iterator = SelectIterator(request, window_size)
-        else:
-            iterator = [request]
-        responses = None
-        counter = 0
-        for request in iterator:
-            counter += 1
-            r = json.dumps(request.model_dump(mode='json')) # TODO: Pydantic V2 does not do this in an elegant way
-            rpc_response = self.make_request(r)
-            response = self.handle_response(request, rpc_response)
-            if responses is None:
-                responses = response
-            else:
-                responses += response
+            return SelectIterator(request, window_size)
+        return [request]
+
+    def send_request(self, request: Request, page: int = None, headers: dict = None) -> Response:
+        """
+        :meta private:
+        """
+        # every request gets its own id, and the request of the caller is not modified
+        request = request.model_copy(update={"id": self.next_id()})
+        event = self.instrumentation.start_request(request.method, request.id, page)
+        try:
+            with event.measure("serialize_time"):
+                payload = self.serializer.dump_model(request)
+                event.request_bytes = len(payload)
+                payload, headers = self.compress(payload, headers)
+            event.sent_bytes = len(payload)
+            with event.measure("network_time"):
+                rpc_response = self.make_request(payload, request.method, headers)
+            event.status_code = rpc_response.status_code
+            event.response_bytes = len(rpc_response.content or b"")
+            event.received_bytes = self.received_bytes(rpc_response)
+            with event.measure("validation_time"):
+                response = self.handle_response(request, rpc_response)
+            event.error = response.error
+            return response
+        except Exception as e:
+            event.exception = e
+            raise
+        finally:
+            self.instrumentation.end_request(event)
+
+    def iterate_pages(
+        self,
+        request: Request,
+        window_size: timedelta = None,
+        max_concurrency: int = 1,
+    ):
+        """
+        :meta private:
+        """
+        iterator = enumerate(self.plan_requests(request, window_size))
+        if max_concurrency <= 1:
+            for index, page in iterator:
+                yield self.send_page(page, index)
+            return
+
+        # keep at most max_concurrency pages in flight, and yield them in planned order
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            in_flight = deque(
+                executor.submit(self.send_page, page, index)
+                for index, page in islice(iterator, max_concurrency)
+            )
+            while in_flight:
+                response = in_flight.popleft().result()
+                for index, page in islice(iterator, 1):
+                    in_flight.append(executor.submit(self.send_page, page, index))
+                yield response
+
+    def send_page(self, page: Request, index: int) -> Response:
+        """
+        Sends a page with the current token. Pages of a slowly consumed iterator are sent long
+        after the first one, so the token is read for every page.
+
+        :meta private:
+        """
+        # the token is passed with each request, the shared headers of the client are not modified
+        return self.send_request(page, index, self.request_headers(self.authentication.get_token()))
+
+    def iterate_requests(
+        self,
+        request: Request,
+        stopping_condition: Callable = None,
+        window_size: timedelta = None,
+        max_concurrency: int = 1,
+    ):
+        """
+        :meta private:
+        """
+        batch = active_batch(self)
+        if batch is not None:
+            return batch.add(request, stopping_condition, window_size)
+
+        # pages are combined once at the end, instead of merging a growing response per page
+        responses = []
+        for response in self.iterate_pages(request, window_size, max_concurrency):
+            responses.append(response)
             if stopping_condition(response) if isinstance(stopping_condition, Callable) else False:
-                return responses
-        return responses
+                break
+        return Response.merge(responses)
+
+    def iterate_data_frames(
+        self,
+        request: Request,
+        window_size: timedelta = None,
+        max_concurrency: int = 1,
+    ):
+        """
+        :meta private:
+        """
+        for response in self.iterate_pages(request, window_size, max_concurrency):
+            if response.error:
+                raise ResponseError(response.error)
+            if response.result:
+                yield response.result.data
 
     @validate_arguments
-    def insert(self, data) -> Response:
+    def insert(
+        self,
+        data,
+        max_points: Optional[int] = INSERT_MAX_POINTS,
+        max_bytes: Optional[int] = INSERT_MAX_BYTES,
+        max_concurrency: int = 1,
+    ) -> Response:
         """
         This call inserts data to one or multiple signals. The signal is given an input id by the user. The signal is uniquely identified by its input ID in combination with
         the integration ID. If no signal with the given combination exists, an empty signal is created. With the creation of the signal, a unique signal id gets assigned to it.
@@ -135,10 +456,21 @@ class Client(JSONRPCClient):
         data : DataFrame, pd.DataFrame, dict
             The data containing the values of a signal in a key-value pair, and separate time axis.
 
+        max_points : int, default 200 000
+            The maximum number of values sent in one request. Larger data frames are split by time,
+            and by series if needed, and sent in several requests. Use None to send the data frame in one request.
+
+        max_bytes : int, default 10 MiB
+            The maximum estimated size of the data sent in one request. Use None for no limit.
+
+        max_concurrency : int, default 1
+            The maximum number of parts sent at the same time.
+
         Returns
         -------
         Response
             `Response.result.data` is a dictionary mapping INPUT_ID to SIGNAL_ID.
+            When the data frame is split, the results of all parts are merged, and the errors of failed parts are collected.
 
         See Also
         --------
@@ -206,15 +538,19 @@ class Client(JSONRPCClient):
             if isinstance(data, dict):
                 data = DataFrame.from_dict(data)
 
-        request_data = Request(
-            method=ApiMethod.insert,
-            params={"integration": self.authentication.integration_id, "data": data},
-        )
+        if isinstance(data, DataFrame) and (max_points is not None or max_bytes is not None):
+            parts = data.split(max_points, max_bytes)
+        else:
+            parts = [data]
+        request_data = [
+            Request(
+                method=ApiMethod.insert,
+                params={"integration": self.authentication.integration_id, "data": part},
+            )
+            for part in parts
+        ]
 
-        self.update_headers(
-            {"Authorization": f"Bearer {self.authentication.get_token()}"}
-        )
-        return self.iterate_requests(request_data)
+        return self.iterate_requests(request_data, max_concurrency=max_concurrency)
 
     @validate_arguments
     def select_items(
@@ -225,6 +561,7 @@ class Client(JSONRPCClient):
         limit: Optional[int] = 10,
         sort: List[str] = [],
         total: Optional[bool] = False,
+        max_concurrency: int = 1,
     ) -> Response:
         """
         Return item metadata from selected items.
@@ -250,6 +587,9 @@ class Client(JSONRPCClient):
         total: bool, default False
             When true, force the inclusion of a total count in the response. A total count is the total number of resources that matches filter.
 
+        max_concurrency: int, default 1
+            The maximum number of pages fetched in parallel. Pages are merged in order, independent of arrival.
+            Make sure the ``pool_maxsize`` of the client is at least as large to reuse connections.
 
 
         Returns
@@ -367,12 +707,11 @@ class Client(JSONRPCClient):
         params = {"query": query, "include": include}
 
         request_data = Request(
-            id=self.current_id, method=ApiMethod.select_items, params=params
+            method=ApiMethod.select_items, params=params
         )
-        self.update_headers(
-            {"Authorization": f"Bearer {self.authentication.get_token()}"}
+        return self.iterate_requests(
+            request_data, select_stopping_condition, max_concurrency=max_concurrency
         )
-        return self.iterate_requests(request_data, select_stopping_condition)
 
     @validate_arguments
     def save_signals(
@@ -488,9 +827,6 @@ class Client(JSONRPCClient):
 
         request_data = Request(method=ApiMethod.save_signals, params=params)
 
-        self.update_headers(
-            {"Authorization": f"Bearer {self.authentication.get_token()}"}
-        )
         return self.iterate_requests(request_data)
 
     @validate_arguments
@@ -609,9 +945,6 @@ class Client(JSONRPCClient):
 
         request_data = Request(method=ApiMethod.publish_signals, params=params)
 
-        self.update_headers(
-            {"Authorization": f"Bearer {self.authentication.get_token()}"}
-        )
         return self.iterate_requests(request_data)
 
     @validate_arguments
@@ -624,6 +957,7 @@ class Client(JSONRPCClient):
         total: Optional[bool] = False,
         include: Optional[List] = [],
         integration: str = None,
+        max_concurrency: int = 1,
     ) -> Response:
         """
         Return signal metadata from selected signals and/or item.
@@ -651,6 +985,10 @@ class Client(JSONRPCClient):
         integration: str Default None
             Integration ID in string format. None means using the integration in credential file.
 
+        max_concurrency: int, default 1
+            The maximum number of pages fetched in parallel. Pages are merged in order, independent of arrival.
+            Make sure the ``pool_maxsize`` of the client is at least as large to reuse connections.
+
         Returns
         -------
         Response
@@ -804,10 +1142,9 @@ class Client(JSONRPCClient):
 
         request_data = Request(method=ApiMethod.select_signals, params=params)
 
-        self.update_headers(
-            {"Authorization": f"Bearer {self.authentication.get_token()}"}
+        return self.iterate_requests(
+            request_data, select_stopping_condition, max_concurrency=max_concurrency
         )
-        return self.iterate_requests(request_data, select_stopping_condition)
 
     @validate_arguments
     def data_frame(
@@ -826,6 +1163,7 @@ class Client(JSONRPCClient):
         last: int = -1,
         include: List[str] = [],
         window_size: Union[str, timedelta] = None,
+        max_concurrency: int = 1,
     ) -> Response:
         """
         Retrieve DataFrame for items stored in Clarify.
@@ -857,6 +1195,9 @@ class Client(JSONRPCClient):
         window_size: `RFC3339 duration <https://docs.clarify.io/api/1.1/types/fields#fixed-duration>`__, default None
             If duration is specified, the iterator will use the specified window as a paging size instead of default API limits. This is commonly used when resolution of data is too high to be packaged with default
             values.
+        max_concurrency: int, default 1
+            The maximum number of pages fetched in parallel. Pages are merged in order, independent of arrival.
+            Make sure the ``pool_maxsize`` of the client is at least as large to reuse connections.
 
         Returns
         -------
@@ -1006,6 +1347,73 @@ class Client(JSONRPCClient):
 
         """
 
+        request_data = self.create_data_frame_request(
+            filter, sort, limit, skip, total, gte, lt, rollup, timeZone, firstDayOfWeek, origin, last, include
+        )
+
+        return self.iterate_requests(
+            request_data, lambda x: False, window_size, max_concurrency
+        )
+
+    @validate_arguments
+    def iter_data_frame(
+        self,
+        filter={},
+        sort: List[str] = [],
+        limit: int = 20,
+        skip: int = 0,
+        total: bool = False,
+        gte: Union[datetime, str] = None,
+        lt: Union[datetime, str] = None,
+        rollup: Union[str, timedelta] = None,
+        timeZone: Optional[TimeZone] = "UTC",
+        firstDayOfWeek: Optional[IntWeekDays] = 1,
+        origin: Optional[Union[str, datetime]] = None,
+        last: int = -1,
+        include: List[str] = [],
+        window_size: Union[str, timedelta] = None,
+        max_concurrency: int = 1,
+    ) -> Iterator[DataFrame]:
+        """
+        Retrieve DataFrames for items stored in Clarify, one page at a time.
+        Takes the same arguments as ``Client.data_frame``, but yields the DataFrame of every page as soon as it arrives,
+        instead of merging all pages into one Response. Pages are yielded in order of item segments and then time windows.
+
+        Returns
+        -------
+        Iterator[DataFrame]
+            The DataFrame of each page.
+
+        Raises
+        ------
+        ResponseError
+            If the API returns an error for a page.
+
+        See Also
+        --------
+        Client.data_frame : Retrieve all pages merged into one Response.
+
+        Examples
+        --------
+            >>> client = Client("./clarify-credentials.json")
+
+            Exporting two years of data to disk, one window at the time.
+
+            >>> for i, df in enumerate(client.iter_data_frame(gte="2021-01-01T00:00:00Z", lt="2023-01-01T00:00:00Z")):
+            ...     df.to_pandas().to_csv(f"export-{i}.csv")
+        """
+        request_data = self.create_data_frame_request(
+            filter, sort, limit, skip, total, gte, lt, rollup, timeZone, firstDayOfWeek, origin, last, include
+        )
+
+        return self.iterate_data_frames(request_data, window_size, max_concurrency)
+
+    def create_data_frame_request(
+        self, filter, sort, limit, skip, total, gte, lt, rollup, timeZone, firstDayOfWeek, origin, last, include
+    ) -> Request:
+        """
+        :meta private:
+        """
         query = ResourceQuery(
             filter=filter.to_query() if isinstance(filter, Filter) else filter,
             sort=sort,
@@ -1014,7 +1422,6 @@ class Client(JSONRPCClient):
             total=total,
         )
         data_filter = DataFilter(gte=gte, lt=lt)
-        data_query = DataQuery(filter=data_filter.to_query(), last=last, rollup=rollup)
         data_query = DataQuery(
             filter=data_filter.to_query(),
             rollup=rollup,
@@ -1025,13 +1432,7 @@ class Client(JSONRPCClient):
         )
         params = {"query": query, "data": data_query, "include": include}
 
-        request_data = Request(method=ApiMethod.data_frame, params=params)
-
-        self.update_headers(
-            {"Authorization": f"Bearer {self.authentication.get_token()}"}
-        )
-
-        return self.iterate_requests(request_data, lambda x: False, window_size)
+        return Request(method=ApiMethod.data_frame, params=params)
 
     @validate_arguments
     def evaluate(
@@ -1048,6 +1449,7 @@ class Client(JSONRPCClient):
         last: int = -1,
         include: List[str] = [],
         window_size: Union[str, timedelta] = None,
+        max_concurrency: int = 1,
     ) -> Response:
         """
         Retrieve DataFrame by aggregating time-series data and perform evaluate formula expressions.
@@ -1075,6 +1477,9 @@ class Client(JSONRPCClient):
         window_size: `RFC3339 duration <https://docs.clarify.io/api/1.1/types/fields#fixed-duration>`__, default None
             If duration is specified, the iterator will use the specified window as a paging size instead of default API limits. This is commonly used when resolution of data is too high to be packaged with default
             values.
+        max_concurrency: int, default 1
+            The maximum number of pages fetched in parallel. Pages are merged in order, independent of arrival.
+            Make sure the ``pool_maxsize`` of the client is at least as large to reuse connections.
 
         Returns
         -------
@@ -1201,6 +1606,69 @@ class Client(JSONRPCClient):
         ... 2023-10-20 10:40:00+00:00  8.0  4.0   66.0
         """
 
+        request_data = self.create_evaluate_request(
+            rollup, timeZone, firstDayOfWeek, origin, items, calculations, series, gte, lt, last, include
+        )
+
+        return self.iterate_requests(
+            request_data, lambda x: False, window_size, max_concurrency
+        )
+
+    @validate_arguments
+    def iter_evaluate(
+        self,
+        rollup: Union[str, timedelta],
+        timeZone: Optional[TimeZone] = None,
+        firstDayOfWeek: Optional[IntWeekDays] = None,
+        origin: Optional[Union[str, datetime]] = None,
+        items: List[Union[Dict, ItemAggregation]] = [],
+        calculations: List[Union[Dict, Calculation]] = [],
+        series: List[str] = [],
+        gte: Union[datetime, str] = None,
+        lt: Union[datetime, str] = None,
+        last: int = -1,
+        include: List[str] = [],
+        window_size: Union[str, timedelta] = None,
+        max_concurrency: int = 1,
+    ) -> Iterator[DataFrame]:
+        """
+        Retrieve evaluated DataFrames, one page at a time.
+        Takes the same arguments as ``Client.evaluate``, but yields the DataFrame of every page as soon as it arrives,
+        instead of merging all pages into one Response.
+
+        Returns
+        -------
+        Iterator[DataFrame]
+            The DataFrame of each page.
+
+        Raises
+        ------
+        ResponseError
+            If the API returns an error for a page.
+
+        See Also
+        --------
+        Client.evaluate : Retrieve all pages merged into one Response.
+
+        Examples
+        --------
+            >>> client = Client("./clarify-credentials.json")
+            >>> item = ItemAggregation(id="cbpmaq6rpn52969vfl00", aggregation="max", alias="i1")
+            >>> for df in client.iter_evaluate(items=[item], rollup="PT1M", gte="2022-01-01T00:00:00Z", lt="2023-01-01T00:00:00Z"):
+            ...     aggregator.update(df.to_pandas())
+        """
+        request_data = self.create_evaluate_request(
+            rollup, timeZone, firstDayOfWeek, origin, items, calculations, series, gte, lt, last, include
+        )
+
+        return self.iterate_data_frames(request_data, window_size, max_concurrency)
+
+    def create_evaluate_request(
+        self, rollup, timeZone, firstDayOfWeek, origin, items, calculations, series, gte, lt, last, include
+    ) -> Request:
+        """
+        :meta private:
+        """
         data_filter = DataFilter(gte=gte, lt=lt, series=series)
         data_query = DataQuery(
             filter=data_filter.to_query(),
@@ -1216,9 +1684,4 @@ class Client(JSONRPCClient):
             "data": data_query,
             "include": include,
         }
-        request_data = Request(method=ApiMethod.evaluate, params=params)
-        self.update_headers(
-            {"Authorization": f"Bearer {self.authentication.get_token()}"}
-        )
-
-        return self.iterate_requests(request_data, lambda x: False, window_size)
+        return Request(method=ApiMethod.evaluate, params=params)
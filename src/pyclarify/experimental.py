@@ -103,8 +103,19 @@ class ExperimentalResponse(Response):
 
 
 class ExperimentalClient(Client):
-    def __init__(self, clarify_credentials):
-        super().__init__(clarify_credentials)
+    def __init__(
+        self,
+        clarify_credentials,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+    ):
+        super().__init__(
+            clarify_credentials,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
         self.update_headers({"X-API-Version": "1.2alpha1"})
         self.update_headers({"User-Agent": f"PyClarify/{pyclarify.__version__}/experimental"})
         self.authenticate(clarify_credentials)
@@ -163,9 +174,6 @@ class ExperimentalClient(Client):
 
         request_data = ExperimentalRequest(method="admin.connectSignals", params=params)
 
-        self.update_headers(
-            {"Authorization": f"Bearer {self.authentication.get_token()}"}
-        )
         return self.iterate_requests(request_data, lambda x: False)
 
 
@@ -201,9 +209,6 @@ class ExperimentalClient(Client):
 
             request_data = ExperimentalRequest(method="admin.disconnectSignals", params=params)
 
-            self.update_headers(
-                {"Authorization": f"Bearer {self.authentication.get_token()}"}
-            )
             return self.iterate_requests(request_data, lambda x: False)
 
     @validate_arguments
@@ -223,6 +228,7 @@ class ExperimentalClient(Client):
         last: int = -1,
         include: List[str] = [],
         window_size: Union[str, timedelta] = None,
+        max_concurrency: int = 1,
     ) -> Response:
         
         data_filter = DataFilter(gte=gte, lt=lt, series=series)
@@ -248,8 +254,7 @@ class ExperimentalClient(Client):
         
         
         request_data = ExperimentalRequest(method=ApiMethod.evaluate, params=params)
-        self.update_headers(
-            {"Authorization": f"Bearer {self.authentication.get_token()}"}
-        )
 
-        return self.iterate_requests(request_data, lambda x: False, window_size)
+        return self.iterate_requests(
+            request_data, lambda x: False, window_size, max_concurrency
+        )
@@ -24,7 +24,71 @@ import requests
 import json
 import logging
 import functools
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
 from .oauth2 import Authenticator
+from .serializer import default_serializer
+from .instrumentation import Instrumentation, RetryEvent, ThrottleEvent
+from .retry import RetryPolicy
+from .throttle import Throttle
+
+
+logger = logging.getLogger(__name__)
+
+# the number of characters of request and response bodies included in debug logs
+LOG_PREVIEW_LENGTH = 500
+
+
+def payload_preview(payload, length: int = LOG_PREVIEW_LENGTH, encoding: str = None) -> str:
+    """
+    Returns the start of a request or response body for debug logs, without decoding or copying all of it.
+
+    Parameters
+    ----------
+    payload : str or bytes
+        The body to preview.
+    length : int, default 500
+        The maximum number of characters to include.
+    encoding : str, default None
+        The content encoding of a compressed body, which is not previewed.
+
+    Returns
+    -------
+    str
+        The body, truncated to length, with the total size when truncated.
+    """
+    if payload is None:
+        return ""
+    if encoding is not None:
+        return f"({len(payload)} bytes, {encoding})"
+    is_bytes = isinstance(payload, (bytes, bytearray))
+    preview = payload[:length]
+    if is_bytes:
+        preview = preview.decode(errors="replace")
+    if len(payload) > length:
+        unit = "bytes" if is_bytes else "characters"
+        preview = f"{preview}... ({len(payload)} {unit})"
+    return preview
+
+
+def request_sent(exception) -> bool:
+    """
+    Whether a request that failed with the exception may have reached the server.
+    Requests are not sent when no connection could be made: the connection was refused,
+    the host could not be resolved or reached, or connecting timed out.
+
+    :meta private:
+    """
+    if isinstance(exception, requests.exceptions.ConnectTimeout):
+        return False
+    if isinstance(exception, requests.exceptions.ConnectionError) and exception.args:
+        # urllib3 wraps the cause in a MaxRetryError
+        reason = getattr(exception.args[0], "reason", exception.args[0])
+        # NewConnectionError and NameResolutionError are ConnectTimeoutErrors
+        return not isinstance(reason, ConnectTimeoutError)
+    return True
 
 
 def increment_id(func):
@@ -44,7 +108,7 @@ def increment_id(func):
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        args[0].current_id += 1
+        args[0].next_id()
         return func(*args, **kwargs)
 
     return wrapper
@@ -52,15 +116,120 @@ def increment_id(func):
 
 class JSONRPCClient:
     def __init__(
-        self, base_url,
+        self,
+        base_url,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        serializer=None,
+        retry_policy=None,
+        throttle=None,
+        compression=None,
     ):
+        """
+        Initialiser of the JSONRPC client.
+
+        Parameters
+        ----------
+        base_url : str
+            The url of the JSONRPC endpoint.
+        pool_connections : int, default 10
+            The number of host connection pools to keep alive.
+        pool_maxsize : int, default 10
+            The maximum number of connections kept alive per host.
+        pool_block : bool, default False
+            If True, requests wait for a free connection when the per host limit is reached,
+            instead of opening (and discarding) an extra connection.
+        serializer : JSONSerializer, default None
+            The serializer used to encode requests and decode responses.
+            Defaults to the fastest serializer available, see serializer.py.
+        retry_policy : RetryPolicy, default None
+            Decides which failed requests are sent again, see retry.py. If None, RetryPolicy() is used.
+        throttle : Throttle, default None
+            Limits the rate and concurrency of requests, see throttle.py. If None, requests are not limited.
+        compression : Compression, default None
+            Compresses large request bodies, see compression.py. If None, requests are sent uncompressed.
+        """
         self.base_url = base_url
         self.headers = {"content-type": "application/json"}
         self.current_id = 0
+        self.id_lock = threading.Lock()
         self.authentication = None
         self.params_list = []
+        self.session = self.create_session(pool_connections, pool_maxsize, pool_block)
+        self.serializer = serializer or default_serializer()
+        self.instrumentation = Instrumentation()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.throttle = throttle if throttle is not None else Throttle()
+        self.compression = compression
+
+    def __enter__(self):
+        return self
 
-    def authenticate(self, clarify_credentials):
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def create_session(pool_connections=10, pool_maxsize=10, pool_block=False):
+        """
+        Creates a session with keep-alive connection pools for http and https.
+
+        Parameters
+        ----------
+        pool_connections : int, default 10
+            The number of host connection pools to keep alive.
+        pool_maxsize : int, default 10
+            The maximum number of connections kept alive per host.
+        pool_block : bool, default False
+            Whether to wait for a free connection when the per host limit is reached.
+
+        Returns
+        -------
+        requests.Session
+            Session reusing TCP/TLS connections between requests.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        """
+        Closes all pooled connections of the client.
+        """
+        self.session.close()
+
+    def add_listener(self, listener):
+        """
+        Adds an instrumentation listener, receiving an event when each request starts and ends
+        and when the access token is refreshed. See instrumentation.py.
+
+        Parameters
+        ----------
+        listener : Listener
+            The listener, for example a MetricsCollector.
+        """
+        self.instrumentation.add_listener(listener)
+
+    def remove_listener(self, listener):
+        """
+        Removes an instrumentation listener added with add_listener.
+
+        Parameters
+        ----------
+        listener : Listener
+            The listener to remove.
+        """
+        self.instrumentation.remove_listener(listener)
+
+    def authenticate(
+        self, clarify_credentials, token_cache=None, refresh_margin=60.0, background_refresh=False
+    ):
         """
         Authenticates the client by using the Authenticator class (see oauth2.py).
 
@@ -69,41 +238,190 @@ class JSONRPCClient:
         clarify_credentials : str/dict
             The path to the clarify_credentials.json downloaded from the Clarify app,
             or json/dictionary of the content in clarify_credentials.json.
+        token_cache : FileTokenCache, default None
+            Shares access tokens with other processes using the same credentials.
+        refresh_margin : float, default 60
+            Seconds before expiry at which the access token is refreshed.
+        background_refresh : bool, default False
+            Whether to refresh the access token in a background thread while the current one is still valid.
 
         Returns
         -------
         None
         """
-        self.authentication = Authenticator(clarify_credentials)
-        
+        self.authentication = Authenticator(
+            clarify_credentials,
+            session=self.session,
+            instrumentation=self.instrumentation,
+            token_cache=token_cache,
+            refresh_margin=refresh_margin,
+            background_refresh=background_refresh,
+        )
 
-    def make_request(self, payload:dict):
+    def make_request(self, payload, method=None, headers=None):
         """
         Uses post request to send JSON RPC payload.
+        Failed requests are sent again as decided by the retry policy of the client.
 
         Parameters
         ----------
         payload : JSON RPC dictionary
             A dictionary in the form of a JSONRPC request.
+        method : ApiMethod, default None
+            The RPC method of the payload, used to decide if the request can be retried.
+            If None, the request is treated as a writing method.
+        headers : dict, default None
+            The headers of this request, see request_headers. If None, the headers of the client are used.
 
         Returns
         -------
-        JSON
-            JSON dictionary response.
+        requests.Response
+            The http response.
 
         """
-        logging.debug(f"{self.current_id}--> {self.base_url}, req: {payload}")
-        res = requests.post(
-            self.base_url, data=payload, headers=self.headers
-        )
-        if res.ok and res.status_code != 204:
+        self.retry_policy.record_request()
+        attempt = 0
+        while True:
+            self.report_throttle(method, self.throttle.acquire())
             try:
-                logging.debug(f"{self.current_id}<-- {self.base_url} ({res.status_code})  res:{res.json()}")
-            except Exception as e:
-                logging.debug(f"{self.current_id}<-- {self.base_url} ({res.status_code}) - Could not decode json payload.")
+                res = self.post(payload, headers)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                delay = self.retry_delay(method, attempt, exception=e, sent=request_sent(e))
+                if delay is None:
+                    raise
+            else:
+                if res.ok:
+                    return res
+                delay = self.retry_delay(
+                    method, attempt, res.status_code, res.headers.get("Retry-After")
+                )
+                if delay is None:
+                    return res
+            finally:
+                self.throttle.release()
+            time.sleep(delay)
+            attempt += 1
+
+    def report_throttle(self, method, delay):
+        """
+        :meta private:
+        """
+        if delay > 0:
+            self.instrumentation.request_throttled(
+                ThrottleEvent(method, delay, self.throttle.in_flight)
+            )
+
+    def retry_delay(
+        self, method, attempt, status_code=None, retry_after=None, exception=None, sent=True
+    ):
+        """
+        Returns the number of seconds to wait before sending a failed request again, or None to give up.
+
+        :meta private:
+        """
+        delay = self.retry_policy.backoff(attempt, retry_after)
+        if delay is None or not self.retry_policy.should_retry(method, attempt, status_code, sent):
+            return None
+        self.instrumentation.request_retry(
+            RetryEvent(method, attempt + 1, delay, status_code, exception)
+        )
+        logger.debug(
+            "retrying %s in %.2fs (attempt %s, status %s, %r)",
+            getattr(method, "value", method), delay, attempt + 1, status_code, exception,
+        )
+        return delay
+
+    def post(self, payload, headers=None):
+        """
+        Sends a single post request with the payload.
+
+        :meta private:
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        headers = headers if headers is not None else self.headers
+        if debug:
+            logger.debug(
+                "--> %s, req: %s",
+                self.base_url, payload_preview(payload, encoding=headers.get("Content-Encoding")),
+            )
+        res = self.session.post(self.base_url, data=payload, headers=headers)
+        if debug:
+            logger.debug(
+                "<-- %s (%s) res: %s", self.base_url, res.status_code, payload_preview(res.content)
+            )
         return res
 
-    @increment_id
+    def compress(self, payload, headers=None):
+        """
+        Compresses the payload when the client has a compression and the payload is over its threshold.
+
+        Parameters
+        ----------
+        payload : str or bytes
+            The serialized request.
+        headers : dict, default None
+            The headers of the request. If None, the headers of the client are used.
+
+        Returns
+        -------
+        (bytes, dict)
+            The body to send and its headers, with the Content-Encoding header when compressed.
+        """
+        if self.compression is None or len(payload) < self.compression.threshold:
+            return payload, headers
+        if isinstance(payload, str):
+            payload = payload.encode()
+        headers = dict(headers if headers is not None else self.headers)
+        headers["Content-Encoding"] = self.compression.encoding
+        return self.compression.compress(payload), headers
+
+    @staticmethod
+    def received_bytes(response) -> int:
+        """
+        Returns the number of bytes of the response body read from the network, before decompression.
+
+        :meta private:
+        """
+        try:
+            received = response.raw.tell()
+        except Exception:
+            received = None
+        return received if isinstance(received, int) else len(response.content or b"")
+
+    def next_id(self) -> int:
+        """
+        Increments the JSON RPC id of the client and returns it. Safe to call from several threads.
+
+        Returns
+        -------
+        int
+            The id of the next request.
+        """
+        with self.id_lock:
+            self.current_id += 1
+            return self.current_id
+
+    def request_headers(self, token=None) -> dict:
+        """
+        Returns the headers of a single request: the headers of the client, and the Authorization header
+        if a token is given. The headers of the client are not modified, so that concurrent calls
+        can use different tokens.
+
+        Parameters
+        ----------
+        token : str, default None
+            The access token of the request.
+
+        Returns
+        -------
+        dict
+            The headers of the request.
+        """
+        headers = dict(self.headers)
+        if token is not None:
+            headers["Authorization"] = f"Bearer {token}"
+        return headers
+
     def create_payload(self, method, params):
         """
         Creates a JSONRPC request payload.
@@ -121,7 +439,7 @@ class JSONRPCClient:
         payload = {
             "jsonrpc": "2.0",
             "method": method,
-            "id": self.current_id,
+            "id": self.next_id(),
             "params": params,
         }
         return json.dumps(payload)
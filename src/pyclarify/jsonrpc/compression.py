@@ -0,0 +1,65 @@
+# Copyright 2023 Searis AS
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compression module of the JSONRPC client.
+
+Time series in JSON, with their repeated timestamps and long lists of floats, compress well. With a
+Compression, request bodies above a size threshold are sent with `Content-Encoding: gzip` (or
+deflate). Compressed responses are negotiated with the `Accept-Encoding` header of the client, and
+are decompressed by the http client while they are read.
+"""
+import gzip
+import zlib
+
+
+# encodings the http clients decompress while reading the response
+ACCEPT_ENCODING = "gzip, deflate"
+
+
+class Compression:
+    """
+    Compresses the bodies of requests.
+
+    Parameters
+    ----------
+    encoding : str, default "gzip"
+        The content encoding of compressed requests, "gzip" or "deflate".
+    threshold : int, default 1024
+        The size in bytes from which request bodies are compressed. Smaller bodies are sent as is.
+    level : int, default 6
+        The compression level, from 1 (fastest) to 9 (smallest).
+
+    Example
+    -------
+        >>> from pyclarify import Client
+        >>> from pyclarify.jsonrpc.compression import Compression
+        >>> client = Client("./clarify-credentials.json", compression=Compression(level=1))
+    """
+
+    def __init__(self, encoding: str = "gzip", threshold: int = 1024, level: int = 6):
+        if encoding not in ("gzip", "deflate"):
+            raise ValueError(f"Unsupported content encoding {encoding!r}, use 'gzip' or 'deflate'.")
+        self.encoding = encoding
+        self.threshold = threshold
+        self.level = level
+
+    def compress(self, body: bytes) -> bytes:
+        """
+        Compresses a request body with the encoding of the compression.
+        """
+        if self.encoding == "gzip":
+            return gzip.compress(body, compresslevel=self.level, mtime=0)
+        # the deflate content encoding is the zlib format
+        return zlib.compress(body, self.level)
@@ -0,0 +1,409 @@
+# Copyright 2023 Searis AS
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Instrumentation module of the JSONRPC client.
+
+Every request sent by the client produces a RequestEvent, which is passed to the listeners of the
+client when the request starts and when it ends. The event tells where the time of the request was
+spent: serializing the payload, on the network or validating the response. Token refreshes produce
+a TokenRefreshEvent. MetricsCollector is a listener keeping histograms of all events in memory.
+"""
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class RequestEvent:
+    """
+    Instrumentation event of a single JSON RPC request.
+
+    Attributes
+    ----------
+    method : ApiMethod
+        The RPC method of the request.
+    id : str or int
+        The JSON RPC id of the request.
+    page : int
+        The index of the page when the request is part of a paginated request, otherwise None.
+    request_bytes : int
+        The size of the serialized request.
+    response_bytes : int
+        The size of the response body.
+    sent_bytes : int
+        The size of the request body sent, after compression.
+    received_bytes : int
+        The size of the response body received, before decompression.
+    status_code : int
+        The http status code of the response.
+    serialize_time : float
+        Seconds spent serializing and compressing the request.
+    network_time : float
+        Seconds spent sending the request and receiving the response.
+    validation_time : float
+        Seconds spent decoding and validating the response.
+    error : Error or List[Error]
+        The error of the response, if any.
+    exception : Exception
+        The exception raised while sending the request, if any.
+    """
+
+    def __init__(self, method, id=None, page: Optional[int] = None):
+        self.method = method
+        self.id = id
+        self.page = page
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.sent_bytes = 0
+        self.received_bytes = 0
+        self.status_code = None
+        self.serialize_time = 0.0
+        self.network_time = 0.0
+        self.validation_time = 0.0
+        self.error = None
+        self.exception = None
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+    @property
+    def total_time(self) -> float:
+        """
+        Seconds from the start of the request to its end, or until now if it has not ended.
+        """
+        end_time = self.end_time if self.end_time is not None else time.perf_counter()
+        return end_time - self.start_time
+
+    @contextmanager
+    def measure(self, name: str):
+        """
+        Adds the time spent in the block to the timing attribute with the given name.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            setattr(self, name, getattr(self, name) + time.perf_counter() - start)
+
+    def __repr__(self):
+        return (
+            f"RequestEvent(method={self.method}, page={self.page}, request_bytes={self.request_bytes}, "
+            f"response_bytes={self.response_bytes}, sent_bytes={self.sent_bytes}, "
+            f"received_bytes={self.received_bytes}, serialize_time={self.serialize_time:.6f}, "
+            f"network_time={self.network_time:.6f}, validation_time={self.validation_time:.6f})"
+        )
+
+
+class TokenRefreshEvent(NamedTuple):
+    """
+    Instrumentation event of an access token refresh.
+
+    Attributes
+    ----------
+    duration : float
+        Seconds spent requesting the token.
+    success : bool
+        Whether a new token was received.
+    """
+
+    duration: float
+    success: bool
+
+
+class RetryEvent(NamedTuple):
+    """
+    Instrumentation event of a request that is sent again.
+
+    Attributes
+    ----------
+    method : ApiMethod
+        The RPC method of the request, None if unknown.
+    attempt : int
+        The number of the retry, starting at 1.
+    delay : float
+        Seconds waited before the retry.
+    status_code : int
+        The http status code of the failed response, None if the request failed without a response.
+    exception : Exception
+        The exception raised by the failed request, if any.
+    """
+
+    method: Any
+    attempt: int
+    delay: float
+    status_code: Optional[int] = None
+    exception: Optional[Exception] = None
+
+
+class ThrottleEvent(NamedTuple):
+    """
+    Instrumentation event of a request delayed by the throttle of the client.
+
+    Attributes
+    ----------
+    method : ApiMethod
+        The RPC method of the request, None if unknown.
+    delay : float
+        Seconds waited for the rate limit and the limit on requests in flight.
+    in_flight : int
+        The number of requests in flight after the request was let through, including itself.
+    """
+
+    method: Any
+    delay: float
+    in_flight: int
+
+
+class Listener:
+    """
+    Base class of instrumentation listeners. Override the hooks of interest.
+    Hooks are called from the thread sending the request, and exceptions raised by them are logged and ignored.
+    """
+
+    def request_start(self, event: RequestEvent):
+        pass
+
+    def request_end(self, event: RequestEvent):
+        pass
+
+    def request_retry(self, event: RetryEvent):
+        pass
+
+    def request_throttled(self, event: ThrottleEvent):
+        pass
+
+    def token_refresh(self, event: TokenRefreshEvent):
+        pass
+
+
+class Instrumentation:
+    """
+    Dispatches instrumentation events to listeners.
+    """
+
+    def __init__(self):
+        self.listeners: List[Listener] = []
+
+    def add_listener(self, listener: Listener):
+        """
+        Adds a listener receiving all instrumentation events.
+        """
+        self.listeners = self.listeners + [listener]
+
+    def remove_listener(self, listener: Listener):
+        """
+        Removes a listener added with add_listener.
+        """
+        self.listeners = [l for l in self.listeners if l is not listener]
+
+    def emit(self, hook: str, event):
+        """
+        :meta private:
+        """
+        for listener in self.listeners:
+            try:
+                getattr(listener, hook)(event)
+            except Exception:
+                logger.exception("Instrumentation listener %r failed in %s", listener, hook)
+
+    def start_request(self, method, id=None, page: Optional[int] = None) -> RequestEvent:
+        """
+        :meta private:
+        """
+        event = RequestEvent(method, id, page)
+        self.emit("request_start", event)
+        return event
+
+    def end_request(self, event: RequestEvent):
+        """
+        :meta private:
+        """
+        event.end_time = time.perf_counter()
+        self.emit("request_end", event)
+
+    def request_retry(self, event: RetryEvent):
+        """
+        :meta private:
+        """
+        self.emit("request_retry", event)
+
+    def request_throttled(self, event: ThrottleEvent):
+        """
+        :meta private:
+        """
+        self.emit("request_throttled", event)
+
+    def token_refresh(self, event: TokenRefreshEvent):
+        """
+        :meta private:
+        """
+        self.emit("token_refresh", event)
+
+
+class Histogram:
+    """
+    Histogram with exponentially growing buckets, keeping the count, sum, min and max of all values.
+
+    Parameters
+    ----------
+    bounds : List[float]
+        The upper bounds of the buckets, in increasing order. Values above the last bound are counted in an overflow bucket.
+    """
+
+    def __init__(self, bounds: List[float]):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates the q-quantile as the upper bound of the bucket containing it, limited by the max value.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+# 100 microseconds to about 30 minutes, and 100 bytes to about 400 MB
+TIME_BOUNDS = [1e-4 * 2**i for i in range(25)]
+SIZE_BOUNDS = [100 * 2**i for i in range(23)]
+
+
+class MetricsCollector(Listener):
+    """
+    Listener keeping histograms of request timings and sizes per RPC method in memory.
+
+    Example
+    -------
+        >>> from pyclarify import Client
+        >>> from pyclarify.jsonrpc.instrumentation import MetricsCollector
+        >>> client = Client("./clarify-credentials.json")
+        >>> metrics = MetricsCollector()
+        >>> client.add_listener(metrics)
+        >>> client.data_frame(gte="2022-01-01T00:00:00Z", lt="2022-06-01T00:00:00Z")
+        >>> metrics.summary()["clarify.dataFrame"]["network_time"]
+        ... {'count': 4, 'sum': 1.93, 'min': 0.41, 'max': 0.56, 'mean': 0.48, 'p50': 0.5, 'p90': 0.56, 'p99': 0.56}
+    """
+
+    timings = ["serialize_time", "network_time", "validation_time", "total_time"]
+    sizes = ["request_bytes", "response_bytes", "sent_bytes", "received_bytes"]
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Removes all collected metrics.
+        """
+        with self.lock:
+            self.histograms: Dict[str, Dict[str, Histogram]] = {}
+            self.requests: Dict[str, int] = {}
+            self.errors: Dict[str, int] = {}
+            self.retries: Dict[str, int] = {}
+            self.throttled: Dict[str, Histogram] = {}
+            self.token_refreshes = Histogram(TIME_BOUNDS)
+            self.failed_token_refreshes = 0
+
+    def request_end(self, event: RequestEvent):
+        method = getattr(event.method, "value", str(event.method))
+        with self.lock:
+            histograms = self.histograms.get(method)
+            if histograms is None:
+                histograms = self.histograms[method] = {
+                    **{name: Histogram(TIME_BOUNDS) for name in self.timings},
+                    **{name: Histogram(SIZE_BOUNDS) for name in self.sizes},
+                }
+            for name, histogram in histograms.items():
+                histogram.add(getattr(event, name))
+            self.requests[method] = self.requests.get(method, 0) + 1
+            if event.error or event.exception:
+                self.errors[method] = self.errors.get(method, 0) + 1
+
+    def request_retry(self, event: RetryEvent):
+        method = getattr(event.method, "value", str(event.method))
+        with self.lock:
+            self.retries[method] = self.retries.get(method, 0) + 1
+
+    def request_throttled(self, event: ThrottleEvent):
+        method = getattr(event.method, "value", str(event.method))
+        with self.lock:
+            histogram = self.throttled.get(method)
+            if histogram is None:
+                histogram = self.throttled[method] = Histogram(TIME_BOUNDS)
+            histogram.add(event.delay)
+
+    def token_refresh(self, event: TokenRefreshEvent):
+        with self.lock:
+            self.token_refreshes.add(event.duration)
+            if not event.success:
+                self.failed_token_refreshes += 1
+
+    def summary(self) -> Dict:
+        """
+        Returns the count, sum, min, max, mean and percentiles of every histogram, by RPC method.
+        """
+        with self.lock:
+            summary = {
+                method: {
+                    "requests": self.requests[method],
+                    "errors": self.errors.get(method, 0),
+                    "retries": self.retries.get(method, 0),
+                    **{name: histogram.summary() for name, histogram in histograms.items()},
+                    "throttle_time": self.throttled.get(method, Histogram(TIME_BOUNDS)).summary(),
+                }
+                for method, histograms in self.histograms.items()
+            }
+            summary["token_refresh"] = {
+                **self.token_refreshes.summary(),
+                "failed": self.failed_token_refreshes,
+            }
+            return summary
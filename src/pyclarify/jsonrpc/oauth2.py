@@ -18,19 +18,52 @@ Oauth2 module for authentication client.
 
 The module provides a class for setting reading clarify credentials used to authenticate
 the API client. This module also handles getting access tokens with expiry date.
+
+Tokens are refreshed a margin before they expire, so that requests never wait for a token that has
+just expired. Concurrent callers share a single refresh, and the refresh can optionally run in the
+background while the current token is still in use. With a token cache, processes using the same
+credentials share their tokens, see `pyclarify.jsonrpc.token_cache`.
 """
 
 import requests
-import datetime
 import json
+import logging
+import threading
+import time
+from contextlib import ExitStack
 from os import path
+from typing import NamedTuple
 
 from pyclarify.fields.authentication import OAuthResponse, OAuthRequestBody
 from pyclarify.__utils__.exceptions import AuthError, CredentialError
+from .instrumentation import TokenRefreshEvent
+
+
+logger = logging.getLogger(__name__)
+
+
+class Token(NamedTuple):
+    """
+    An access token and the monotonic times at which it should be refreshed and at which it expires.
+
+    :meta private:
+    """
+
+    access_token: str
+    refresh_at: float
+    expire_at: float
 
 
 class Authenticator:
-    def __init__(self, clarify_credentials):
+    def __init__(
+        self,
+        clarify_credentials,
+        session=None,
+        instrumentation=None,
+        refresh_margin=60.0,
+        background_refresh=False,
+        token_cache=None,
+    ):
         """
         Initialiser of auth class.
 
@@ -39,7 +72,27 @@ class Authenticator:
         clarify_credentials : str/dict
             The path to the clarify_credentials.json downloaded from the Clarify app,
             or json/dictionary of the content in clarify_credentials.json
+
+        session : requests.Session, default None
+            Session used when requesting tokens. Pass the session of the client to reuse its
+            connection pool. If None, a new session is created.
+
+        instrumentation : Instrumentation, default None
+            Receives an event for every token refresh.
+
+        refresh_margin : float, default 60
+            Seconds before expiry at which the token is refreshed. Limited to half the lifetime of the token.
+
+        background_refresh : bool, default False
+            If True, a token within the refresh margin is refreshed in a background thread while the
+            current token is still returned. Otherwise the caller waits for the refresh.
+
+        token_cache : FileTokenCache, default None
+            Shares tokens with other processes using the same credentials. A cached token is used
+            until refresh_margin seconds before it expires.
         """
+        self.session = session if session is not None else requests.Session()
+        self.instrumentation = instrumentation
         self.api_url = None
         self.access_token = None
         self.integration_id = None
@@ -47,7 +100,12 @@ class Authenticator:
         self.credentials = self.read_credentials(clarify_credentials)
         self.api_url = self.credentials.audience
         self.auth_endpoint = f"{self.api_url}oauth/token"
-        self._expire_token = None
+        self.refresh_margin = refresh_margin
+        self.background_refresh = background_refresh
+        self.token_cache = token_cache
+        self.lock = threading.Lock()
+        # replaced as a whole, so that get_token reads a consistent token without the lock
+        self.token = None
 
     def read_credentials(self, clarify_credentials):
         """
@@ -102,30 +160,114 @@ class Authenticator:
         str
             Access token.
         """
-        response = requests.post(
+        start = time.perf_counter()
+        requested_at = time.monotonic()
+        response = self.session.post(
             url=self.auth_endpoint, headers=self.headers, data=self.credentials.model_dump(),
         )
+        if self.instrumentation is not None:
+            self.instrumentation.token_refresh(
+                TokenRefreshEvent(duration=time.perf_counter() - start, success=response.ok)
+            )
 
         if response.ok:
             token_obj = OAuthResponse(**response.json())
-            self._expire_token = datetime.datetime.now() + token_obj.expires_in
-            self.access_token = token_obj.access_token
+            self.set_token(token_obj.access_token, token_obj.expires_in.total_seconds(), requested_at)
             return self.access_token
         else:
             raise AuthError(**response.json())
 
+    def set_token(self, access_token, lifetime, requested_at):
+        """
+        :meta private:
+        """
+        self.access_token = access_token
+        self.token = Token(
+            access_token,
+            refresh_at=requested_at + lifetime - min(self.refresh_margin, lifetime / 2),
+            expire_at=requested_at + lifetime,
+        )
+
+    def update_token(self):
+        """
+        Gets a new token, from the token cache if it holds one that is not about to expire,
+        otherwise from the token endpoint.
+
+        :meta private:
+        """
+        if self.token_cache is None:
+            return self.refresh_token()
+
+        key = self.token_cache.key(self.credentials)
+        with ExitStack() as stack:
+            try:
+                stack.enter_context(self.token_cache.lock(key))
+            except OSError:
+                logger.warning("Could not lock the token cache, requesting a new token", exc_info=True)
+                return self.refresh_token()
+
+            cached = self.token_cache.load(key)
+            if cached is not None and cached[1] > self.refresh_margin:
+                self.set_token(cached[0], cached[1], time.monotonic())
+                return self.access_token
+
+            access_token = self.refresh_token()
+            try:
+                self.token_cache.store(key, access_token, self.token.expire_at - time.monotonic())
+            except OSError:
+                logger.warning("Could not write the token cache", exc_info=True)
+            return access_token
+
     def get_token(self):
         """
-        Check if token exists or has expired, if yes get a new one, else return the old one.
+        Check if token exists or is about to expire, if yes get a new one, else return the old one.
+        Concurrent callers share a single refresh.
 
         Returns
         -------
         str
             Access token.
         """
-        if (self._expire_token is None) or (
-            self._expire_token <= datetime.datetime.now()
-        ):
-            return self.refresh_token()
-        elif self._expire_token > datetime.datetime.now():
-            return self.access_token
+        token = self.token
+        now = time.monotonic()
+        if token is not None and now < token.refresh_at:
+            return token.access_token
+
+        if self.background_refresh and token is not None and now < token.expire_at:
+            # the token is still valid, refresh it unless another thread already does
+            if self.lock.acquire(blocking=False):
+                threading.Thread(target=self.refresh_in_background, daemon=True).start()
+            return token.access_token
+
+        with self.lock:
+            token = self.token
+            if token is None or time.monotonic() >= token.refresh_at:
+                return self.update_token()
+            return token.access_token
+
+    def valid_token(self):
+        """
+        Returns the access token if it does not need to be refreshed, otherwise None. Never blocks.
+
+        Returns
+        -------
+        str
+            Access token, or None.
+        """
+        token = self.token
+        if token is not None and time.monotonic() < token.refresh_at:
+            return token.access_token
+        return None
+
+    def refresh_in_background(self):
+        """
+        Refreshes the token and releases the lock taken by get_token.
+
+        :meta private:
+        """
+        try:
+            self.update_token()
+        except Exception:
+            logger.warning("Background refresh of the access token failed", exc_info=True)
+        finally:
+            self.lock.release()
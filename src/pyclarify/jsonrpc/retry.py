@@ -0,0 +1,219 @@
+# Copyright 2023 Searis AS
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Retry module of the JSONRPC client.
+
+The RetryPolicy decides which failed requests are sent again and how long to wait before doing so.
+Reading methods (select and dataFrame/evaluate calls) can safely be sent again after any transient
+failure. Writing methods are only sent again when the request was rejected before it was processed:
+when the server answered 429 Too Many Requests, or when no connection could be made.
+"""
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Collection, Optional
+from pyclarify.fields.constraints import ApiMethod
+
+
+IDEMPOTENT_METHODS = frozenset(
+    [
+        ApiMethod.select_items,
+        ApiMethod.select_signals,
+        ApiMethod.data_frame,
+        ApiMethod.evaluate,
+    ]
+)
+
+
+class RetryBudget:
+    """
+    Limits the number of retries relative to the number of requests, so that retries can not multiply
+    the load on a struggling server. Every request adds `ratio` retries to the budget, up to `capacity`,
+    and every retry takes one.
+
+    Parameters
+    ----------
+    ratio : float, default 0.2
+        The number of retries earned per request.
+    capacity : float, default 10
+        The maximum number of retries that can be saved up, and the initial budget.
+    """
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 10):
+        self.ratio = ratio
+        self.capacity = capacity
+        self.tokens = capacity
+        self.lock = threading.Lock()
+
+    def deposit(self):
+        """
+        Records a request.
+        """
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Takes a retry from the budget, returning False if the budget is spent.
+        """
+        with self.lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Configures retries of failed requests, with exponential backoff, jitter and support for the Retry-After header.
+
+    Parameters
+    ----------
+    max_retries : int, default 3
+        The maximum number of times a request is sent again. Use 0 to disable retries.
+    backoff_factor : float, default 0.5
+        The backoff before retry number n (starting at 0) is up to backoff_factor * 2**n seconds.
+    max_backoff : float, default 30
+        The maximum backoff in seconds.
+    jitter : bool, default True
+        Whether to wait a random time between 0 and the backoff ("full jitter"), to spread out retries of concurrent requests.
+    retry_statuses : Collection[int], default (429, 502, 503, 504)
+        The http status codes retried for reading methods.
+    max_retry_after : float, default 120
+        The longest wait accepted from a Retry-After header. Responses asking for a longer wait are not retried.
+    retry_writes : bool, default False
+        If True, writing methods (insert, saveSignals, publishSignals) are retried like reading methods.
+        Only enable it if sending the same data twice is acceptable.
+    budget : RetryBudget, default None
+        Limits the number of retries relative to the number of requests. If None, a RetryBudget with default
+        parameters is used. Use RetryBudget(capacity=float("inf")) for no limit.
+
+    Example
+    -------
+        >>> from pyclarify import Client
+        >>> from pyclarify.jsonrpc.retry import RetryPolicy
+        >>> client = Client("./clarify-credentials.json", retry_policy=RetryPolicy(max_retries=5))
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        retry_statuses: Collection[int] = (429, 502, 503, 504),
+        max_retry_after: float = 120,
+        retry_writes: bool = False,
+        budget: Optional[RetryBudget] = None,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+        self.retry_writes = retry_writes
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def is_idempotent(self, method) -> bool:
+        """
+        Whether a request of the given method can be sent again after it may have been processed.
+        """
+        return self.retry_writes or method in IDEMPOTENT_METHODS
+
+    def should_retry(
+        self,
+        method,
+        attempt: int,
+        status_code: Optional[int] = None,
+        sent: bool = True,
+    ) -> bool:
+        """
+        Whether to send a failed request again.
+
+        Parameters
+        ----------
+        method : ApiMethod
+            The RPC method of the request, None if unknown.
+        attempt : int
+            The number of retries already made.
+        status_code : int, default None
+            The http status code of the response, None if the request failed without a response.
+        sent : bool, default True
+            False if the request failed before it reached the server, for example when no connection could be made.
+
+        Returns
+        -------
+        bool
+            True if the request should be sent again.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if status_code is None:
+            retry = not sent or self.is_idempotent(method)
+        elif status_code == 429:
+            retry = True
+        else:
+            retry = status_code in self.retry_statuses and self.is_idempotent(method)
+        return retry and self.budget.withdraw()
+
+    def record_request(self):
+        """
+        :meta private:
+        """
+        self.budget.deposit()
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        The number of seconds to wait before retry number attempt (starting at 0).
+
+        Parameters
+        ----------
+        attempt : int
+            The number of retries already made.
+        retry_after : str, default None
+            The Retry-After header of the response, either in seconds or as a http date.
+
+        Returns
+        -------
+        float
+            Seconds to wait, or None if the server asked for a longer wait than max_retry_after.
+        """
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            return delay if delay <= self.max_retry_after else None
+        delay = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+def parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header, given in seconds or as a http date, into seconds from now.
+    Returns None if the header is missing or invalid.
+    """
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,87 @@
+# Copyright 2023 Searis AS
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Serializers used by the JSONRPC client to encode requests and decode responses.
+
+Pydantic models are always encoded to and decoded from bytes by pydantic itself, without building
+an intermediate tree of python objects. Plain python objects are encoded with the json module of
+the standard library, or with `orjson <https://github.com/ijl/orjson>`__ when it is installed.
+"""
+import json
+from typing import Any, Dict, Optional, Type, TypeVar
+from pydantic import BaseModel
+from pyclarify.__utils__.auxiliary import local_import
+from pyclarify.__utils__.exceptions import ImportError
+
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+class JSONSerializer:
+    """
+    Serializer using the json module of the standard library for python objects.
+    Subclass it to plug in another JSON library, and pass an instance to the client.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encodes a python object as JSON.
+        """
+        return json.dumps(obj).encode()
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decodes JSON to python objects.
+        """
+        return json.loads(data)
+
+    def dump_model(self, model: BaseModel) -> bytes:
+        """
+        Encodes a pydantic model as JSON, straight to bytes.
+        """
+        return model.__pydantic_serializer__.to_json(model)
+
+    def load_model(
+        self, model_type: Type[Model], data: bytes, context: Optional[Dict] = None
+    ) -> Model:
+        """
+        Decodes JSON straight into a pydantic model.
+        """
+        return model_type.model_validate_json(data, context=context)
+
+
+class OrjsonSerializer(JSONSerializer):
+    """
+    Serializer using orjson for python objects. Requires `orjson` to be installed.
+    """
+
+    def __init__(self):
+        self.orjson = local_import("orjson")
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.orjson.loads(data)
+
+
+def default_serializer() -> JSONSerializer:
+    """
+    Returns the fastest serializer available, OrjsonSerializer if orjson is installed and JSONSerializer otherwise.
+    """
+    try:
+        return OrjsonSerializer()
+    except ImportError:
+        return JSONSerializer()
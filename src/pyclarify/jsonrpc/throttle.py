@@ -0,0 +1,196 @@
+# Copyright 2023 Searis AS
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Throttle module of the JSONRPC client.
+
+The Throttle keeps the requests of a client under a rate limit (a token bucket) and a limit on the
+number of requests in flight. It is shared by all threads and tasks using the client, and applies to
+every request sent, including each page of a paginated request and each retry.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+
+class Throttle:
+    """
+    Limits the rate and concurrency of requests. Both limits can be changed while requests are running.
+
+    Parameters
+    ----------
+    rate : float, default None
+        The sustained number of requests per second. If None, the rate is not limited.
+    burst : float, default None
+        The number of requests that can be sent at once before the rate applies. Defaults to max(1, rate).
+    max_in_flight : int, default None
+        The maximum number of requests waiting for a response at the same time. If None, it is not limited.
+
+    Example
+    -------
+        >>> from pyclarify import Client
+        >>> from pyclarify.jsonrpc.throttle import Throttle
+        >>> client = Client("./clarify-credentials.json", throttle=Throttle(rate=10, max_in_flight=4))
+        >>> client.throttle.set_rate(5)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        self.condition = threading.Condition()
+        self.async_waiters = deque()
+        self.in_flight = 0
+        self.max_in_flight = max_in_flight
+        self.rate = None
+        self.burst = None
+        self.tokens = 0.0
+        self.last_refill = time.monotonic()
+        self.set_rate(rate, burst)
+
+    def set_rate(self, rate: Optional[float], burst: Optional[float] = None):
+        """
+        Changes the rate limit.
+
+        Parameters
+        ----------
+        rate : float
+            The sustained number of requests per second, None to remove the limit.
+        burst : float, default None
+            The number of requests that can be sent at once. Defaults to max(1, rate).
+        """
+        with self.condition:
+            self.refill()
+            # a bucket that was not limited starts full
+            limited = self.rate is not None
+            self.rate = rate
+            self.burst = burst if burst is not None else max(1.0, rate or 0.0)
+            self.tokens = min(self.tokens, self.burst) if limited else self.burst
+
+    def set_max_in_flight(self, max_in_flight: Optional[int]):
+        """
+        Changes the limit on requests in flight, None to remove the limit.
+        """
+        with self.condition:
+            self.max_in_flight = max_in_flight
+            self.wake_waiters()
+
+    def refill(self):
+        """
+        :meta private:
+        """
+        now = time.monotonic()
+        if self.rate is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def reserve(self) -> float:
+        """
+        Takes a token from the bucket, returning the number of seconds to wait before it may be used.
+
+        :meta private:
+        """
+        with self.condition:
+            if self.rate is None:
+                return 0.0
+            self.refill()
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def has_slot(self) -> bool:
+        """
+        :meta private:
+        """
+        return self.max_in_flight is None or self.in_flight < self.max_in_flight
+
+    def acquire(self) -> float:
+        """
+        Blocks until a request may be sent. Every call must be followed by a call to release.
+
+        Returns
+        -------
+        float
+            Seconds waited, 0 if the request could be sent immediately.
+        """
+        start = time.monotonic()
+        waited = False
+        with self.condition:
+            while not self.has_slot():
+                waited = True
+                self.condition.wait()
+            self.in_flight += 1
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return time.monotonic() - start if waited or delay > 0 else 0.0
+
+    async def acquire_async(self) -> float:
+        """
+        Waits, without blocking the event loop, until a request may be sent. Every call must be followed by a call to release.
+
+        Returns
+        -------
+        float
+            Seconds waited, 0 if the request could be sent immediately.
+        """
+        start = time.monotonic()
+        waited = False
+        loop = asyncio.get_running_loop()
+        while True:
+            with self.condition:
+                if self.has_slot():
+                    self.in_flight += 1
+                    break
+                future = loop.create_future()
+                self.async_waiters.append((loop, future))
+            waited = True
+            await future
+        delay = self.reserve()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except BaseException:
+                self.release()
+                raise
+        return time.monotonic() - start if waited or delay > 0 else 0.0
+
+    def release(self):
+        """
+        Marks a request acquired with acquire or acquire_async as done.
+        """
+        with self.condition:
+            self.in_flight -= 1
+            self.wake_waiters()
+
+    def wake_waiters(self):
+        """
+        :meta private:
+        """
+        self.condition.notify_all()
+        while self.async_waiters:
+            loop, future = self.async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(wake, future)
+            except RuntimeError:
+                # the event loop of the waiter is closed
+                pass
+
+
+def wake(future):
+    if not future.done():
+        future.set_result(None)
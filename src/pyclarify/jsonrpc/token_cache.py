@@ -0,0 +1,156 @@
+# Copyright 2023 Searis AS
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Token cache module of the JSONRPC client.
+
+A FileTokenCache stores access tokens on disk, so that processes using the same credentials share
+one token instead of each requesting their own. Tokens are keyed by a hash of the credentials and
+written with permissions 0600. A lock file per key makes sure that only one process refreshes the
+token at a time, while the others wait and read the new token from the cache.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+try:
+    import fcntl
+except ModuleNotFoundError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_directory() -> str:
+    """
+    Returns the pyclarify directory in the user cache directory, `$XDG_CACHE_HOME` or `~/.cache`.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "pyclarify", "tokens")
+
+
+class FileTokenCache:
+    """
+    Cache of access tokens on disk, shared between processes.
+
+    Parameters
+    ----------
+    directory : str, default None
+        The directory of the cache files, created with permissions 0700 if it does not exist.
+        Defaults to `$XDG_CACHE_HOME/pyclarify/tokens` or `~/.cache/pyclarify/tokens`.
+
+    Example
+    -------
+        >>> from pyclarify import Client
+        >>> from pyclarify.jsonrpc.token_cache import FileTokenCache
+        >>> client = Client("./clarify-credentials.json", token_cache=FileTokenCache())
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory if directory is not None else default_cache_directory()
+
+    @staticmethod
+    def key(credentials) -> str:
+        """
+        Returns the cache key of the credentials, a hash that does not reveal the client secret.
+
+        Parameters
+        ----------
+        credentials : OAuthRequestBody
+            The credentials the token is requested with.
+        """
+        digest = hashlib.sha256()
+        for value in (credentials.audience, credentials.client_id, credentials.client_secret):
+            digest.update(value.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def path(self, key: str, suffix: str) -> str:
+        """
+        :meta private:
+        """
+        return os.path.join(self.directory, f"{key}{suffix}")
+
+    @contextmanager
+    def lock(self, key: str):
+        """
+        Holds an exclusive lock on the key, across processes, for the duration of the block.
+        """
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        fd = os.open(self.path(key, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def load(self, key: str) -> Optional[Tuple[str, float]]:
+        """
+        Reads a token from the cache.
+
+        Returns
+        -------
+        (str, float)
+            The access token and the number of seconds until it expires, or None if there is no valid entry.
+        """
+        try:
+            with open(self.path(key, ".json")) as f:
+                entry = json.load(f)
+            return entry["access_token"], entry["expires_at"] - time.time()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning("Ignoring invalid token cache entry %s", self.path(key, ".json"), exc_info=True)
+            return None
+
+    def store(self, key: str, access_token: str, expires_in: float):
+        """
+        Writes a token to the cache, atomically and readable only by the current user.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the credentials.
+        access_token : str
+            The access token.
+        expires_in : float
+            Seconds until the token expires.
+        """
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        # mkstemp creates the file with permissions 0600
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".token-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"access_token": access_token, "expires_at": time.time() + expires_in}, f)
+            os.replace(temp_path, self.path(key, ".json"))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
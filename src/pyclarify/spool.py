@@ -0,0 +1,338 @@
+# Copyright 2023-2024 Searis AS
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Spool module of PyClarify.
+
+A Spool is an append-only queue of data frames on local disk. The BufferedWriter writes every batch
+to the spool before inserting it, and removes it once Clarify has accepted it, so that batches that
+could not be inserted survive network outages and restarts and are replayed in order.
+
+Batches are stored as records in segment files. A record is its length and CRC32 checksum followed
+by the times as int64 nanoseconds and the values of each series as float64, so replaying a batch
+does not create a python object per data point. Segments are deleted once all their records are
+acknowledged, and the oldest segments are dropped when the spool grows over its size limit.
+"""
+
+import logging
+import os
+import struct
+import threading
+import zlib
+from collections import deque
+from typing import Iterator, NamedTuple, Tuple
+from pyclarify.__utils__.auxiliary import local_import
+from pyclarify.views.dataframe import DataFrame
+
+
+logger = logging.getLogger(__name__)
+
+RECORD_HEADER = struct.Struct("<II")
+FRAME_HEADER = struct.Struct("<II")
+KEY_HEADER = struct.Struct("<H")
+SEGMENT_SUFFIX = ".seg"
+
+
+def encode(data: DataFrame) -> bytes:
+    """
+    Encodes a data frame as little endian arrays of times and values.
+
+    :meta private:
+    """
+    np = local_import("numpy")
+    times, series = data.to_arrays()
+    parts = [FRAME_HEADER.pack(len(times), len(series)), times.astype("<i8").tobytes()]
+    for input_id, values in series.items():
+        key = input_id.encode()
+        parts += [KEY_HEADER.pack(len(key)), key, np.asarray(values, dtype="<f8").tobytes()]
+    return b"".join(parts)
+
+
+def decode(body: bytes) -> DataFrame:
+    """
+    Decodes a data frame encoded with encode, as a columnar data frame.
+
+    :meta private:
+    """
+    np = local_import("numpy")
+    rows, width = FRAME_HEADER.unpack_from(body)
+    offset = FRAME_HEADER.size
+    times = np.frombuffer(body, dtype="<i8", count=rows, offset=offset).astype(np.int64)
+    offset += rows * 8
+    series = {}
+    for _ in range(width):
+        (length,) = KEY_HEADER.unpack_from(body, offset)
+        offset += KEY_HEADER.size
+        input_id = body[offset:offset + length].decode()
+        offset += length
+        series[input_id] = np.frombuffer(body, dtype="<f8", count=rows, offset=offset).astype(np.float64)
+        offset += rows * 8
+    return DataFrame.from_arrays(times, series)
+
+
+class Record(NamedTuple):
+    """
+    Position of a record in the spool.
+
+    Attributes
+    ----------
+    segment : int
+        The sequence number of the segment file.
+    offset : int
+        The position of the record in the segment file.
+    size : int
+        The size of the record, including its header.
+    """
+
+    segment: int
+    offset: int
+    size: int
+
+
+class Spool:
+    """
+    Durable, size bounded queue of data frames on local disk. Requires `numpy` to be installed.
+    Pass it to `Client.writer()` to keep batches that could not be inserted.
+
+    Parameters
+    ----------
+    directory : str
+        The directory of the spool files, created if it does not exist. Only one writer should use a directory at a time.
+    max_bytes : int, default 256 MiB
+        The maximum size of the spool on disk. When it is reached, the oldest batches are dropped.
+    segment_bytes : int, default 16 MiB
+        The size at which a new segment file is started. Disk space is freed a segment at a time.
+    fsync : bool, default True
+        Whether to flush every batch to the disk before inserting it. Disable to trade durability
+        on power loss for speed.
+
+    Example
+    -------
+        >>> from pyclarify.spool import Spool
+        >>> client = Client("./clarify-credentials.json")
+        >>> with client.writer(spool=Spool("/var/spool/collector")) as writer:
+        ...     writer.write("INPUT_ID", time, value)
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 256 * 2**20,
+        segment_bytes: int = 16 * 2**20,
+        fsync: bool = True,
+    ):
+        local_import("numpy")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+        self.lock = threading.Lock()
+        self.records = deque()
+        self.segments = {}  # segment number -> size in bytes
+        self.file = None
+        self.dropped = 0
+        os.makedirs(directory, exist_ok=True)
+        self.load()
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def size(self) -> int:
+        """
+        The size of the spool on disk in bytes.
+        """
+        return sum(self.segments.values())
+
+    def path(self, segment: int) -> str:
+        """
+        :meta private:
+        """
+        return os.path.join(self.directory, f"{segment:016d}{SEGMENT_SUFFIX}")
+
+    def load(self):
+        """
+        Reads the records left by a previous run. A partly written record at the end of a segment is cut off.
+
+        :meta private:
+        """
+        segments = sorted(
+            int(name[: -len(SEGMENT_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.endswith(SEGMENT_SUFFIX) and name[: -len(SEGMENT_SUFFIX)].isdigit()
+        )
+        acked_segment, acked_offset = self.read_ack()
+        for segment in segments:
+            if segment < acked_segment:
+                os.unlink(self.path(segment))
+                continue
+            offset = acked_offset if segment == acked_segment else 0
+            with open(self.path(segment), "rb") as f:
+                data = f.read()
+            end = self.scan(segment, data, offset)
+            if end < len(data):
+                logger.warning("Cutting off %s damaged bytes of spool segment %s", len(data) - end, segment)
+                with open(self.path(segment), "r+b") as f:
+                    f.truncate(end)
+            self.segments[segment] = min(end, len(data))
+        self.active = segments[-1] if segments else acked_segment
+
+    def scan(self, segment: int, data: bytes, offset: int) -> int:
+        """
+        Indexes the valid records of a segment from the offset, returning the end of the last valid record.
+
+        :meta private:
+        """
+        while offset + RECORD_HEADER.size <= len(data):
+            length, checksum = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            body = data[start:start + length]
+            if len(body) < length or zlib.crc32(body) != checksum:
+                break
+            self.records.append(Record(segment, offset, RECORD_HEADER.size + length))
+            offset = start + length
+        return offset
+
+    def read_ack(self) -> Tuple[int, int]:
+        """
+        :meta private:
+        """
+        try:
+            with open(os.path.join(self.directory, "ack")) as f:
+                segment, offset = f.read().split()
+            return int(segment), int(offset)
+        except (OSError, ValueError):
+            return 0, 0
+
+    def write_ack(self, segment: int, offset: int):
+        """
+        :meta private:
+        """
+        path = os.path.join(self.directory, "ack")
+        with open(path + ".tmp", "w") as f:
+            f.write(f"{segment} {offset}")
+        os.replace(path + ".tmp", path)
+
+    def append(self, data: DataFrame) -> Record:
+        """
+        Adds a data frame to the end of the spool.
+
+        Returns
+        -------
+        Record
+            The position of the batch, to be passed to ack once the batch is inserted.
+        """
+        body = encode(data)
+        record = RECORD_HEADER.pack(len(body), zlib.crc32(body)) + body
+        with self.lock:
+            if self.segments.get(self.active, 0) and (
+                self.segments[self.active] + len(record) > self.segment_bytes
+                or self.size + len(record) > self.max_bytes
+            ):
+                self.rotate()
+            self.evict(len(record))
+            if self.file is None:
+                self.file = open(self.path(self.active), "ab")
+            offset = self.segments.get(self.active, 0)
+            self.file.write(record)
+            self.file.flush()
+            if self.fsync:
+                os.fsync(self.file.fileno())
+            self.segments[self.active] = offset + len(record)
+            entry = Record(self.active, offset, len(record))
+            self.records.append(entry)
+            return entry
+
+    def rotate(self):
+        """
+        :meta private:
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.active += 1
+
+    def evict(self, size: int):
+        """
+        Drops the oldest segments until a record of the given size fits.
+
+        :meta private:
+        """
+        while self.segments and self.size + size > self.max_bytes:
+            oldest = min(self.segments)
+            if oldest == self.active:
+                break
+            count = sum(1 for record in self.records if record.segment == oldest)
+            self.records = deque(record for record in self.records if record.segment != oldest)
+            self.dropped += count
+            logger.warning("Spool is full, dropped %s batches of segment %s", count, oldest)
+            self.remove(oldest)
+
+    def remove(self, segment: int):
+        """
+        :meta private:
+        """
+        del self.segments[segment]
+        try:
+            os.unlink(self.path(segment))
+        except FileNotFoundError:
+            pass
+
+    def pending(self) -> Iterator[Tuple[Record, DataFrame]]:
+        """
+        Iterates over the batches that are not acknowledged, oldest first.
+
+        Returns
+        -------
+        Iterator[Tuple[Record, DataFrame]]
+            The position and the data of every batch.
+        """
+        with self.lock:
+            records = list(self.records)
+        for record in records:
+            with open(self.path(record.segment), "rb") as f:
+                f.seek(record.offset + RECORD_HEADER.size)
+                body = f.read(record.size - RECORD_HEADER.size)
+            yield record, decode(body)
+
+    def ack(self, record: Record):
+        """
+        Removes a batch from the spool. Batches are acknowledged in the order they were appended.
+        Segments without pending batches are deleted.
+        """
+        with self.lock:
+            if not self.records or self.records[0] != record:
+                raise ValueError(f"{record} is not the oldest batch in the spool.")
+            self.records.popleft()
+            if self.records:
+                head = self.records[0]
+                self.write_ack(head.segment, head.offset)
+                for segment in [s for s in self.segments if s < head.segment]:
+                    self.remove(segment)
+                return
+            # everything is acknowledged, start over with an empty segment
+            self.rotate()
+            for segment in list(self.segments):
+                self.remove(segment)
+            self.write_ack(self.active, 0)
+
+    def close(self):
+        """
+        Closes the open segment file. Pending batches stay on disk, and are loaded by the next Spool using the directory.
+        """
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
@@ -13,12 +13,30 @@
 # limitations under the License.
 
 
+import heapq
 from itertools import compress
-from datetime import datetime
-from pydantic import ConfigDict, field_validator, BaseModel, Extra
-from typing import ForwardRef, List, Dict, Optional
+from datetime import datetime, timezone
+from pydantic import (
+    ConfigDict,
+    field_validator,
+    model_serializer,
+    model_validator,
+    ValidationInfo,
+    BaseModel,
+    Extra,
+    PrivateAttr,
+    TypeAdapter,
+)
+from typing import Any, ForwardRef, List, Dict, Optional, Tuple
 from pyclarify.__utils__.auxiliary import local_import
-from pyclarify.__utils__.time import is_datetime, parse_datetime, time_to_string
+from pyclarify.__utils__.exceptions import ImportError
+from pyclarify.__utils__.time import (
+    is_datetime,
+    parse_datetime,
+    parse_datetimes,
+    time_to_string,
+    datetime_to_epoch_ns,
+)
 from pyclarify.fields.query import SelectionFormat
 from pyclarify.fields.constraints import (
     InputID,
@@ -31,6 +49,131 @@ from pyclarify.query.query import ResourceQuery, DataQuery
 
 DataFrame = ForwardRef("DataFrame")
 
+input_id_adapter = TypeAdapter(InputID)
+
+# upper bounds of the serialized size of a timestamp ("2021-11-01T21:50:06.000000Z",) and of a value
+SERIALIZED_TIME_BYTES = 30
+SERIALIZED_VALUE_BYTES = 25
+
+
+def to_epoch_ns(times):
+    """
+    Converts a sequence of timestamps to an int64 array of nanoseconds since the unix epoch.
+    Accepts datetime64 arrays (taken as UTC), integer arrays (already in epoch nanoseconds),
+    timezone aware pandas indexes and sequences of datetimes or time strings.
+
+    :meta private:
+    """
+    np = local_import("numpy")
+    if getattr(times, "tz", None) is not None:
+        times = times.tz_convert("UTC").tz_localize(None)
+    times = np.asarray(times)
+    if times.dtype.kind == "M":
+        return times.astype("datetime64[ns]").view(np.int64)
+    if times.dtype.kind in "iu":
+        return times.astype(np.int64)
+    return np.array(
+        [datetime_to_epoch_ns(parse_datetime(t)) for t in times], dtype=np.int64
+    )
+
+
+def epoch_ns_to_datetimes(times) -> List[datetime]:
+    """
+    :meta private:
+    """
+    return [
+        t.replace(tzinfo=timezone.utc)
+        for t in (times // 1000).astype("datetime64[us]").tolist()
+    ]
+
+
+# "HH:MM:" for every minute of a day, and "SS" for every second of a minute
+MINUTES_OF_DAY = [f"{h:02d}:{m:02d}:" for h in range(24) for m in range(60)]
+SECONDS_OF_MINUTE = [f"{s:02d}" for s in range(60)]
+NS_PER_DAY = 86_400 * 10**9
+
+
+def epoch_ns_to_strings(times) -> List[str]:
+    """
+    Formats int64 nanoseconds since the unix epoch as RFC 3339 strings in UTC, in microseconds.
+    Uses the shortest form of each timestamp: "2021-11-01T21:50:06Z", with ".123" or ".123456"
+    only when the time has a fraction of a second. The date is formatted once per run of
+    timestamps on the same day, so sorted timestamps cost a few string concatenations each.
+
+    :meta private:
+    """
+    np = local_import("numpy")
+    times = np.asarray(times, dtype=np.int64)
+    if len(times) == 0:
+        return []
+    days = times // NS_PER_DAY
+    time_of_day = (times - days * NS_PER_DAY) // 1000
+    seconds = time_of_day // 10**6
+    minutes = (seconds // 60).tolist()
+    seconds_of_minute = (seconds % 60).tolist()
+
+    starts = np.flatnonzero(days[1:] != days[:-1]) + 1
+    bounds = [0] + starts.tolist() + [len(times)]
+    dates = np.datetime_as_string(days[bounds[:-1]].astype("datetime64[D]")).tolist()
+    strings = []
+    for date, start, end in zip(dates, bounds, bounds[1:]):
+        prefix = date + "T"
+        strings += [
+            prefix + MINUTES_OF_DAY[m] + SECONDS_OF_MINUTE[s] + "Z"
+            for m, s in zip(minutes[start:end], seconds_of_minute[start:end])
+        ]
+
+    micros = time_of_day % 10**6
+    for i in np.flatnonzero(micros).tolist():
+        us = int(micros[i])
+        fraction = f".{us // 1000:03d}" if us % 1000 == 0 else f".{us:06d}"
+        strings[i] = strings[i][:-1] + fraction + "Z"
+    return strings
+
+
+def utc_index(times):
+    """
+    Wraps int64 epoch nanoseconds in a pandas DatetimeIndex in UTC, without copying when possible.
+
+    :meta private:
+    """
+    pd = local_import("pandas")
+    values = times.view("datetime64[ns]")
+    try:
+        array = pd.arrays.DatetimeArray._simple_new(
+            values, dtype=pd.DatetimeTZDtype(tz="UTC")
+        )
+    except (AttributeError, TypeError):
+        return pd.DatetimeIndex(values).tz_localize("UTC")
+    return pd.DatetimeIndex(array, copy=False)
+
+
+def is_time_axis(values) -> bool:
+    """
+    Whether a pandas Index or Series holds timestamps, judged by its dtype or its first value.
+
+    :meta private:
+    """
+    pd = local_import("pandas")
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return True
+    if len(values) == 0:
+        return False
+    return is_datetime(values[0] if isinstance(values, pd.Index) else values.iloc[0])
+
+
+def floats_to_values(values, finite_only=False) -> List[Optional[float]]:
+    """
+    :meta private:
+    """
+    np = local_import("numpy")
+    missing = ~np.isfinite(values) if finite_only else np.isnan(values)
+    if not missing.any():
+        return values.tolist()
+    values = values.astype(object)
+    values[missing] = None
+    return values.tolist()
+
 
 class DataFrame(BaseModel):
     """
@@ -54,11 +197,32 @@ class DataFrame(BaseModel):
         ...     times=["2021-11-01T21:50:06Z",  "2021-11-02T21:50:06Z"]
         ... )
 
+        Large data frames can be stored as NumPy arrays instead, see `DataFrame.from_arrays`.
+
     """
 
     times: List[datetime] = None
     series: Dict[InputID, NumericalValuesType] = None
 
+    # columnar representation, (int64 epoch nanoseconds, {input id: float64 values})
+    _columns: Optional[Tuple[Any, Dict[str, Any]]] = PrivateAttr(default=None)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def construct_trusted(cls, data, handler, info: ValidationInfo):
+        """
+        Skips validation of data frames decoded with a trusted context, see `Client(trust_responses=True)`.
+
+        :meta private:
+        """
+        if isinstance(data, dict) and (info.context or {}).get("trusted"):
+            times = data.get("times")
+            return cls.model_construct(
+                times=parse_datetimes(times) if times is not None else None,
+                series=data.get("series"),
+            )
+        return handler(data)
+
     @field_validator("times", mode="before")
     @classmethod
     def use_custom_datetime_converter(cls, v):
@@ -78,8 +242,264 @@ class DataFrame(BaseModel):
                 v[key] = [None if x != x else x for x in value]
         return v
 
+    @classmethod
+    def from_arrays(cls, times, series) -> "DataFrame":
+        """
+        Create a columnar Clarify DataFrame backed by NumPy arrays, without creating a python object per data point.
+        Requires `numpy` to be installed.
+
+        The `times` and `series` attributes are still available, but are only created when accessed,
+        as copies of the arrays. Accessing or assigning them turns the data frame back into a regular one,
+        so that changes made to the lists are inserted.
+        Merging, converting to pandas and serializing for insert work on the arrays directly.
+
+        Parameters
+        ----------
+        times: array like
+            Timestamps as datetime64 values (in UTC), int64 nanoseconds since the unix epoch,
+            a pandas DatetimeIndex, or a sequence of datetimes or time strings.
+
+        series: Dict[InputID, array like]
+            Map of input ids to float values, using NaN (or None) for missing values.
+            The length of each array must match that of the times array.
+
+        Returns
+        -------
+            pyclarify.DataFrame: The columnar Clarify DataFrame.
+
+        Example
+        -------
+
+            >>> import numpy as np
+            >>> from pyclarify import DataFrame
+            >>> data = DataFrame.from_arrays(
+            ...     times=np.array(["2021-11-01T21:50:06", "2021-11-02T21:50:06"], dtype="datetime64[ns]"),
+            ...     series={"INPUT_ID_1": np.array([1.0, np.nan])},
+            ... )
+            >>> data.series
+            ... {'INPUT_ID_1': [1.0, None]}
+        """
+        np = local_import("numpy")
+        times = to_epoch_ns(times)
+        columns = {}
+        for input_id, values in series.items():
+            values = np.asarray(values, dtype=np.float64)
+            if values.shape != times.shape:
+                raise ValueError(
+                    f"Series {input_id} has {len(values)} values, but there are {len(times)} timestamps."
+                )
+            columns[input_id_adapter.validate_python(input_id)] = values
+
+        data_frame = cls.model_construct()
+        # the fields are created from the columns on first access, see __getattr__
+        del data_frame.__dict__["times"]
+        del data_frame.__dict__["series"]
+        data_frame.__pydantic_fields_set__.update(("times", "series"))
+        data_frame._columns = (times, columns)
+        return data_frame
+
+    def to_arrays(self):
+        """
+        Convert the instance into NumPy arrays. Requires `numpy` to be installed.
+
+        Returns
+        -------
+            Tuple[numpy.ndarray, Dict[InputID, numpy.ndarray]]: The timestamps as int64 nanoseconds since
+            the unix epoch and a map of input ids to float64 values, with NaN for missing values.
+        """
+        if self._columns is not None:
+            times, columns = self._columns
+            return times, dict(columns)
+
+        np = local_import("numpy")
+        times = np.array(
+            [datetime_to_epoch_ns(t) for t in self.times or []], dtype=np.int64
+        )
+        columns = {
+            input_id: np.array(values, dtype=np.float64)
+            for input_id, values in (self.series or {}).items()
+        }
+        return times, columns
+
+    def split(self, max_points: Optional[int] = None, max_bytes: Optional[int] = None) -> List["DataFrame"]:
+        """
+        Split the data frame by series and by time into columnar data frames that each hold at most
+        `max_points` values and serialize to at most about `max_bytes` bytes. Requires `numpy` to be installed
+        if the data frame is over the limits.
+
+        The frame is split by time first, and only split by series when a single row is over the limits.
+        Rows where all values of a group of series are missing are left out of that group. Regular data frames
+        are split without numpy when it is not installed.
+
+        Parameters
+        ----------
+        max_points: int, default None
+            The maximum number of values (timestamps times series) in each data frame. If None, not limited.
+
+        max_bytes: int, default None
+            The maximum serialized size of each data frame, estimated from the largest possible size of
+            a timestamp and a value. If None, not limited.
+
+        Returns
+        -------
+            List[pyclarify.DataFrame]: The parts, ordered by series group and then by time.
+            A list holding only the data frame itself if it is within the limits.
+
+        Example
+        -------
+
+            >>> data = DataFrame(
+            ...     series={"INPUT_ID_1": [1, 2, 3], "INPUT_ID_2": [4, 5, 6]},
+            ...     times=["2021-11-01T21:50:06Z", "2021-11-02T21:50:06Z", "2021-11-03T21:50:06Z"],
+            ... )
+            >>> [len(part.times) for part in data.split(max_points=4)]
+            ... [2, 1]
+        """
+        if self._columns is not None:
+            rows, width = len(self._columns[0]), len(self._columns[1])
+        else:
+            rows, width = len(self.times or []), len(self.series or {})
+        within_points = max_points is None or rows * width <= max_points
+        within_bytes = max_bytes is None or rows * (SERIALIZED_TIME_BYTES + width * SERIALIZED_VALUE_BYTES) <= max_bytes
+        if rows == 0 or width == 0 or (within_points and within_bytes):
+            return [self]
+
+        try:
+            np = local_import("numpy")
+        except ImportError:
+            # without numpy, regular data frames are split by slicing their lists
+            np = None
+        times, columns = self.to_arrays() if np is not None else (self.times, self.series)
+        input_ids = list(columns)
+
+        # the widest group of series of which one row is within the limits
+        group = width
+        if max_points is not None:
+            group = min(group, max(1, max_points))
+        if max_bytes is not None:
+            group = min(group, max(1, (max_bytes - SERIALIZED_TIME_BYTES) // SERIALIZED_VALUE_BYTES))
+        # spread the series evenly over the groups
+        group = -(-width // -(-width // group))
+
+        parts = []
+        for start in range(0, width, group):
+            group_ids = input_ids[start:start + group]
+            group_times = times
+            group_columns = {input_id: columns[input_id] for input_id in group_ids}
+            if group < width and np is not None:
+                present = np.zeros(rows, dtype=bool)
+                for values in group_columns.values():
+                    present |= ~np.isnan(values)
+                if not present.all():
+                    group_times = times[present]
+                    group_columns = {k: v[present] for k, v in group_columns.items()}
+            elif group < width:
+                present = [any(row) for row in zip(*[[v is not None for v in values] for values in group_columns.values()])]
+                if not all(present):
+                    group_times = list(compress(times, present))
+                    group_columns = {k: list(compress(v, present)) for k, v in group_columns.items()}
+
+            group_rows = len(group_times)
+            chunk = group_rows
+            if max_points is not None:
+                chunk = min(chunk, max(1, max_points // len(group_ids)))
+            if max_bytes is not None:
+                row_bytes = SERIALIZED_TIME_BYTES + len(group_ids) * SERIALIZED_VALUE_BYTES
+                chunk = min(chunk, max(1, max_bytes // row_bytes))
+            if group_rows == 0:
+                continue
+            # spread the rows evenly over the parts
+            chunk = -(-group_rows // -(-group_rows // chunk))
+            for row in range(0, group_rows, chunk):
+                part_times = group_times[row:row + chunk]
+                part_series = {k: v[row:row + chunk] for k, v in group_columns.items()}
+                if np is not None:
+                    parts.append(DataFrame.from_arrays(part_times, part_series))
+                else:
+                    parts.append(DataFrame.model_construct(times=part_times, series=part_series))
+        return parts
+
+    @property
+    def is_columnar(self) -> bool:
+        """
+        Whether the data frame is backed by NumPy arrays, see `DataFrame.from_arrays`.
+        """
+        return self._columns is not None
+
+    def list_fields(self):
+        """
+        Returns the times and series as lists, without turning a columnar data frame into a regular one.
+
+        :meta private:
+        """
+        if self._columns is None:
+            return self.times, self.series
+        times, series = self._columns
+        return (
+            epoch_ns_to_datetimes(times),
+            {key: floats_to_values(values) for key, values in series.items()},
+        )
+
+    def __getattr__(self, name):
+        # lazily create the list fields of columnar data frames
+        if name in ("times", "series"):
+            columns = self.__pydantic_private__.get("_columns") if self.__pydantic_private__ else None
+            if columns is not None:
+                # the lists may be modified in place, so they become the source of truth
+                self.__dict__["times"], self.__dict__["series"] = self.list_fields()
+                self._columns = None
+                return self.__dict__[name]
+        return super().__getattr__(name)
+
+    def __setattr__(self, name, value):
+        if name in ("times", "series") and self._columns is not None:
+            # creates both lists, the other field keeps its value
+            getattr(self, name)
+        super().__setattr__(name, value)
+
+    def __iter__(self):
+        yield "times", self.times
+        yield "series", self.series
+
+    def __eq__(self, other):
+        if not isinstance(other, DataFrame):
+            return NotImplemented
+        return self.list_fields() == other.list_fields()
+
+    def __repr_args__(self):
+        yield from zip(("times", "series"), self.list_fields())
+
+    @model_serializer(mode="wrap")
+    def serialize_columns(self, handler, info):
+        """
+        :meta private:
+        """
+        if self._columns is None:
+            if not info.mode_is_json() or not self.times:
+                return handler(self)
+            try:
+                np = local_import("numpy")
+            except ImportError:
+                return handler(self)
+            # formats all timestamps in one pass, instead of calling time_to_string per timestamp
+            times = np.array([datetime_to_epoch_ns(t) for t in self.times], dtype=np.int64)
+            return {"times": epoch_ns_to_strings(times), "series": self.series}
+        if not info.mode_is_json():
+            return dict(zip(("times", "series"), self.list_fields()))
+
+        times, series = self._columns
+        return {
+            "times": epoch_ns_to_strings(times),
+            "series": {
+                key: floats_to_values(values, finite_only=True)
+                for key, values in series.items()
+            },
+        }
+
     def to_pandas(self):
         """Convert the instance into a pandas DataFrame.
+        The index is a DatetimeIndex in UTC and all columns are float64, with NaN for missing values.
+        Columnar data frames are converted without copying, so the pandas DataFrame shares memory with this instance.
 
         Returns
         -------
@@ -102,9 +522,8 @@ class DataFrame(BaseModel):
         """
         pd = local_import("pandas")
 
-        df = pd.DataFrame(self.series)
-        df.index = self.times
-        return df
+        times, series = self.to_arrays()
+        return pd.DataFrame(series, index=utc_index(times), copy=False)
 
     @classmethod
     def from_dict(cls, data):
@@ -168,7 +587,7 @@ class DataFrame(BaseModel):
 
         Returns
         -------
-            pyclarify.DataFrame: The Clarify DataFrame representing this instance.
+            pyclarify.DataFrame: The columnar Clarify DataFrame representing this instance, see `DataFrame.from_arrays`.
 
         Example
         -------
@@ -211,40 +630,46 @@ class DataFrame(BaseModel):
         """
 
         pd = local_import("pandas")
-        if isinstance(df, pd.DataFrame):
-            series = df.to_dict(orient="list")
         if isinstance(df, pd.Series):
-            if df.name is not None:
-                series = {df.name: list(df.values)}
-            else:
+            if df.name is None:
                 raise ValueError("The series you are converting does not have a name.")
+            df = df.to_frame()
 
         if time_col:
-            times = df[time_col].values
-            series.pop(time_col)
+            times = df[time_col]
+        elif is_time_axis(df.index):
+            times = df.index
         else:
-            if is_datetime(df.index.values[0]):
-                times = df.index.values
-            else:
-                import warnings
+            import warnings
 
-                warnings.warn(
-                    "No obvious time index! Attempting to select based on data.",
-                    stacklevel=2,
+            warnings.warn(
+                "No obvious time index! Attempting to select based on data.",
+                stacklevel=2,
+            )
+            time_cols = [col for col in df.columns if is_time_axis(df[col])]
+            if len(time_cols) == 0:
+                raise ValueError("No time variable in the data. Can not convert.")
+            if len(time_cols) > 1:
+                raise ValueError(
+                    f"Unambiguous time index! {time_cols} could be index. Use `time_col` variable or set time to index."
                 )
-                possible_indexes = [is_datetime(c) for c in df.values[0]]
-                if sum(possible_indexes) == 0:
-                    raise ValueError("No time variable in the data. Can not convert.")
-                col = df.columns[possible_indexes]
-                if sum(possible_indexes) > 1:
-                    raise ValueError(
-                        f"Unambiguous time index! {list(df.columns[possible_indexes])} could be index. Use `time_col` variable or set time to index."
-                    )
-                else:
-                    times = df[col[0]].values
-                    series.pop(col[0])
-                warnings.warn(f'Choosing "{col[0]}" as time axis.', stacklevel=2)
-        return cls(times=list(times), series=series)
+            time_col = time_cols[0]
+            times = df[time_col]
+            warnings.warn(f'Choosing "{time_col}" as time axis.', stacklevel=2)
+
+        # datetime64 data is read as an array, anything else is parsed one timestamp at the time
+        if pd.api.types.is_datetime64_any_dtype(times.dtype):
+            times = pd.DatetimeIndex(times)
+        else:
+            times = times.to_numpy(dtype=object)
+
+        np = local_import("numpy")
+        series = {
+            col: df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            for col in df.columns
+            if col != time_col
+        }
+        return cls.from_arrays(times, series)
 
     @classmethod
     def merge(cls, data_frames) -> "DataFrame":
@@ -252,6 +677,8 @@ class DataFrame(BaseModel):
         Method for merging 2 or more Clarify Data Frames. Mapping overlapping
         signal names to single series. Concatenates timestamps of all data frames.
         Inserts none value to series not containing entry at a given timestamp.
+        All data frames are merged in one pass, linear in the total number of data points,
+        so prefer merging a list of many data frames over adding them one by one.
 
         Parameters
         ----------
@@ -278,15 +705,16 @@ class DataFrame(BaseModel):
             ... )
             >>> merged_df = DataFrame.merge([df1, df2])
             >>> merged_df.to_pandas()
-            ...                            INPUT_ID_2  INPUT_ID_1  INPUT_ID_3
-            ... 2021-11-01 21:50:06+00:00         3.0         5.0         7.0
-            ... 2021-11-02 21:50:06+00:00         4.0         2.0         NaN
-            ... 2021-11-03 21:50:06+00:00         NaN         6.0         8.0
+            ...                            INPUT_ID_1  INPUT_ID_2  INPUT_ID_3
+            ... 2021-11-01 21:50:06+00:00         5.0         3.0         7.0
+            ... 2021-11-02 21:50:06+00:00         2.0         4.0         NaN
+            ... 2021-11-03 21:50:06+00:00         6.0         NaN         8.0
 
         Warning
         -----
 
             Notice from the example above that when time series have overlapping timestamps the last data frame overwrites the first.
+            If any of the data frames is columnar, the merge is done on NumPy arrays and the result is columnar.
 
             >>> df1 = DataFrame(
             ...     series={"INPUT_ID_1": [1, 2]},
@@ -318,39 +746,60 @@ class DataFrame(BaseModel):
                 raise ValueError(
                     f"Expected Clarify Data_Frames in list but got {df.__class__()}"
                 )
-        signals = [key for df in data_frames for key in df.series.keys()]
-        signals = list(set(signals))
 
-        cdf_dict = {}
-        for cdf in data_frames:
-            for signal, values in list(cdf.series.items()):
-                for value, time in zip(values, cdf.times):
-                    cdf_dict.setdefault(time, []).append((signal, value))
+        if any(df.is_columnar for df in data_frames):
+            return cls.merge_arrays(data_frames)
 
-        times = sorted(list(cdf_dict.keys()))
+        # sorted union of all timestamps, merging the (already sorted) time axes of each data frame
+        times = []
+        for time in heapq.merge(*[sorted(df.times or []) for df in data_frames]):
+            if not times or time != times[-1]:
+                times.append(time)
+        rows = {time: i for i, time in enumerate(times)}
 
         # make sure not to reference pointers
-        signal_values = [[None] * len(times) for i in range(len(signals))]
+        series = {}
+        for cdf in data_frames:
+            indices = [rows[time] for time in cdf.times or []]
+            for signal, values in (cdf.series or {}).items():
+                column = series.get(signal)
+                if column is None:
+                    column = series[signal] = [None] * len(times)
+                for i, value in zip(indices, values):
+                    column[i] = value
 
-        for i, time in enumerate(times):
-            for value in cdf_dict[time]:
-                signal_values[signals.index(value[0])][i] = value[1]
+        # all inputs are validated DataFrames, no need to validate again
+        return cls.model_construct(times=times, series=series)
+
+    @classmethod
+    def merge_arrays(cls, data_frames) -> "DataFrame":
+        """
+        :meta private:
+        """
+        np = local_import("numpy")
+        arrays = [df.to_arrays() for df in data_frames]
+        times = np.unique(np.concatenate([t for t, _ in arrays]).astype(np.int64))
 
         series = {}
-        for signal, values in zip(signals, signal_values):
-            series[signal] = values
+        for frame_times, frame_series in arrays:
+            rows = np.searchsorted(times, frame_times)
+            for signal, values in frame_series.items():
+                column = series.get(signal)
+                if column is None:
+                    column = series[signal] = np.full(len(times), np.nan)
+                column[rows] = values
 
-        return cls(times=times, series=series)
+        return cls.from_arrays(times, series)
 
     def __add__(self, other):
         try:
             if isinstance(other, DataFrame):
                 data = DataFrame.merge([self, other])
-                return data
             elif isinstance(other, dict):
                 data = DataFrame.merge([self, DataFrame.from_dict(other)])
             else:
                 data = DataFrame.merge([self, DataFrame.from_pandas(other)])
+            return data
         except TypeError as e:
             raise TypeError(source=self, other=other) from e
 
@@ -385,6 +834,20 @@ class InsertResponse(BaseModel):
     signalsByInput: Dict[InputID, CreateSummary]
     model_config = ConfigDict(extra="forbid") 
 
+    @classmethod
+    def merge(cls, responses) -> "InsertResponse":
+        """
+        Merges the results of inserts of several parts of a data frame.
+        A signal is reported as created if any of the inserts created it.
+        """
+        signals = {}
+        for response in responses:
+            for input_id, summary in response.signalsByInput.items():
+                previous = signals.get(input_id)
+                if previous is None or (summary.created and not previous.created):
+                    signals[input_id] = summary
+        return cls.model_construct(signalsByInput=signals)
+
 class DataFrameParams(BaseModel):
     """
     :meta private:
@@ -13,8 +13,10 @@
 # limitations under the License.
 
 
+import functools
+import operator
 from datetime import datetime, timedelta
-from pydantic import ConfigDict, BaseModel, validate_arguments, model_validator
+from pydantic import ConfigDict, BaseModel, validate_arguments, model_validator, field_validator, ValidationInfo
 from pydantic.json import timedelta_isoformat
 from pyclarify.__utils__.time import time_to_string
 from pyclarify.__utils__.exceptions import TypeError
@@ -81,24 +83,41 @@ class Request(JSONRPCRequest):
 
 
 class IncludedField(BaseModel):
+    @classmethod
+    def merge(cls, included_fields) -> "IncludedField":
+        """
+        Merges the included fields of several pages in one pass. Resources included
+        in more than one page are only kept once.
+
+        Parameters
+        ----------
+        included_fields : List[IncludedField]
+            The included fields to merge, in page order.
+
+        Returns
+        -------
+        IncludedField
+            The included resources of all pages.
+        """
+        resources = {}
+        values = {}
+        for included in included_fields:
+            for key in type(included).model_fields:
+                value = getattr(included, key, None)
+                if value is None:
+                    continue
+                if isinstance(value, list):
+                    unique = resources.setdefault(key, {})
+                    for resource in value:
+                        unique.setdefault(getattr(resource, "id", resource), resource)
+                else:
+                    values.setdefault(key, value)
+        data = {key: list(unique.values()) for key, unique in resources.items()}
+        data.update(values)
+        return included_fields[0].__class__(**data)
+
     def __add__(self, other):
-        data = {}
-        keys = set(list(self.model_dump().keys()) + list(other.model_dump().keys()))
-        for key in keys:
-            data[key] = []
-            self_object = getattr(self, key) if hasattr(self, key) else None
-            other_object = getattr(other, key) if hasattr(other, key) else None
-            if self_object:
-                data[key] += self_object
-            if other_object:
-                data[key] += other_object
-            if self_object is None and other_object is None:
-                data.pop(key)
-            else:
-                data[key] = list(set(data[key]))
-        if hasattr(data, "integration"):
-            data["integration"] = data["integration"][0]
-        return self.__class__(**data)
+        return self.merge([self, other])
 
 
 class IncludedFieldSignals(IncludedField):
@@ -115,16 +134,36 @@ class IncludedFieldItems(IncludedField):
 class Selection(BaseModel):
     meta: SelectionMeta
 
+    @classmethod
+    def merge(cls, selections) -> "Selection":
+        """
+        Merges the selections of several pages in one pass.
+
+        Parameters
+        ----------
+        selections : List[Selection]
+            The selections to merge, in page order.
+
+        Returns
+        -------
+        Selection
+            Selection with the meta data of the first page and the data and included resources of all pages.
+        """
+        first = selections[0]
+        data = [selection.data for selection in selections if selection.data is not None]
+        if not data:
+            data = None
+        elif isinstance(data[0], DataFrame):
+            data = DataFrame.merge(data)
+        else:
+            data = [resource for page in data for resource in page]
+        included = [selection.included for selection in selections if selection.included]
+        included = included[0].merge(included) if included else None
+        return first.model_copy(update={"data": data, "included": included})
+
     def __add__(self, other):
         try:
-            self.data += other.data
-            if self.included:
-                if other.included:
-                    self.included += other.included
-            elif other.included:
-                self.included = other.included
-            
-            return self
+            return self.merge([self, other])
         except TypeError as e:
             raise TypeError(source=self, other=other) from e
 
@@ -143,6 +182,17 @@ class SignalSelection(Selection):
     included: Optional[IncludedFieldSignals] = None
     
 
+RESULT_TYPES = {
+    ApiMethod.insert: InsertResponse,
+    ApiMethod.save_signals: SaveSignalsResponse,
+    ApiMethod.data_frame: DataSelection,
+    ApiMethod.evaluate: DataSelection,
+    ApiMethod.select_items: ItemSelection,
+    ApiMethod.select_signals: SignalSelection,
+    ApiMethod.publish_signals: PublishSignalsResponse,
+}
+
+
 class GenericResponse(BaseModel):
     jsonrpc: str = "2.0"
     id: Union[str,int] = "1"
@@ -154,7 +204,21 @@ class GenericResponse(BaseModel):
 
 class Response(GenericResponse):
     method: Optional[ApiMethod] = None
-    
+
+    @field_validator("result", mode="before")
+    @classmethod
+    def use_result_type_from_context(cls, result, info: ValidationInfo):
+        """
+        Validates the result as the result type of the method given in the validation context,
+        instead of trying every result type.
+
+        :meta private:
+        """
+        method = (info.context or {}).get("method")
+        if isinstance(result, dict) and method in RESULT_TYPES:
+            return RESULT_TYPES[method].model_validate(result, context=info.context)
+        return result
+
     @model_validator(mode='after')
     def use_correct_response_based_on_method(cls, values):
         #TODO: Not happy with this resolution flow
@@ -188,6 +252,44 @@ class Response(GenericResponse):
         values.method = None # no need anymore for declaring method
         return values
     
+    @classmethod
+    def merge(cls, responses) -> "Response":
+        """
+        Merges the responses of several pages in one pass, instead of adding them one by one.
+
+        Parameters
+        ----------
+        responses : List[Response]
+            The responses to merge, in page order.
+
+        Returns
+        -------
+        Response
+            Response with the id of the first page, the merged results and all errors.
+        """
+        results = [response.result for response in responses if response.result]
+        errors = []
+        for response in responses:
+            if isinstance(response.error, List):
+                errors += response.error
+            elif response.error:
+                errors.append(response.error)
+
+        result = None
+        if len(results) == 1:
+            result = results[0]
+        elif results and hasattr(results[0], "merge"):
+            result = results[0].merge(results)
+        elif results:
+            result = functools.reduce(operator.add, results)
+
+        error = None
+        if len(errors) == 1:
+            error = errors[0]
+        elif errors:
+            error = errors
+        return responses[0].model_copy(update={"result": result, "error": error})
+
     def __add__(self, other):
         try:
             results = None
@@ -0,0 +1,381 @@
+# Copyright 2023-2024 Searis AS
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Writer module of PyClarify.
+
+The BufferedWriter collects data points from any number of threads, and inserts them in the
+background as one columnar DataFrame per flush, instead of one request per data point. Memory is
+bounded: when too many points are waiting to be written, producers block until there is room.
+With a Spool, batches are kept on disk until Clarify accepts them, see `pyclarify.spool`.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from pyclarify.__utils__.auxiliary import local_import
+from pyclarify.__utils__.exceptions import PyClarifyException
+from pyclarify.__utils__.time import datetime_to_epoch_ns, parse_datetime
+from pyclarify.views.dataframe import DataFrame, input_id_adapter
+
+
+logger = logging.getLogger(__name__)
+
+
+class BufferFullError(PyClarifyException):
+    """
+    Error class that is generated when a data point could not be buffered before the timeout.
+    """
+
+    def __init__(self, pending: int):
+        self.pending = pending
+
+    def __str__(self):
+        return f"The writer has {self.pending} data points waiting to be written, and no room for more."
+
+
+def to_ns(t) -> int:
+    """
+    Converts a datetime, time string or int64 nanoseconds since the unix epoch to nanoseconds.
+
+    :meta private:
+    """
+    if isinstance(t, int):
+        return t
+    if not isinstance(t, datetime):
+        t = parse_datetime(t)
+    return datetime_to_epoch_ns(t)
+
+
+def coalesce(buffer: Dict[str, Tuple[List[int], List[float]]]) -> DataFrame:
+    """
+    Combines the buffered points of all signals into one columnar DataFrame. When a signal has
+    several values for the same time, the last one written is kept.
+
+    :meta private:
+    """
+    np = local_import("numpy")
+    arrays = {
+        input_id: (np.array(times, dtype=np.int64), np.array(values, dtype=np.float64))
+        for input_id, (times, values) in buffer.items()
+    }
+    times = np.unique(np.concatenate([t for t, _ in arrays.values()]))
+    series = {}
+    for input_id, (signal_times, values) in arrays.items():
+        column = np.full(len(times), np.nan)
+        column[np.searchsorted(times, signal_times)] = values
+        series[input_id] = column
+    return DataFrame.from_arrays(times, series)
+
+
+def is_transient(error) -> bool:
+    """
+    Whether an insert failed because of the network or the load of the server, and is worth retrying.
+
+    :meta private:
+    """
+    if isinstance(error, Exception):
+        return True
+    errors = error if isinstance(error, list) else [error]
+    return any(e.code in (408, 429) or 500 <= e.code < 600 for e in errors)
+
+
+class BufferedWriter:
+    """
+    Buffers data points and inserts them in the background. Created with `Client.writer()`.
+    Requires `numpy` to be installed.
+
+    Points are written when `max_points` points are buffered, when the oldest buffered point is
+    `max_delay` seconds old, on `flush()` and on `close()`. Writes are thread-safe.
+
+    Parameters
+    ----------
+    client : Client
+        The client used to insert the data.
+    max_points : int, default 10 000
+        The number of buffered points that triggers a write.
+    max_delay : float, default 1
+        The maximum number of seconds a point is buffered before it is written.
+    max_pending : int, default 1 000 000
+        The maximum number of points buffered or being written. Producers block when it is reached.
+    max_concurrency : int, default 1
+        The maximum number of requests sent at the same time when a write is split into several inserts.
+    on_error : Callable[[DataFrame, Exception or Error], None], default None
+        Called from the background thread with the data and the error when a write fails.
+        If None, the error is logged and the data is dropped.
+    spool : Spool, default None
+        Keeps every batch on disk until it is inserted. Batches that fail because of network errors,
+        429 or 5xx responses are retried in order, before newer batches, every `retry_interval` seconds.
+        Batches rejected by the API are dropped and passed to on_error. Batches left in the spool by
+        an earlier process are sent first.
+    retry_interval : float, default 5
+        Seconds between attempts to send the spooled batches after a failure.
+
+    Example
+    -------
+        >>> client = Client("./clarify-credentials.json")
+        >>> with client.writer(max_delay=5) as writer:
+        ...     for sample in samples:
+        ...         writer.write("INPUT_ID", sample.time, sample.value)
+    """
+
+    def __init__(
+        self,
+        client,
+        max_points: int = 10_000,
+        max_delay: float = 1.0,
+        max_pending: int = 1_000_000,
+        max_concurrency: int = 1,
+        on_error: Optional[Callable] = None,
+        spool=None,
+        retry_interval: float = 5.0,
+    ):
+        local_import("numpy")
+        self.client = client
+        self.max_points = max_points
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.max_concurrency = max_concurrency
+        self.on_error = on_error
+        self.spool = spool
+        self.retry_interval = retry_interval
+        # monotonic time of the next attempt to send the spooled batches
+        self.retry_at = 0.0 if spool is not None and len(spool) else None
+
+        self.condition = threading.Condition()
+        self.buffer: Dict[str, Tuple[List[int], List[float]]] = {}
+        self.buffered = 0
+        self.pending = 0
+        self.oldest = None
+        # sequence numbers of the last point written to the buffer and the last point flushed
+        self.written = 0
+        self.flushed = 0
+        self.flush_requested = False
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, name="pyclarify-writer", daemon=True)
+        self.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, input_id: str, time, value: Optional[float], timeout: Optional[float] = None):
+        """
+        Buffers a data point.
+
+        Parameters
+        ----------
+        input_id : str
+            The input id of the signal.
+        time : datetime, str or int
+            The time of the point, as a datetime, a time string or nanoseconds since the unix epoch.
+        value : float
+            The value, None for an empty value.
+        timeout : float, default None
+            Seconds to wait for room in the buffer. If None, waits until there is room.
+
+        Raises
+        ------
+        BufferFullError
+            If there was no room in the buffer before the timeout.
+        """
+        self.write_many(input_id, [time], [value], timeout)
+
+    def write_many(self, input_id: str, times, values, timeout: Optional[float] = None):
+        """
+        Buffers several data points of a signal. Takes the same arguments as `write`, with sequences of times and values.
+        """
+        input_id_adapter.validate_python(input_id)
+        times = [to_ns(t) for t in times]
+        values = [float("nan") if v is None else v for v in values]
+        if len(times) != len(values):
+            raise ValueError(f"Got {len(times)} times and {len(values)} values for {input_id}.")
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("The writer is closed.")
+            # a write larger than the buffer is let through when the buffer is empty
+            room = lambda: self.pending == 0 or self.pending + len(times) <= self.max_pending
+            if not self.condition.wait_for(room, timeout):
+                raise BufferFullError(self.pending)
+            buffered_times, buffered_values = self.buffer.setdefault(input_id, ([], []))
+            buffered_times.extend(times)
+            buffered_values.extend(values)
+            self.buffered += len(times)
+            self.pending += len(times)
+            self.written += len(times)
+            if self.oldest is None:
+                # let the background thread start the max_delay timer
+                self.oldest = time.monotonic()
+                self.condition.notify_all()
+            elif self.buffered >= self.max_points:
+                self.condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Writes all buffered points, and waits until they are written, or stored in the spool if the writer has one.
+
+        Parameters
+        ----------
+        timeout : float, default None
+            Seconds to wait. If None, waits until the points are written.
+
+        Returns
+        -------
+        bool
+            False if the timeout expired before the points were written.
+        """
+        with self.condition:
+            target = self.written
+            self.flush_requested = True
+            self.condition.notify_all()
+            return self.condition.wait_for(lambda: self.flushed >= target, timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Writes all buffered points and stops the background thread. Further writes raise RuntimeError.
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join(timeout)
+        if self.spool is not None and not self.thread.is_alive():
+            self.spool.close()
+
+    def due(self) -> bool:
+        """
+        :meta private:
+        """
+        if self.retry_at is not None and (self.closed or time.monotonic() >= self.retry_at):
+            return True
+        if not self.buffered:
+            return False
+        if self.flush_requested or self.closed or self.buffered >= self.max_points:
+            return True
+        return time.monotonic() - self.oldest >= self.max_delay
+
+    def run(self):
+        """
+        :meta private:
+        """
+        while True:
+            with self.condition:
+                while not self.due():
+                    if self.closed:
+                        return
+                    if self.flush_requested:
+                        # nothing buffered, everything requested is flushed
+                        self.flush_requested = False
+                        self.condition.notify_all()
+                    deadlines = []
+                    if self.oldest is not None:
+                        deadlines.append(self.oldest + self.max_delay)
+                    if self.retry_at is not None:
+                        deadlines.append(self.retry_at)
+                    timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                    self.condition.wait(timeout)
+                buffer, count, target = self.buffer, self.buffered, self.written
+                self.buffer, self.buffered, self.oldest = {}, 0, None
+                self.flush_requested = False
+
+            if buffer:
+                self.write_batch(buffer)
+            if self.retry_at is not None and (self.closed or time.monotonic() >= self.retry_at):
+                self.replay()
+                if self.closed:
+                    # batches still spooled are sent by the next writer using the spool
+                    self.retry_at = None
+
+            with self.condition:
+                self.pending -= count
+                self.flushed = target
+                self.condition.notify_all()
+
+    def write_batch(self, buffer):
+        """
+        :meta private:
+        """
+        try:
+            data = coalesce(buffer)
+        except Exception as e:
+            self.report_error(None, e)
+            return
+        if self.spool is None:
+            self.insert(data)
+            return
+        try:
+            self.spool.append(data)
+        except OSError:
+            logger.warning("Could not write to the spool, inserting without it", exc_info=True)
+            self.insert(data)
+            return
+        if self.retry_at is None:
+            self.retry_at = 0.0
+
+    def replay(self):
+        """
+        Inserts the spooled batches in order, until one fails with an error worth retrying.
+
+        :meta private:
+        """
+        try:
+            for record, data in self.spool.pending():
+                error = self.insert(data, retry=True)
+                if error is not None:
+                    self.retry_at = time.monotonic() + self.retry_interval
+                    return
+                self.spool.ack(record)
+        except OSError:
+            logger.exception("Could not read the spool")
+            self.retry_at = time.monotonic() + self.retry_interval
+            return
+        self.retry_at = None
+
+    def insert(self, data, retry=False):
+        """
+        Inserts the data, returning the error if it should be retried.
+
+        :meta private:
+        """
+        try:
+            response = self.client.insert(data, max_concurrency=self.max_concurrency)
+            error = response.error
+        except Exception as e:
+            error = e
+        if error is None:
+            return None
+        if retry and is_transient(error):
+            logger.warning(
+                "Failed to write %s data points, retrying in %ss: %s",
+                len(data.to_arrays()[0]), self.retry_interval, error,
+            )
+            return error
+        self.report_error(data, error)
+        return None
+
+    def report_error(self, data, error):
+        """
+        :meta private:
+        """
+        if self.on_error is None:
+            logger.error("Failed to write data points: %s", error)
+            return
+        try:
+            self.on_error(data, error)
+        except Exception:
+            logger.exception("Error handler of the writer failed")
@@ -17,10 +17,12 @@ limitations under the License.
 import sys
 import unittest
 import json
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 sys.path.insert(1, "src/")
 from pyclarify.client import JSONRPCClient
+from pyclarify.jsonrpc.client import payload_preview
 from pyclarify.views.generics import Response
 from pyclarify.jsonrpc.oauth2 import Authenticator
 
@@ -80,7 +82,7 @@ class TestJSONRPCClient(unittest.TestCase):
         self.assertEqual(payload_2["id"], 2)
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_send_request_no_iteration(self, client_req_mock, get_token_mock):
 
         payload = self.client.create_payload(
@@ -103,7 +105,7 @@ class TestJSONRPCClient(unittest.TestCase):
         self.assertEqual(response["id"], str(payload["id"]))
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_send_request_one_iteration(self, client_req_mock, get_token_mock):
 
         payload = self.client.create_payload(
@@ -126,7 +128,7 @@ class TestJSONRPCClient(unittest.TestCase):
         self.assertEqual(response["id"], str(payload["id"]))
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_send_request_many_iteration(self, client_req_mock, get_token_mock):
 
         payload = self.client.create_payload(
@@ -149,7 +151,7 @@ class TestJSONRPCClient(unittest.TestCase):
         self.assertEqual(response["id"], str(payload["id"]))
     
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_get_error(self, client_req_mock, get_token_mock):
 
         payload = self.client.create_payload(
@@ -172,10 +174,60 @@ class TestJSONRPCClient(unittest.TestCase):
         self.assertEqual(response["id"], str(payload["id"]))
 
 
+    def test_next_id(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(lambda _: self.client.next_id(), range(1000)))
+        self.assertEqual(sorted(ids), list(range(1, 1001)))
+        self.assertEqual(self.client.current_id, 1000)
+
+    def test_request_headers(self):
+        headers = self.client.request_headers(self.mock_access_token)
+        self.assertEqual(headers["Authorization"], f"Bearer {self.mock_access_token}")
+        self.assertEqual(headers["content-type"], "application/json")
+        self.assertEqual(self.client.request_headers(), self.content_type_headers)
+        # the headers of the client are not modified
+        self.assertEqual(self.client.headers, self.content_type_headers)
+
     def test_authentication(self):
         self.client.authenticate("./tests/mock_data/mock-clarify-credentials.json")
         self.assertIsInstance(self.client.authentication, Authenticator)
-    
+
+    def test_connection_pool(self):
+        client = JSONRPCClient(
+            base_url=self.mock_data["mock_url"], pool_connections=2, pool_maxsize=25
+        )
+        adapter = client.session.get_adapter("https://api.clarify.io/v1/rpc")
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 25)
+
+        # assert authenticator reuses the connection pool of the client
+        client.authenticate("./tests/mock_data/mock-clarify-credentials.json")
+        self.assertIs(client.authentication.session, client.session)
+
+    @patch("pyclarify.jsonrpc.client.requests.Session.close")
+    def test_close(self, close_mock):
+        with JSONRPCClient(base_url=self.mock_data["mock_url"]) as client:
+            self.assertIsInstance(client, JSONRPCClient)
+        close_mock.assert_called_once()
+
+    def test_payload_preview(self):
+        self.assertEqual(payload_preview(b'{"a": 1}'), '{"a": 1}')
+        self.assertEqual(payload_preview(b"x" * 20, length=5), "xxxxx... (20 bytes)")
+        self.assertEqual(payload_preview("x" * 20, length=5), "xxxxx... (20 characters)")
+
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_debug_logging(self, client_req_mock):
+        client_req_mock.return_value.status_code = 200
+        client_req_mock.return_value.content = b"x" * 10000
+
+        with self.assertLogs("pyclarify.jsonrpc.client", level="DEBUG") as logs:
+            self.client.make_request(b"y" * 10000)
+
+        self.assertEqual(len(logs.output), 2)
+        self.assertTrue(all(len(line) < 1000 for line in logs.output))
+        # the response body is only previewed, never decoded
+        client_req_mock.return_value.json.assert_not_called()
+
 
 
 if __name__ == "__main__":
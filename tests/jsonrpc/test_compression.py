@@ -0,0 +1,121 @@
+"""
+Copyright 2023 Clarify
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import gzip
+import io
+import json
+import sys
+import unittest
+import zlib
+from unittest.mock import patch
+
+import requests
+import urllib3
+
+sys.path.insert(1, "src/")
+
+from pyclarify import Client, DataFrame
+from pyclarify.jsonrpc.client import JSONRPCClient
+from pyclarify.jsonrpc.compression import Compression
+from pyclarify.jsonrpc.instrumentation import MetricsCollector
+
+
+class TestCompression(unittest.TestCase):
+    def test_compress(self):
+        body = b'{"times": ["2024-01-01T00:00:00Z", "2024-01-01T00:00:01Z"]}' * 100
+        self.assertEqual(gzip.decompress(Compression().compress(body)), body)
+        self.assertEqual(zlib.decompress(Compression("deflate").compress(body)), body)
+        with self.assertRaises(ValueError):
+            Compression("br")
+
+    def test_threshold(self):
+        client = JSONRPCClient("https://example.com", compression=Compression(threshold=100))
+        payload, headers = client.compress("x" * 99)
+        self.assertEqual(payload, "x" * 99)
+        self.assertIsNone(headers)
+
+        payload, headers = client.compress("x" * 100, {"Authorization": "Bearer token"})
+        self.assertEqual(gzip.decompress(payload), b"x" * 100)
+        self.assertEqual(headers, {"Authorization": "Bearer token", "Content-Encoding": "gzip"})
+
+    def test_received_bytes(self):
+        # requests decompresses the body while reading it, the raw response counts the bytes on the wire
+        body = b'{"jsonrpc": "2.0", "id": 1, "result": null}' * 100
+        compressed = gzip.compress(body)
+        raw = urllib3.HTTPResponse(
+            body=io.BytesIO(compressed),
+            headers={"Content-Encoding": "gzip"},
+            status=200,
+            preload_content=False,
+        )
+        response = requests.adapters.HTTPAdapter().build_response(
+            requests.Request("POST", "https://example.com").prepare(), raw
+        )
+        self.assertEqual(response.content, body)
+        self.assertEqual(JSONRPCClient.received_bytes(response), len(compressed))
+
+
+class TestClientCompression(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(
+            "./tests/mock_data/mock-clarify-credentials.json",
+            compression=Compression(threshold=1024),
+        )
+        self.metrics = MetricsCollector()
+        self.client.add_listener(self.metrics)
+
+        with open("./tests/mock_data/mock-client-common.json") as f:
+            self.mock_access_token = json.load(f)["mock_access_token"]
+
+        with open("./tests/mock_data/dataframe.json") as f:
+            self.insert_response = json.load(f)["insert"]["response"]
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_insert(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value.ok = True
+        client_req_mock.return_value.content = json.dumps(self.insert_response).encode()
+
+        times = [f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}Z" for i in range(600)]
+        self.client.insert(DataFrame(times=times, series={"c5vv12btaf7d0qbk0l0e": [1.5] * 600}))
+
+        kwargs = client_req_mock.call_args.kwargs
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(kwargs["headers"]["Accept-Encoding"], "gzip, deflate")
+        request = json.loads(gzip.decompress(kwargs["data"]))
+        self.assertEqual(request["params"]["data"]["times"][0][:19], "2024-01-01T00:00:00")
+
+        summary = self.metrics.summary()["integration.Insert"]
+        self.assertEqual(summary["sent_bytes"]["sum"], len(kwargs["data"]))
+        self.assertLess(summary["sent_bytes"]["sum"] * 5, summary["request_bytes"]["sum"])
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_small_request(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value.ok = True
+        client_req_mock.return_value.content = json.dumps(self.insert_response).encode()
+
+        self.client.insert(DataFrame(times=["2024-01-01T00:00:00Z"], series={"c5vv12btaf7d0qbk0l0e": [1.0]}))
+
+        kwargs = client_req_mock.call_args.kwargs
+        self.assertNotIn("Content-Encoding", kwargs["headers"])
+        json.loads(kwargs["data"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Copyright 2023 Clarify
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import sys
+import unittest
+import json
+from unittest.mock import patch
+
+sys.path.insert(1, "src/")
+
+from pyclarify import Client
+from pyclarify.fields.constraints import ApiMethod
+from pyclarify.jsonrpc.instrumentation import (
+    Histogram,
+    Instrumentation,
+    Listener,
+    MetricsCollector,
+    RequestEvent,
+    TokenRefreshEvent,
+)
+
+
+class RecordingListener(Listener):
+    def __init__(self):
+        self.events = []
+
+    def request_start(self, event):
+        self.events.append(("start", event))
+
+    def request_end(self, event):
+        self.events.append(("end", event))
+
+    def token_refresh(self, event):
+        self.events.append(("token", event))
+
+
+class TestHistogram(unittest.TestCase):
+    def test_summary(self):
+        histogram = Histogram([1, 2, 4, 8])
+        for value in [0.5, 1.5, 3, 3, 100]:
+            histogram.add(value)
+
+        summary = histogram.summary()
+        self.assertEqual(summary["count"], 5)
+        self.assertEqual(summary["min"], 0.5)
+        self.assertEqual(summary["max"], 100)
+        self.assertEqual(summary["mean"], 108 / 5)
+        self.assertEqual(summary["p50"], 4)
+        self.assertEqual(summary["p99"], 100)
+        self.assertIsNone(Histogram([1]).quantile(0.5))
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_failing_listener(self):
+        class FailingListener(Listener):
+            def request_end(self, event):
+                raise RuntimeError()
+
+        recording = RecordingListener()
+        instrumentation = Instrumentation()
+        instrumentation.add_listener(FailingListener())
+        instrumentation.add_listener(recording)
+
+        with self.assertLogs("pyclarify.jsonrpc.instrumentation", level="ERROR"):
+            instrumentation.end_request(instrumentation.start_request(ApiMethod.insert))
+        self.assertEqual([kind for kind, _ in recording.events], ["start", "end"])
+
+        instrumentation.remove_listener(recording)
+        instrumentation.start_request(ApiMethod.insert)
+        self.assertEqual(len(recording.events), 2)
+
+    def test_metrics_collector(self):
+        metrics = MetricsCollector()
+        event = RequestEvent(ApiMethod.data_frame, page=0)
+        with event.measure("network_time"):
+            pass
+        event.request_bytes = 100
+        event.end_time = event.start_time + 1
+        metrics.request_end(event)
+        metrics.token_refresh(TokenRefreshEvent(duration=0.2, success=False))
+
+        summary = metrics.summary()
+        self.assertEqual(summary["clarify.dataFrame"]["requests"], 1)
+        self.assertEqual(summary["clarify.dataFrame"]["errors"], 0)
+        self.assertEqual(summary["clarify.dataFrame"]["request_bytes"]["sum"], 100)
+        self.assertEqual(summary["clarify.dataFrame"]["total_time"]["max"], 1)
+        self.assertEqual(summary["token_refresh"]["count"], 1)
+        self.assertEqual(summary["token_refresh"]["failed"], 1)
+
+        metrics.reset()
+        self.assertEqual(list(metrics.summary()), ["token_refresh"])
+
+
+class TestClientInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.client = Client("./tests/mock_data/mock-clarify-credentials.json")
+        self.listener = RecordingListener()
+        self.client.add_listener(self.listener)
+
+        with open("./tests/mock_data/dataframe.json") as f:
+            self.response = json.load(f)["data_frame"]["response"]
+
+        with open("./tests/mock_data/authentication.json") as f:
+            self.mock_token = json.load(f)["mock_token"]
+
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_request_events(self, client_req_mock):
+        # the token and rpc requests share the session of the client
+        client_req_mock.return_value.json = lambda: self.mock_token
+        content = json.dumps(self.response).encode()
+        client_req_mock.return_value.ok = True
+        client_req_mock.return_value.status_code = 200
+        client_req_mock.return_value.content = content
+
+        self.client.data_frame(gte="2022-01-01T00:00:00Z", lt="2022-05-01T00:00:00Z")
+
+        kinds = [kind for kind, _ in self.listener.events]
+        self.assertEqual(kinds, ["token"] + ["start", "end"] * 3)
+        ends = [event for kind, event in self.listener.events if kind == "end"]
+        self.assertEqual([event.page for event in ends], [0, 1, 2])
+        for event in ends:
+            self.assertEqual(event.method, ApiMethod.data_frame)
+            self.assertEqual(event.status_code, 200)
+            self.assertEqual(event.response_bytes, len(content))
+            self.assertGreater(event.request_bytes, 0)
+            self.assertGreater(event.validation_time, 0)
+            self.assertIsNone(event.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
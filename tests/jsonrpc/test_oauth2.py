@@ -17,11 +17,14 @@ limitations under the License.
 import sys
 import unittest
 import json
+import threading
+import time
 from unittest.mock import patch
 
 sys.path.insert(1, "src/")
 
-from pyclarify.jsonrpc.oauth2 import Authenticator
+from pyclarify import AsyncClient, Client
+from pyclarify.jsonrpc.oauth2 import Authenticator, Token
 
 
 class TestAuthenticator(unittest.TestCase):
@@ -70,7 +73,7 @@ class TestAuthenticator(unittest.TestCase):
         """
         self.assertRaises(TypeError, Authenticator)
 
-    @patch("pyclarify.jsonrpc.oauth2.requests.post")
+    @patch("pyclarify.jsonrpc.oauth2.requests.Session.post")
     def test_get_token(self, mock_request):
         """
         Test that it can get and update the token
@@ -83,10 +86,92 @@ class TestAuthenticator(unittest.TestCase):
         response = self.gettoken.get_token()
         self.assertEqual(response, self.mock_token["access_token"])
 
-        self.gettoken._expire_token = None
+        self.gettoken.token = None
         response = self.gettoken.get_token()
         self.assertEqual(response, self.mock_token2["access_token"])
 
+    @patch("pyclarify.jsonrpc.oauth2.requests.Session.post")
+    def test_refresh_margin(self, mock_request):
+        """
+        Test that the token is refreshed before it expires
+        """
+        mock_request.return_value.json = lambda: dict(self.mock_token, access_token="first")
+        self.assertEqual(self.gettoken.get_token(), "first")
+        lifetime = self.gettoken.token.expire_at - time.monotonic()
+        self.assertAlmostEqual(lifetime, self.mock_token["expires_in"], delta=1)
+
+        # the token is still valid, but within the refresh margin
+        self.gettoken.token = self.gettoken.token._replace(refresh_at=time.monotonic() - 1)
+        mock_request.return_value.json = lambda: dict(self.mock_token, access_token="second")
+        self.assertEqual(self.gettoken.get_token(), "second")
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("pyclarify.jsonrpc.oauth2.requests.Session.post")
+    def test_single_flight(self, mock_request):
+        """
+        Test that concurrent callers share one refresh
+        """
+
+        def post(*args, **kwargs):
+            time.sleep(0.05)
+            return mock_request.return_value
+
+        mock_request.return_value.json = lambda: self.mock_token
+        mock_request.side_effect = post
+        tokens = []
+        threads = [
+            threading.Thread(target=lambda: tokens.append(self.gettoken.get_token()))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(tokens, [self.mock_token["access_token"]] * 5)
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch("pyclarify.jsonrpc.oauth2.requests.Session.post")
+    def test_background_refresh(self, mock_request):
+        """
+        Test that a background refresh returns the current token while refreshing
+        """
+        token_client = Authenticator(self.credentials_path, background_refresh=True)
+        mock_request.return_value.json = lambda: dict(self.mock_token, access_token="first")
+        self.assertEqual(token_client.get_token(), "first")
+
+        token_client.token = token_client.token._replace(refresh_at=time.monotonic() - 1)
+        mock_request.return_value.json = lambda: dict(self.mock_token, access_token="second")
+        self.assertEqual(token_client.get_token(), "first")
+
+        # wait for the background thread to release the lock
+        with token_client.lock:
+            pass
+        self.assertEqual(token_client.get_token(), "second")
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("pyclarify.jsonrpc.oauth2.requests.Session.post")
+    def test_expired_token(self, mock_request):
+        """
+        Test that an expired token is never returned, also with background refresh
+        """
+        token_client = Authenticator(self.credentials_path, background_refresh=True)
+        now = time.monotonic()
+        token_client.token = Token("expired", refresh_at=now - 2, expire_at=now - 1)
+        mock_request.return_value.json = lambda: dict(self.mock_token, access_token="fresh")
+        self.assertEqual(token_client.get_token(), "fresh")
+        self.assertEqual(token_client.token.access_token, "fresh")
+
+
+    def test_client_options(self):
+        client = Client(self.credentials_path, refresh_margin=30, background_refresh=True)
+        self.assertEqual(client.authentication.refresh_margin, 30)
+        self.assertTrue(client.authentication.background_refresh)
+
+        async_client = AsyncClient(self.credentials_path, refresh_margin=10, background_refresh=True)
+        self.assertEqual(async_client.authentication.refresh_margin, 10)
+        self.assertTrue(async_client.authentication.background_refresh)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,177 @@
+"""
+Copyright 2023 Clarify
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import sys
+import unittest
+import json
+import socket
+import requests
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(1, "src/")
+
+from pyclarify import Client, DataFrame
+from pyclarify.fields.constraints import ApiMethod
+from pyclarify.jsonrpc.instrumentation import Listener
+from pyclarify.jsonrpc.retry import RetryPolicy, RetryBudget, parse_retry_after
+
+
+def mock_response(status_code, content=b"", headers=None):
+    response = MagicMock()
+    response.ok = status_code < 400
+    response.status_code = status_code
+    response.reason = "Error"
+    response.text = content.decode()
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_should_retry(self):
+        policy = RetryPolicy(max_retries=2)
+
+        self.assertTrue(policy.should_retry(ApiMethod.data_frame, 0, 503))
+        self.assertTrue(policy.should_retry(ApiMethod.select_items, 1, None))
+        self.assertFalse(policy.should_retry(ApiMethod.data_frame, 2, 503))
+        self.assertFalse(policy.should_retry(ApiMethod.data_frame, 0, 400))
+
+        # writes are only retried when they were not processed
+        self.assertFalse(policy.should_retry(ApiMethod.insert, 0, 503))
+        self.assertFalse(policy.should_retry(ApiMethod.insert, 0, None))
+        self.assertTrue(policy.should_retry(ApiMethod.insert, 0, 429))
+        self.assertTrue(policy.should_retry(ApiMethod.insert, 0, None, sent=False))
+        self.assertTrue(RetryPolicy(retry_writes=True).should_retry(ApiMethod.insert, 0, 503))
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        self.assertEqual([policy.backoff(i) for i in range(4)], [1, 2, 4, 5])
+        self.assertEqual(policy.backoff(0, retry_after="7"), 7)
+        self.assertIsNone(policy.backoff(0, retry_after="1000"))
+
+        policy = RetryPolicy(backoff_factor=1)
+        for _ in range(20):
+            self.assertTrue(0 <= policy.backoff(2) <= 4)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        self.assertTrue(25 < parse_retry_after(date) <= 30)
+
+    def test_budget(self):
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.5, capacity=1))
+        self.assertTrue(policy.should_retry(ApiMethod.data_frame, 0, 503))
+        self.assertFalse(policy.should_retry(ApiMethod.data_frame, 0, 503))
+        policy.record_request()
+        policy.record_request()
+        self.assertTrue(policy.should_retry(ApiMethod.data_frame, 0, 503))
+
+
+@patch("pyclarify.jsonrpc.client.time.sleep")
+@patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+@patch("pyclarify.jsonrpc.client.requests.Session.post")
+class TestClientRetry(unittest.TestCase):
+    def setUp(self):
+        self.client = Client("./tests/mock_data/mock-clarify-credentials.json")
+
+        with open("./tests/mock_data/dataframe.json") as f:
+            mock_data = json.load(f)
+        self.data_frame_response = json.dumps(mock_data["data_frame"]["response"]).encode()
+        self.insert_args = mock_data["insert"]["args"]
+        self.insert_response = json.dumps(mock_data["insert"]["response"]).encode()
+
+        with open("./tests/mock_data/mock-client-common.json") as f:
+            self.mock_access_token = json.load(f)["mock_access_token"]
+
+    def test_retry_select(self, client_req_mock, get_token_mock, sleep_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.side_effect = [
+            mock_response(503),
+            requests.exceptions.ConnectionError(),
+            mock_response(200, self.data_frame_response),
+        ]
+
+        response_data = self.client.data_frame()
+
+        self.assertIsInstance(response_data.result.data, DataFrame)
+        self.assertEqual(client_req_mock.call_count, 3)
+        self.assertEqual(sleep_mock.call_count, 2)
+
+    def test_retry_after(self, client_req_mock, get_token_mock, sleep_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.side_effect = [
+            mock_response(429, headers={"Retry-After": "2"}),
+            mock_response(200, self.insert_response),
+        ]
+
+        response_data = self.client.insert(DataFrame(**self.insert_args["data"]))
+
+        self.assertIsNone(response_data.error)
+        sleep_mock.assert_called_once_with(2)
+
+    def test_no_retry_insert(self, client_req_mock, get_token_mock, sleep_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.side_effect = [mock_response(503), mock_response(200, self.insert_response)]
+
+        response_data = self.client.insert(DataFrame(**self.insert_args["data"]))
+
+        self.assertEqual(response_data.error.code, 503)
+        self.assertEqual(client_req_mock.call_count, 1)
+        sleep_mock.assert_not_called()
+
+    def test_retries_exhausted(self, client_req_mock, get_token_mock, sleep_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value = mock_response(503)
+
+        response_data = self.client.data_frame()
+
+        self.assertEqual(response_data.error.code, 503)
+        self.assertEqual(client_req_mock.call_count, 4)
+
+
+
+@patch("pyclarify.jsonrpc.client.time.sleep")
+@patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+class TestConnectionRetry(unittest.TestCase):
+    def test_refused_insert(self, get_token_mock, sleep_mock):
+        get_token_mock.return_value = "token"
+        retries = []
+
+        class RetryListener(Listener):
+            def request_retry(self, event):
+                retries.append(event)
+
+        # a port nothing listens on
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        client = Client("./tests/mock_data/mock-clarify-credentials.json", retry_policy=RetryPolicy(max_retries=2))
+        client.base_url = f"http://127.0.0.1:{port}/rpc"
+        client.add_listener(RetryListener())
+
+        # the write never reached the server, so it is sent again
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            client.insert(DataFrame(times=["2024-01-01T00:00:00Z"], series={"a": [1.0]}))
+        self.assertEqual([event.attempt for event in retries], [1, 2])
+        self.assertEqual(sleep_mock.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
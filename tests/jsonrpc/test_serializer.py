@@ -0,0 +1,82 @@
+"""
+Copyright 2023 Clarify
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import sys
+import unittest
+import json
+from unittest.mock import patch
+
+sys.path.insert(1, "src/")
+
+from pyclarify import Client, DataFrame
+from pyclarify.fields.constraints import ApiMethod
+from pyclarify.__utils__.exceptions import ImportError
+from pyclarify.jsonrpc.serializer import JSONSerializer, OrjsonSerializer, default_serializer
+from pyclarify.views.generics import Request, Response, DataSelection
+
+
+class TestSerializer(unittest.TestCase):
+    def setUp(self):
+        with open("./tests/mock_data/dataframe.json") as f:
+            mock_data = json.load(f)
+        self.insert_args = mock_data["insert"]["args"]
+        self.data_frame_response = mock_data["data_frame"]["response"]
+        self.serializers = [JSONSerializer()]
+        try:
+            self.serializers.append(OrjsonSerializer())
+        except ImportError:
+            pass
+
+    def test_dumps_loads(self):
+        for serializer in self.serializers:
+            data = serializer.dumps({"a": [1, 2.5, None]})
+            self.assertIsInstance(data, bytes)
+            self.assertEqual(serializer.loads(data), {"a": [1, 2.5, None]})
+
+    def test_dump_model(self):
+        request = Request(method=ApiMethod.insert, params=self.insert_args)
+
+        for serializer in self.serializers:
+            data = serializer.dump_model(request)
+            self.assertIsInstance(data, bytes)
+            self.assertEqual(json.loads(data), request.model_dump(mode="json"))
+
+    def test_load_model(self):
+        content = json.dumps(self.data_frame_response).encode()
+
+        for serializer in self.serializers:
+            response = serializer.load_model(
+                Response, content, context={"method": ApiMethod.data_frame}
+            )
+            self.assertIsInstance(response.result, DataSelection)
+            self.assertIsInstance(response.result.data, DataFrame)
+            self.assertEqual(
+                response, Response(**self.data_frame_response, method=ApiMethod.data_frame)
+            )
+
+
+    def test_without_orjson(self):
+        # a None entry in sys.modules makes the import fail like an uninstalled package
+        with patch.dict(sys.modules, {"orjson": None}):
+            with self.assertRaises(ImportError):
+                OrjsonSerializer()
+            self.assertIs(type(default_serializer()), JSONSerializer)
+            client = Client("./tests/mock_data/mock-clarify-credentials.json")
+        self.assertIs(type(client.serializer), JSONSerializer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Copyright 2023 Clarify
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import sys
+import unittest
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(1, "src/")
+
+from pyclarify import Client
+from pyclarify.jsonrpc.instrumentation import MetricsCollector
+from pyclarify.jsonrpc.throttle import Throttle
+
+
+class TestThrottle(unittest.TestCase):
+    def test_unlimited(self):
+        throttle = Throttle()
+        for _ in range(100):
+            self.assertEqual(throttle.acquire(), 0)
+        self.assertEqual(throttle.in_flight, 100)
+
+    def test_rate(self):
+        throttle = Throttle(rate=50, burst=2)
+        start = time.monotonic()
+        delays = [throttle.acquire() for _ in range(7)]
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(delays[:2], [0, 0])
+        self.assertTrue(all(delay > 0 for delay in delays[2:]))
+        self.assertGreaterEqual(elapsed, 0.09)
+
+        throttle.set_rate(None)
+        self.assertEqual(throttle.acquire(), 0)
+
+    def test_max_in_flight(self):
+        throttle = Throttle(max_in_flight=1)
+        throttle.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            throttle.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+
+        # raising the limit lets the waiting request through
+        throttle.set_max_in_flight(2)
+        self.assertTrue(acquired.wait(1))
+        thread.join()
+        self.assertEqual(throttle.in_flight, 2)
+
+    def test_acquire_async(self):
+        throttle = Throttle(max_in_flight=2)
+        running = []
+
+        async def request():
+            await throttle.acquire_async()
+            running.append(throttle.in_flight)
+            await asyncio.sleep(0.01)
+            throttle.release()
+
+        async def main():
+            await asyncio.gather(*[request() for _ in range(6)])
+
+        asyncio.run(main())
+        self.assertEqual(len(running), 6)
+        self.assertLessEqual(max(running), 2)
+        self.assertEqual(throttle.in_flight, 0)
+
+
+class TestClientThrottle(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(
+            "./tests/mock_data/mock-clarify-credentials.json",
+            throttle=Throttle(max_in_flight=1),
+        )
+        self.metrics = MetricsCollector()
+        self.client.add_listener(self.metrics)
+
+        with open("./tests/mock_data/dataframe.json") as f:
+            self.content = json.dumps(json.load(f)["data_frame"]["response"]).encode()
+
+        with open("./tests/mock_data/mock-client-common.json") as f:
+            self.mock_access_token = json.load(f)["mock_access_token"]
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_concurrent_pages(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        in_flight = []
+
+        def post(*args, **kwargs):
+            in_flight.append(self.client.throttle.in_flight)
+            time.sleep(0.01)
+            response = MagicMock()
+            response.ok = True
+            response.content = self.content
+            return response
+
+        client_req_mock.side_effect = post
+
+        self.client.data_frame(
+            gte="2022-01-01T00:00:00Z", lt="2022-05-01T00:00:00Z", max_concurrency=3
+        )
+
+        self.assertEqual(in_flight, [1, 1, 1])
+        self.assertEqual(self.client.throttle.in_flight, 0)
+        throttle_time = self.metrics.summary()["clarify.dataFrame"]["throttle_time"]
+        self.assertGreater(throttle_time["count"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Copyright 2023 Clarify
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import sys
+import unittest
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+sys.path.insert(1, "src/")
+
+from pyclarify.jsonrpc.oauth2 import Authenticator
+from pyclarify.jsonrpc.token_cache import FileTokenCache
+
+
+class TestFileTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = FileTokenCache(os.path.join(self.directory.name, "tokens"))
+        self.credentials_path = "./tests/mock_data/mock-clarify-credentials.json"
+
+        with open("./tests/mock_data/authentication.json") as f:
+            self.mock_token = json.load(f)["mock_token"]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_store_load(self):
+        self.assertIsNone(self.cache.load("key"))
+        self.cache.store("key", "token", 3600)
+
+        access_token, expires_in = self.cache.load("key")
+        self.assertEqual(access_token, "token")
+        self.assertAlmostEqual(expires_in, 3600, delta=1)
+
+        mode = os.stat(self.cache.path("key", ".json")).st_mode
+        self.assertEqual(stat.S_IMODE(mode), 0o600)
+        self.assertEqual(os.listdir(self.cache.directory), ["key.json"])
+
+    def test_invalid_entry(self):
+        os.makedirs(self.cache.directory)
+        with open(self.cache.path("key", ".json"), "w") as f:
+            f.write("{")
+        with self.assertLogs("pyclarify.jsonrpc.token_cache", "WARNING"):
+            self.assertIsNone(self.cache.load("key"))
+
+    def test_key(self):
+        authenticator = Authenticator(self.credentials_path)
+        key = self.cache.key(authenticator.credentials)
+        self.assertNotIn(authenticator.credentials.client_secret, key)
+        self.assertEqual(key, self.cache.key(Authenticator(self.credentials_path).credentials))
+
+    @patch("pyclarify.jsonrpc.oauth2.requests.Session.post")
+    def test_shared_token(self, mock_request):
+        mock_request.return_value.json = lambda: self.mock_token
+        first = Authenticator(self.credentials_path, token_cache=self.cache)
+        second = Authenticator(self.credentials_path, token_cache=self.cache)
+
+        self.assertEqual(first.get_token(), self.mock_token["access_token"])
+        self.assertEqual(second.get_token(), self.mock_token["access_token"])
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch("pyclarify.jsonrpc.oauth2.requests.Session.post")
+    def test_expiring_token(self, mock_request):
+        mock_request.return_value.json = lambda: self.mock_token
+        authenticator = Authenticator(self.credentials_path, token_cache=self.cache)
+        key = self.cache.key(authenticator.credentials)
+        self.cache.store(key, "old", authenticator.refresh_margin - 1)
+
+        self.assertEqual(authenticator.get_token(), self.mock_token["access_token"])
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(self.cache.load(key)[0], self.mock_token["access_token"])
+
+    @patch("pyclarify.jsonrpc.oauth2.requests.Session.post")
+    def test_single_flight(self, mock_request):
+        def post(*args, **kwargs):
+            time.sleep(0.05)
+            return mock_request.return_value
+
+        mock_request.return_value.json = lambda: self.mock_token
+        mock_request.side_effect = post
+        authenticators = [
+            Authenticator(self.credentials_path, token_cache=self.cache) for _ in range(4)
+        ]
+        threads = [threading.Thread(target=a.get_token) for a in authenticators]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_request.call_count, 1)
+        for authenticator in authenticators:
+            self.assertEqual(authenticator.access_token, self.mock_token["access_token"])
+
+
+if __name__ == "__main__":
+    unittest.main()
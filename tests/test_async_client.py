@@ -0,0 +1,138 @@
+"""
+Copyright 2023 Clarify
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import sys
+import unittest
+import asyncio
+import json
+from unittest.mock import patch, AsyncMock, MagicMock
+
+sys.path.insert(1, "src/")
+from pyclarify import AsyncClient, DataFrame
+from pyclarify.views.items import ItemSelectView
+from pyclarify.fields.error import Error
+
+
+def mock_http_response(body, status_code=200, reason_phrase="OK"):
+    response = MagicMock()
+    response.is_success = 200 <= status_code < 300
+    response.status_code = status_code
+    response.reason_phrase = reason_phrase
+    response.text = json.dumps(body)
+    response.content = json.dumps(body).encode()
+    return response
+
+
+class TestClarifyAsyncClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = AsyncClient("./tests/mock_data/mock-clarify-credentials.json")
+
+        with open("./tests/mock_data/items.json") as f:
+            self.items_response = json.load(f)["select_items"]["test_cases"][0]["response"]
+
+        with open("./tests/mock_data/dataframe.json") as f:
+            mock_data = json.load(f)
+            self.data_frame_args = mock_data["data_frame"]["args"]
+            self.data_frame_response = mock_data["data_frame"]["response"]
+            self.http_error = mock_data["data_frame"]["http_error"]
+
+        with open("./tests/mock_data/mock-client-common.json") as f:
+            self.mock_access_token = json.load(f)["mock_access_token"]
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_select_items(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value = mock_http_response(self.items_response)
+
+        response_data = await self.client.select_items()
+
+        for x in response_data.result.data:
+            self.assertIsInstance(x, ItemSelectView)
+        headers = client_req_mock.call_args.kwargs["headers"]
+        self.assertEqual(headers["Authorization"], f"Bearer {self.mock_access_token}")
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_concurrent_data_frames(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value = mock_http_response(self.data_frame_response)
+
+        responses = await asyncio.gather(
+            *[self.client.data_frame(**self.data_frame_args) for _ in range(5)]
+        )
+
+        self.assertEqual(len(responses), 5)
+        for response_data in responses:
+            self.assertIsInstance(response_data.result.data, DataFrame)
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_iter_data_frame(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value = mock_http_response(self.data_frame_response)
+
+        data_frames = [
+            data_frame
+            async for data_frame in self.client.iter_data_frame(
+                gte="2022-01-01T00:00:00Z", lt="2022-05-01T00:00:00Z", max_concurrency=2
+            )
+        ]
+
+        self.assertEqual(len(data_frames), 3)
+        for data_frame in data_frames:
+            self.assertIsInstance(data_frame, DataFrame)
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_token_per_page(self, client_req_mock, get_token_mock):
+        get_token_mock.side_effect = [f"token-{i}" for i in range(3)]
+        client_req_mock.return_value = mock_http_response(self.data_frame_response)
+
+        tokens = []
+        async for _ in self.client.iter_data_frame(gte="2022-01-01T00:00:00Z", lt="2022-05-01T00:00:00Z"):
+            tokens.append(client_req_mock.call_args.kwargs["headers"]["Authorization"])
+        self.assertEqual(tokens, [f"Bearer token-{i}" for i in range(3)])
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_http_error(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value = mock_http_response(
+            self.http_error["text"],
+            status_code=self.http_error["status_code"],
+            reason_phrase=self.http_error["reason"],
+        )
+
+        response_data = await self.client.data_frame(**self.data_frame_args)
+        error = response_data.error
+        if isinstance(error, list):
+            error = error[0]
+
+        self.assertIsInstance(error, Error)
+        self.assertEqual(error.code, self.http_error["status_code"])
+        self.assertEqual(error.message, f"HTTP Response Error: {self.http_error['reason']}")
+
+    def test_writer(self):
+        with self.assertRaises(TypeError):
+            self.client.writer()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+"""
+Copyright 2023 Clarify
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import sys
+import unittest
+import json
+from unittest.mock import patch, AsyncMock, MagicMock
+
+sys.path.insert(1, "src/")
+from pyclarify import AsyncClient, Client, DataFrame
+from pyclarify.batch import BatchResult, active_batch
+from pyclarify.fields.error import Error
+from pyclarify.views.items import ItemSelectView
+
+
+class TestClientBatch(unittest.TestCase):
+    def setUp(self):
+        self.client = Client("./tests/mock_data/mock-clarify-credentials.json")
+
+        with open("./tests/mock_data/evaluate.json") as f:
+            self.evaluate_response = json.load(f)["evaluate"]["response"]
+
+        with open("./tests/mock_data/items.json") as f:
+            self.items_response = json.load(f)["select_items"]["test_cases"][0]["response"]
+
+        with open("./tests/mock_data/mock-client-common.json") as f:
+            self.mock_access_token = json.load(f)["mock_access_token"]
+
+        self.evaluate_args = {"rollup": "PT1H", "gte": "2023-10-20T10:00:00Z", "lt": "2023-10-20T11:00:00Z"}
+
+    def batch_response(self, data, reverse=False, skip=0):
+        """
+        Answers every request of a batch payload, in reverse order if asked, leaving out the first skip requests.
+        """
+        responses = []
+        for request in json.loads(data)[skip:]:
+            if request["method"] == "clarify.SelectItems":
+                response = self.items_response
+            else:
+                response = self.evaluate_response
+            responses.append({**response, "id": request["id"]})
+        if reverse:
+            responses.reverse()
+        response = MagicMock()
+        response.ok = True
+        response.content = json.dumps(responses).encode()
+        return response
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_batch(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.side_effect = lambda *args, **kwargs: self.batch_response(kwargs["data"], reverse=True)
+
+        with self.client.batch() as batch:
+            items = self.client.select_items(limit=10)
+            frames = [self.client.evaluate(**self.evaluate_args) for _ in range(3)]
+            self.assertIsInstance(items, BatchResult)
+            self.assertFalse(items.done())
+            with self.assertRaises(RuntimeError):
+                items.result()
+
+        client_req_mock.assert_called_once()
+        payload = json.loads(client_req_mock.call_args.kwargs["data"])
+        self.assertEqual(
+            [request["method"] for request in payload],
+            ["clarify.SelectItems"] + ["clarify.evaluate"] * 3,
+        )
+        self.assertEqual(len({request["id"] for request in payload}), 4)
+        headers = client_req_mock.call_args.kwargs["headers"]
+        self.assertEqual(headers["Authorization"], f"Bearer {self.mock_access_token}")
+
+        # the responses are routed by id, not by position
+        self.assertEqual(batch.calls, [items] + frames)
+        for x in items.result().result.data:
+            self.assertIsInstance(x, ItemSelectView)
+        for frame in frames:
+            self.assertIsInstance(frame.result().result.data, DataFrame)
+            self.assertIsNone(frame.result().error)
+
+        with self.assertRaises(RuntimeError):
+            batch.send()
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_missing_response(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.side_effect = lambda *args, **kwargs: self.batch_response(kwargs["data"], skip=1)
+
+        with self.client.batch():
+            first = self.client.evaluate(**self.evaluate_args)
+            second = self.client.evaluate(**self.evaluate_args)
+
+        self.assertIsInstance(first.result().error, Error)
+        self.assertIsNone(second.result().error)
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_http_error(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value.ok = False
+        client_req_mock.return_value.status_code = 400
+        client_req_mock.return_value.reason = "Bad Request"
+        client_req_mock.return_value.text = "Bad Request"
+
+        with self.client.batch():
+            results = [self.client.evaluate(**self.evaluate_args) for _ in range(2)]
+
+        for result in results:
+            self.assertEqual(result.result().error.code, 400)
+
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_no_batch_after_exception(self, client_req_mock):
+        with self.assertRaises(ValueError):
+            with self.client.batch():
+                self.client.evaluate(**self.evaluate_args)
+                raise ValueError()
+        client_req_mock.assert_not_called()
+
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_async_with(self, client_req_mock):
+        async def main():
+            async with self.client.batch():
+                pass
+
+        with self.assertRaises(TypeError):
+            asyncio.run(main())
+        client_req_mock.assert_not_called()
+
+
+class TestAsyncClientBatch(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = AsyncClient("./tests/mock_data/mock-clarify-credentials.json")
+
+        with open("./tests/mock_data/evaluate.json") as f:
+            self.evaluate_response = json.load(f)["evaluate"]["response"]
+
+        with open("./tests/mock_data/mock-client-common.json") as f:
+            self.mock_access_token = json.load(f)["mock_access_token"]
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_batch(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+
+        def post(*args, **kwargs):
+            response = MagicMock()
+            response.is_success = True
+            response.content = json.dumps(
+                [{**self.evaluate_response, "id": request["id"]} for request in json.loads(kwargs["content"])]
+            ).encode()
+            return response
+
+        client_req_mock.side_effect = post
+
+        async with self.client.batch():
+            results = [
+                await self.client.evaluate(rollup="PT1H", gte="2023-10-20T10:00:00Z", lt="2023-10-20T11:00:00Z")
+                for _ in range(3)
+            ]
+
+        client_req_mock.assert_called_once()
+        for result in results:
+            self.assertIsInstance(result.result().result.data, DataFrame)
+
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_sync_with(self, client_req_mock):
+        with self.assertRaises(TypeError):
+            with self.client.batch():
+                pass
+        # the failed batch is not left open
+        self.assertIsNone(active_batch(self.client))
+        client_req_mock.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
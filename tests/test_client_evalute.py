@@ -52,25 +52,25 @@ class TestClarifyClientSelectItems(unittest.TestCase):
 
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_get_data_with_only_rollup(self, client_req_mock, get_token_mock):
         return_value = self.response
         return_value["result"]["included"] = None
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: return_value
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
 
         response_data = self.client.evaluate(rollup="PT5M")
         self.assertIsInstance(response_data.result.data, DataFrame)
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_get_items_except_included(self, client_req_mock, get_token_mock):
         return_value = self.response
         return_value["result"]["included"] = None
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: return_value
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
 
         response_data = self.client.evaluate(**self.args)
 
@@ -78,12 +78,12 @@ class TestClarifyClientSelectItems(unittest.TestCase):
 
     
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_get_items_with_included(self, client_req_mock, get_token_mock):
         return_value = self.response
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: return_value
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
 
         response_data = self.client.evaluate(**self.args)
 
@@ -93,12 +93,12 @@ class TestClarifyClientSelectItems(unittest.TestCase):
             self.assertIsInstance(x, ItemSelectView)
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_internal_error(self, client_req_mock, get_token_mock):
         return_value = self.error
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: return_value
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
 
         response_data = self.client.evaluate(**self.args)
 
@@ -113,7 +113,7 @@ class TestClarifyClientSelectItems(unittest.TestCase):
         self.assertEqual(error.data.model_dump(), return_value["error"]["data"])
     
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_http_error(self, client_req_mock, get_token_mock):
         return_value = self.http_error
         get_token_mock.return_value = self.mock_access_token
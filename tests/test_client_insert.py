@@ -17,8 +17,9 @@ limitations under the License.
 import sys
 import unittest
 import json
+import threading
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 sys.path.insert(1, "src/")
 from pyclarify.client import Client
@@ -47,11 +48,11 @@ class TestClarifyClientInsert(unittest.TestCase):
         self.values = [0.6, 1.0]
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_send_request(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.insert_response
+        client_req_mock.return_value.content = json.dumps(self.insert_response).encode()
 
         signal_id = "c5vv12btaf7d0qbk0l0e"
         data = DataFrame(series={signal_id: self.values}, times=self.times)
@@ -59,6 +60,46 @@ class TestClarifyClientInsert(unittest.TestCase):
         result = self.client.insert(data)
         self.assertIn(signal_id, result.result.signalsByInput)
 
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_split_insert(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        lock = threading.Lock()
+        payloads = []
+
+        def post(*args, **kwargs):
+            request = json.loads(kwargs["data"])
+            with lock:
+                payloads.append(request)
+            signals = {
+                input_id: {"id": "c5vv12btaf7d0qbk0l0e", "created": len(request["params"]["data"]["times"]) == 2}
+                for input_id in request["params"]["data"]["series"]
+            }
+            response = MagicMock()
+            response.ok = True
+            response.content = json.dumps(
+                {"jsonrpc": "2.0", "id": request["id"], "result": {"signalsByInput": signals}, "error": None}
+            ).encode()
+            return response
+
+        client_req_mock.side_effect = post
+        times = [f"2021-11-01T21:50:{second:02d}Z" for second in range(5)]
+        data = DataFrame(series={"a": [1.0] * 5, "b": [2.0] * 5}, times=times)
+
+        result = self.client.insert(data, max_points=4, max_concurrency=2)
+
+        self.assertEqual(len(payloads), 3)
+        self.assertEqual(sum(len(p["params"]["data"]["times"]) for p in payloads), 5)
+        self.assertEqual(len({p["id"] for p in payloads}), 3)
+        self.assertEqual(list(result.result.signalsByInput), ["a", "b"])
+        self.assertTrue(result.result.signalsByInput["a"].created)
+        self.assertIsNone(result.error)
+
+        # without limits the data frame is sent in one request
+        payloads.clear()
+        self.client.insert(data, max_points=None, max_bytes=None)
+        self.assertEqual(len(payloads), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
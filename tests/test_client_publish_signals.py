@@ -39,22 +39,22 @@ class TestClarifyClientPublishSignals(unittest.TestCase):
         self.mock_access_token = self.mock_data["mock_access_token"]
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_publish_no_item(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[0]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[0]["response"]).encode()
 
         response_data = self.client.publish_signals(signal_ids=[], items=[])
         for x in response_data.result.itemsBySignal:
             self.assertEqual(x, {})
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_publish_one_item(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[1]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[1]["response"]).encode()
 
         response_data = self.client.publish_signals(
             signal_ids=self.signal_ids[:1], items=self.items[:1]
@@ -64,11 +64,11 @@ class TestClarifyClientPublishSignals(unittest.TestCase):
             break
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_publish_multiple_signals(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[1]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[1]["response"]).encode()
 
         response_data = self.client.publish_signals(
             signal_ids=self.signal_ids, items=self.items
@@ -77,22 +77,22 @@ class TestClarifyClientPublishSignals(unittest.TestCase):
             self.assertEqual(x, self.signal_ids[i])
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_publish_without_signal_ids(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[0]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[0]["response"]).encode()
 
         response_data = self.client.publish_signals(signal_ids=[], items=self.items)
         for x in response_data.result.itemsBySignal:
             self.assertEqual(x, {})
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_publish_without_items(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[0]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[0]["response"]).encode()
 
         response_data = self.client.publish_signals(
             signal_ids=self.signal_ids, items=[]
@@ -101,11 +101,11 @@ class TestClarifyClientPublishSignals(unittest.TestCase):
             self.assertEqual(x, {})
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_publish_with_too_many_signal_ids(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[1]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[1]["response"]).encode()
 
         response_data = self.client.publish_signals(
             signal_ids=self.signal_ids * 2, items=self.items
@@ -115,11 +115,11 @@ class TestClarifyClientPublishSignals(unittest.TestCase):
             break
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_publish_with_too_many_items(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[2]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[2]["response"]).encode()
 
         response_data = self.client.publish_signals(
             signal_ids=self.signal_ids, items=self.items * 2
@@ -39,22 +39,22 @@ class TestClarifyClientSaveSignals(unittest.TestCase):
         self.mock_access_token = self.mock_data["mock_access_token"]
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_save_no_signal(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[0]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[0]["response"]).encode()
 
         response_data = self.client.save_signals(input_ids=[], signals=[])
         for x in response_data.result.signalsByInput:
             self.assertEqual(x, {})
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_save_one_signal(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[1]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[1]["response"]).encode()
 
         response_data = self.client.save_signals(
             input_ids=self.input_ids[:1], signals=self.signals[:1]
@@ -64,11 +64,11 @@ class TestClarifyClientSaveSignals(unittest.TestCase):
             break
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_save_multiple_signals(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[1]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[1]["response"]).encode()
 
         response_data = self.client.save_signals(
             input_ids=self.input_ids, signals=self.signals
@@ -77,33 +77,33 @@ class TestClarifyClientSaveSignals(unittest.TestCase):
             self.assertEqual(x, self.input_ids[i])
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_save_without_input_ids(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[0]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[0]["response"]).encode()
 
         response_data = self.client.save_signals(input_ids=[], signals=self.signals)
         for x in response_data.result.signalsByInput:
             self.assertEqual(x, {})
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_save_without_signals(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[0]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[0]["response"]).encode()
 
         response_data = self.client.save_signals(input_ids=self.input_ids, signals=[])
         for x in response_data.result.signalsByInput:
             self.assertEqual(x, {})
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_save_with_too_many_input_ids(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[1]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[1]["response"]).encode()
 
         response_data = self.client.save_signals(
             input_ids=self.input_ids * 2, signals=self.signals
@@ -113,11 +113,11 @@ class TestClarifyClientSaveSignals(unittest.TestCase):
             break
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_save_with_too_many_signals(self, client_req_mock, get_token_mock):
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: self.test_cases[2]["response"]
+        client_req_mock.return_value.content = json.dumps(self.test_cases[2]["response"]).encode()
 
         response_data = self.client.save_signals(
             input_ids=self.input_ids, signals=self.signals * 2
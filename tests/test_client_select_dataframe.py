@@ -17,6 +17,7 @@ limitations under the License.
 import sys
 import unittest
 import json
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 sys.path.insert(1, "src/")
@@ -24,6 +25,7 @@ from pyclarify import Client, DataFrame
 from pyclarify.views.items import ItemSelectView
 from pyclarify.query import Filter
 from pyclarify.fields.error import Error
+from pyclarify.__utils__.exceptions import ResponseError
 
 
 class TestClarifyClientSelectItems(unittest.TestCase):
@@ -43,26 +45,60 @@ class TestClarifyClientSelectItems(unittest.TestCase):
         self.mock_access_token = self.mock_data["mock_access_token"]
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_get_data_with_no_params(self, client_req_mock, get_token_mock):
         return_value = self.response
         return_value["result"]["included"] = None
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: return_value
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
 
         response_data = self.client.data_frame()
 
         self.assertIsInstance(response_data.result.data, DataFrame)
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_shared_between_threads(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value.ok = True
+        client_req_mock.return_value.content = json.dumps(self.response).encode()
+        headers = dict(self.client.headers)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(executor.map(lambda _: self.client.data_frame(), range(20)))
+
+        self.assertEqual(len(responses), 20)
+        ids = [json.loads(call.kwargs["data"])["id"] for call in client_req_mock.call_args_list]
+        self.assertEqual(sorted(ids), list(range(1, 21)))
+        for call in client_req_mock.call_args_list:
+            self.assertEqual(call.kwargs["headers"]["Authorization"], f"Bearer {self.mock_access_token}")
+        # the token is passed per request, not stored on the client
+        self.assertEqual(self.client.headers, headers)
+        self.assertNotIn("Authorization", self.client.headers)
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_token_per_page(self, client_req_mock, get_token_mock):
+        get_token_mock.side_effect = [f"token-{i}" for i in range(3)]
+        client_req_mock.return_value.ok = True
+        client_req_mock.return_value.content = json.dumps(self.response).encode()
+
+        pages = self.client.iter_data_frame(gte="2022-01-01T00:00:00Z", lt="2022-05-01T00:00:00Z")
+        for i, data_frame in enumerate(pages):
+            # a page consumed later is sent with the token current at that time
+            headers = client_req_mock.call_args.kwargs["headers"]
+            self.assertEqual(headers["Authorization"], f"Bearer token-{i}")
+        self.assertEqual(get_token_mock.call_count, 3)
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_get_data_with_filter(self, client_req_mock, get_token_mock):
         return_value = self.response
         return_value["result"]["included"] = None
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: return_value
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
 
         response_data = self.client.data_frame(
             filter=Filter(**self.args["filter"])
@@ -70,13 +106,13 @@ class TestClarifyClientSelectItems(unittest.TestCase):
         self.assertIsInstance(response_data.result.data, DataFrame)
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_get_items_except_included(self, client_req_mock, get_token_mock):
         return_value = self.response
         return_value["result"]["included"] = None
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: return_value
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
 
         response_data = self.client.data_frame(**self.args)
 
@@ -84,12 +120,12 @@ class TestClarifyClientSelectItems(unittest.TestCase):
 
     
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_get_items_with_included(self, client_req_mock, get_token_mock):
         return_value = self.response
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: return_value
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
 
         response_data = self.client.data_frame(**self.args)
 
@@ -99,12 +135,12 @@ class TestClarifyClientSelectItems(unittest.TestCase):
             self.assertIsInstance(x, ItemSelectView)
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_internal_error(self, client_req_mock, get_token_mock):
         return_value = self.error
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: return_value
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
 
         response_data = self.client.data_frame(**self.args)
 
@@ -119,7 +155,7 @@ class TestClarifyClientSelectItems(unittest.TestCase):
         self.assertEqual(error.data.model_dump(), return_value["error"]["data"])
     
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_http_error(self, client_req_mock, get_token_mock):
         return_value = self.http_error
         get_token_mock.return_value = self.mock_access_token
@@ -137,6 +173,70 @@ class TestClarifyClientSelectItems(unittest.TestCase):
         self.assertEqual(error.message, f"HTTP Response Error: {return_value['reason']}")
         self.assertEqual(error.data, return_value["text"])
 
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_concurrent_pages(self, client_req_mock, get_token_mock):
+        return_value = self.response
+        return_value["result"]["included"] = None
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value.ok = True
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
+
+        response_data = self.client.data_frame(
+            gte="2022-01-01T00:00:00Z", lt="2022-05-01T00:00:00Z", max_concurrency=4
+        )
+        self.assertIsInstance(response_data.result.data, DataFrame)
+
+        # assert every 40 day window was requested once
+        windows = sorted(
+            json.loads(call.kwargs["data"])["params"]["data"]["filter"]["times"]["$gte"]
+            for call in client_req_mock.call_args_list
+        )
+        self.assertEqual(len(windows), 3)
+        self.assertEqual(len(set(windows)), 3)
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_iter_data_frame(self, client_req_mock, get_token_mock):
+        return_value = self.response
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value.ok = True
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
+
+        pages = self.client.iter_data_frame(
+            gte="2022-01-01T00:00:00Z", lt="2022-05-01T00:00:00Z", max_concurrency=2
+        )
+        data_frames = list(pages)
+
+        self.assertEqual(len(data_frames), 3)
+        for data_frame in data_frames:
+            self.assertIsInstance(data_frame, DataFrame)
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_iter_data_frame_error(self, client_req_mock, get_token_mock):
+        return_value = self.error
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value.ok = True
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
+
+        with self.assertRaises(ResponseError):
+            next(self.client.iter_data_frame())
+
+    @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
+    def test_trust_responses(self, client_req_mock, get_token_mock):
+        get_token_mock.return_value = self.mock_access_token
+        client_req_mock.return_value.ok = True
+        client_req_mock.return_value.content = json.dumps(self.response).encode()
+
+        validated = self.client.data_frame(**self.args)
+        self.client.trust_responses = True
+        trusted = self.client.data_frame(**self.args)
+
+        self.assertIsInstance(trusted.result.data, DataFrame)
+        self.assertEqual(trusted, validated)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -38,24 +38,24 @@ class TestClarifyClientSelectItems(unittest.TestCase):
         self.mock_access_token = self.mock_data["mock_access_token"]
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_get_all_item_data(self, client_req_mock, get_token_mock):
         test_case = self.test_cases[0]
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: test_case["response"]
+        client_req_mock.return_value.content = json.dumps(test_case["response"]).encode()
 
         response_data = self.client.select_items()
         for x in response_data.result.data:
             self.assertIsInstance(x, ItemSelectView)
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_get_items_metadata_with_filter(self, client_req_mock, get_token_mock):
         test_case = self.test_cases[0]
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: test_case["response"]
+        client_req_mock.return_value.content = json.dumps(test_case["response"]).encode()
 
         response_data = self.client.select_items(
             filter=Filter(**test_case["args"]["filter"])
@@ -65,12 +65,12 @@ class TestClarifyClientSelectItems(unittest.TestCase):
             self.assertIsInstance(x, ItemSelectView)
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_get_items_metadata_with_all(self, client_req_mock, get_token_mock):
         test_case = self.test_cases[0]
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: test_case["response"]
+        client_req_mock.return_value.content = json.dumps(test_case["response"]).encode()
 
         response_data = self.client.select_items(**test_case["args"])
 
@@ -78,12 +78,12 @@ class TestClarifyClientSelectItems(unittest.TestCase):
             self.assertIsInstance(x, ItemSelectView)
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_get_1100_items_metadata_only(self, client_req_mock, get_token_mock):
         test_case = self.test_cases[2]
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: test_case["response"]
+        client_req_mock.return_value.content = json.dumps(test_case["response"]).encode()
 
         response_data = self.client.select_items(**test_case["args"])
 
@@ -40,13 +40,13 @@ class TestClarifyClientSelectSignals(unittest.TestCase):
         self.mock_access_token = self.mock_data["mock_access_token"]
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_no_arguments(self, client_req_mock, get_token_mock):
         return_value = self.response
         return_value["result"]["included"] = None
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: return_value
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
 
         response_data = self.client.select_signals()
 
@@ -55,13 +55,13 @@ class TestClarifyClientSelectSignals(unittest.TestCase):
 
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_all_arguments(self, client_req_mock, get_token_mock):
         return_value = self.response
         return_value["result"]["included"] = None
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: return_value
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
 
         response_data = self.client.select_signals(**self.args)
 
@@ -69,12 +69,12 @@ class TestClarifyClientSelectSignals(unittest.TestCase):
             self.assertIsInstance(signal, SignalSelectView)
 
     @patch("pyclarify.jsonrpc.oauth2.Authenticator.get_token")
-    @patch("pyclarify.client.requests.post")
+    @patch("pyclarify.jsonrpc.client.requests.Session.post")
     def test_all_arguments_with_included(self, client_req_mock, get_token_mock):
         return_value = self.response
         get_token_mock.return_value = self.mock_access_token
         client_req_mock.return_value.ok = True
-        client_req_mock.return_value.json = lambda: return_value
+        client_req_mock.return_value.content = json.dumps(return_value).encode()
 
         response_data = self.client.select_signals(**self.args)
 
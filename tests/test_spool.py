@@ -0,0 +1,181 @@
+"""
+Copyright 2023 Clarify
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(1, "src/")
+from pyclarify import DataFrame
+from pyclarify.fields.error import Error
+from pyclarify.spool import Spool, decode, encode
+from pyclarify.writer import BufferedWriter
+
+
+def frame(start, rows=3):
+    return DataFrame(
+        times=[f"2024-01-01T00:00:{start + i:02d}Z" for i in range(rows)],
+        series={"a": [float(start + i) for i in range(rows)], "b": [None] + [1.0] * (rows - 1)},
+    )
+
+
+class TestSpool(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = self.directory.name
+
+    def segment_files(self):
+        return sorted(name for name in os.listdir(self.path) if name.endswith(".seg"))
+
+    def test_encode_decode(self):
+        data = frame(0)
+        decoded = decode(encode(data))
+        self.assertEqual(decoded.series, data.series)
+        self.assertEqual(len(decoded.times), 3)
+        self.assertEqual(decoded.times, data.times)
+
+    def test_append_ack(self):
+        spool = Spool(self.path, fsync=False)
+        first = spool.append(frame(0))
+        second = spool.append(frame(10))
+        self.assertEqual(len(spool), 2)
+
+        (record, data), *_ = spool.pending()
+        self.assertEqual(record, first)
+        self.assertEqual(data.series["a"], [0.0, 1.0, 2.0])
+        with self.assertRaises(ValueError):
+            spool.ack(second)
+
+        spool.ack(first)
+        self.assertEqual([record for record, _ in spool.pending()], [second])
+        spool.ack(second)
+        self.assertEqual(len(spool), 0)
+        self.assertEqual(spool.size, 0)
+        self.assertEqual(self.segment_files(), [])
+        spool.close()
+
+    def test_reopen(self):
+        spool = Spool(self.path, fsync=False)
+        first = spool.append(frame(0))
+        spool.append(frame(10))
+        spool.append(frame(20))
+        spool.ack(first)
+        spool.close()
+
+        # a record cut off while being written is dropped
+        (segment,) = self.segment_files()
+        with open(os.path.join(self.path, segment), "ab") as f:
+            f.write(b"\x10\x00\x00\x00garbage")
+
+        spool = Spool(self.path, fsync=False)
+        batches = [data.series["a"][0] for _, data in spool.pending()]
+        self.assertEqual(batches, [10.0, 20.0])
+        spool.append(frame(30))
+        spool.close()
+
+        spool = Spool(self.path, fsync=False)
+        batches = [data.series["a"][0] for _, data in spool.pending()]
+        self.assertEqual(batches, [10.0, 20.0, 30.0])
+        spool.close()
+
+    def test_segments(self):
+        size = len(encode(frame(0))) + 8
+        spool = Spool(self.path, segment_bytes=2 * size, fsync=False)
+        records = [spool.append(frame(i)) for i in range(5)]
+        self.assertEqual(len(self.segment_files()), 3)
+
+        # segments are deleted once all their records are acknowledged
+        for record in records[:3]:
+            spool.ack(record)
+        self.assertEqual(len(self.segment_files()), 2)
+        self.assertEqual(spool.size, 3 * size)
+        spool.close()
+
+    def test_max_bytes(self):
+        size = len(encode(frame(0))) + 8
+        spool = Spool(self.path, max_bytes=4 * size, segment_bytes=2 * size, fsync=False)
+        for i in range(5):
+            spool.append(frame(i))
+        # the oldest segment is dropped to make room
+        self.assertLessEqual(spool.size, 4 * size)
+        self.assertEqual(spool.dropped, 2)
+        self.assertEqual([data.series["a"][0] for _, data in spool.pending()], [2.0, 3.0, 4.0])
+        spool.close()
+
+
+class TestSpooledWriter(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.client = MagicMock()
+        self.client.insert.return_value.error = None
+
+    def test_replay(self):
+        self.client.insert.side_effect = ConnectionError("offline")
+        spool = Spool(self.directory.name, fsync=False)
+        writer = BufferedWriter(self.client, max_delay=60, spool=spool, retry_interval=0.05)
+        self.addCleanup(writer.close)
+        writer.write("a", 1, 1.0)
+        self.assertTrue(writer.flush(timeout=5))
+        writer.write("a", 2, 2.0)
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual(len(spool), 2)
+        # the spooled batches are not converted to lists
+        self.assertTrue(all(call.args[0].is_columnar for call in self.client.insert.call_args_list))
+
+        # batches are sent in order once the connection is back
+        self.client.insert.side_effect = None
+        deadline = time.monotonic() + 5
+        while len(spool) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(spool), 0)
+        values = [call.args[0].series["a"] for call in self.client.insert.call_args_list[-2:]]
+        self.assertEqual(values, [[1.0], [2.0]])
+
+    def test_rejected(self):
+        error = Error(code=-32602, message="Invalid params")
+        self.client.insert.return_value.error = error
+        on_error = MagicMock()
+        spool = Spool(self.directory.name, fsync=False)
+        with BufferedWriter(self.client, spool=spool, on_error=on_error) as writer:
+            writer.write("a", 1, 1.0)
+        # batches rejected by the API are not retried
+        self.assertEqual(len(spool), 0)
+        on_error.assert_called_once()
+        self.assertIs(on_error.call_args.args[1], error)
+
+    def test_restart(self):
+        self.client.insert.side_effect = ConnectionError("offline")
+        with BufferedWriter(self.client, spool=Spool(self.directory.name, fsync=False)) as writer:
+            writer.write("a", 1, 1.0)
+
+        self.client.insert.side_effect = None
+        self.client.insert.reset_mock()
+        spool = Spool(self.directory.name, fsync=False)
+        self.assertEqual(len(spool), 1)
+        with BufferedWriter(self.client, spool=spool):
+            pass
+        self.assertEqual(len(spool), 0)
+        (call,) = self.client.insert.call_args_list
+        self.assertEqual(call.args[0].series["a"], [1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Copyright 2023 Clarify
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import sys
+import unittest
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+sys.path.insert(1, "src/")
+from pyclarify import DataFrame
+from pyclarify.fields.error import Error
+from pyclarify.writer import BufferedWriter, BufferFullError, coalesce
+
+
+class TestBufferedWriter(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.insert.return_value.error = None
+
+    def inserted(self):
+        return [call.args[0] for call in self.client.insert.call_args_list]
+
+    def test_coalesce(self):
+        data = coalesce({"a": ([2, 1, 2], [1.0, 2.0, 3.0]), "b": ([3], [4.0])})
+        times, series = data.to_arrays()
+        self.assertEqual(times.tolist(), [1, 2, 3])
+        self.assertEqual(series["a"][:2].tolist(), [2.0, 3.0])
+        self.assertEqual(data.series["b"], [None, None, 4.0])
+
+    def test_flush(self):
+        writer = BufferedWriter(self.client, max_delay=60)
+        writer.write("a", datetime(2024, 1, 1, tzinfo=timezone.utc), 1.0)
+        writer.write("a", "2024-01-01T00:00:01Z", None)
+        writer.write_many("b", [1704067200 * 10**9, 1704067202 * 10**9], [3.0, 4.0])
+        self.client.insert.assert_not_called()
+
+        self.assertTrue(writer.flush(timeout=5))
+        (data,) = self.inserted()
+        self.assertIsInstance(data, DataFrame)
+        self.assertEqual(len(data.times), 3)
+        self.assertEqual(data.series["a"], [1.0, None, None])
+        self.assertEqual(data.series["b"], [3.0, None, 4.0])
+
+        # nothing is buffered, flushing again does not insert
+        self.assertTrue(writer.flush(timeout=5))
+        writer.close()
+        self.assertEqual(len(self.inserted()), 1)
+
+    def test_max_points(self):
+        writer = BufferedWriter(self.client, max_points=10, max_delay=60)
+        writer.write_many("a", list(range(10)), [1.0] * 10)
+        deadline = time.monotonic() + 5
+        while not self.client.insert.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        (data,) = self.inserted()
+        self.assertEqual(len(data.times), 10)
+        writer.close()
+
+    def test_max_delay(self):
+        writer = BufferedWriter(self.client, max_delay=0.05)
+        writer.write("a", 1, 1.0)
+        deadline = time.monotonic() + 5
+        while not self.client.insert.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.client.insert.assert_called_once()
+        writer.close()
+
+    def test_backpressure(self):
+        release = threading.Event()
+        self.client.insert.side_effect = lambda *args, **kwargs: release.wait(5) and MagicMock(error=None)
+        writer = BufferedWriter(self.client, max_points=2, max_pending=4, max_delay=60)
+        writer.write_many("a", [1, 2], [1.0, 2.0])
+        writer.write_many("a", [3, 4], [3.0, 4.0])
+
+        with self.assertRaises(BufferFullError):
+            writer.write("a", 5, 5.0, timeout=0.05)
+
+        release.set()
+        writer.write("a", 5, 5.0, timeout=5)
+        writer.close()
+        self.assertEqual(sum(len(data.times) for data in self.inserted()), 5)
+
+    def test_errors(self):
+        errors = []
+        self.client.insert.return_value.error = Error(code=500, message="Internal error")
+        writer = BufferedWriter(self.client, on_error=lambda data, error: errors.append((data, error)))
+        writer.write("a", 1, 1.0)
+        writer.flush(timeout=5)
+        (data, error), = errors
+        self.assertEqual(data.series, {"a": [1.0]})
+        self.assertEqual(error.code, 500)
+
+        self.client.insert.side_effect = ConnectionError()
+        writer.write("a", 2, 1.0)
+        writer.flush(timeout=5)
+        self.assertIsInstance(errors[1][1], ConnectionError)
+        writer.close()
+
+        with self.assertRaises(RuntimeError):
+            writer.write("a", 3, 1.0)
+
+    def test_invalid_input_id(self):
+        with BufferedWriter(self.client) as writer:
+            with self.assertRaises(ValueError):
+                writer.write("invalid input id!", 1, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
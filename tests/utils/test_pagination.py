@@ -2,7 +2,11 @@ import unittest
 import sys
 
 sys.path.insert(1, "src/")
-from pyclarify.__utils__.pagination import TimeIterator, SegmentIterator
+from pyclarify.__utils__.pagination import TimeIterator, SegmentIterator, SelectIterator, Page
+from pyclarify.fields.constraints import ApiMethod
+from pyclarify.query.filter import DataFilter
+from pyclarify.query.query import DataQuery, ResourceQuery
+from pyclarify.views.generics import Request
 import datetime
 
 
@@ -107,5 +111,56 @@ class TestPagination(unittest.TestCase):
             next(dates_iter)
 
 
+class TestSelectIterator(unittest.TestCase):
+    def setUp(self):
+        data_filter = DataFilter(gte="2020-10-06T17:48:04Z", lt="2021-01-10T21:50:06Z")
+        self.request = Request(
+            method=ApiMethod.data_frame,
+            params={
+                "query": ResourceQuery(limit=120, skip=0),
+                "data": DataQuery(filter=data_filter.to_query(), rollup=None),
+            },
+        )
+        self.original = self.request.model_dump()
+
+    def test_pages(self):
+        pages = list(SelectIterator(self.request).pages())
+
+        # 3 item segments times 3 time windows
+        self.assertEqual(len(pages), 9)
+        self.assertEqual([page.index for page in pages], list(range(9)))
+        self.assertEqual([(p.skip, p.limit) for p in pages[::3]], [(0, 50), (50, 50), (100, 20)])
+        self.assertEqual(
+            pages[1].gte,
+            datetime.datetime(2020, 11, 15, 17, 48, 4, tzinfo=datetime.timezone.utc),
+        )
+        self.assertIsInstance(pages[0], Page)
+
+    def test_requests_are_independent(self):
+        requests = list(SelectIterator(self.request))
+
+        self.assertEqual(len(requests), 9)
+        self.assertEqual(len({id(r) for r in requests}), 9)
+        self.assertEqual(requests[0].params.query.skip, 0)
+        self.assertEqual(requests[-1].params.query.skip, 100)
+        self.assertEqual(requests[-1].params.query.limit, 20)
+        self.assertNotEqual(
+            requests[0].params.data.filter["times"], requests[1].params.data.filter["times"]
+        )
+
+        # assert the original request is left untouched
+        self.assertEqual(self.request.model_dump(), self.original)
+
+    def test_select_items_pages(self):
+        request = Request(
+            method=ApiMethod.select_items,
+            params={"query": ResourceQuery(limit=2500, skip=10)},
+        )
+        pages = list(SelectIterator(request).pages())
+
+        self.assertEqual([(p.skip, p.limit) for p in pages], [(10, 1000), (1010, 1000), (2010, 500)])
+        self.assertTrue(all(p.gte is None and p.lt is None for p in pages))
+
+
 if __name__ == "__main__":
     unittest.main()
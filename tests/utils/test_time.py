@@ -2,7 +2,7 @@ import unittest
 import sys
 
 sys.path.insert(1, "src/")
-from pyclarify.__utils__.time import is_datetime
+from pyclarify.__utils__.time import is_datetime, parse_datetime, parse_datetimes
 import datetime
 import numpy as np
 
@@ -34,5 +34,13 @@ class TestTime(unittest.TestCase):
         # Timestamp of < 2122
         self.assertTrue(is_datetime(4799999999))
 
+    def test_parse_datetimes(self):
+        times = ["2020-01-01T00:00:00Z", "2020-01-01T01:00:00.5+02:00"]
+        self.assertEqual(parse_datetimes(times), [parse_datetime(t) for t in times])
+
+        # falls back to parse_datetime for formats not in ISO 8601
+        times = ["2020-01-01T00:00:00.123456789Z", 1577836800]
+        self.assertEqual(parse_datetimes(times), [parse_datetime(t) for t in times])
+
 if __name__ == "__main__":
     unittest.main()
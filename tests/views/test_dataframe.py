@@ -1,9 +1,10 @@
 import unittest
 import sys
 import json
+from unittest.mock import patch
 from pydantic import ValidationError
 sys.path.insert(1, "src/")
-from pyclarify.views.dataframe import DataFrame, InsertParams, InsertResponse, CreateSummary
+from pyclarify.views.dataframe import DataFrame, InsertParams, InsertResponse, CreateSummary, epoch_ns_to_strings
 from pyclarify.__utils__.auxiliary import local_import
 from pyclarify.__utils__.time import parse_datetime
 
@@ -63,6 +64,27 @@ class TestMerge(unittest.TestCase):
 
         self.assertEqual(merged, self.cdf)
 
+    def test_merge_overlapping_unsorted_input(self):
+        df1 = DataFrame(
+            series={"INPUT_ID_1": [2, 1], "INPUT_ID_2": [4, 3]},
+            times=["2021-11-02T21:50:06Z", "2021-11-01T21:50:06Z"],
+        )
+        df2 = DataFrame(
+            series={"INPUT_ID_1": [5, 6], "INPUT_ID_3": [7, 8]},
+            times=["2021-11-01T21:50:06Z", "2021-11-03T21:50:06Z"],
+        )
+        merged = DataFrame.merge([df1, df2])
+
+        self.assertEqual(
+            merged.times,
+            [parse_datetime(f"2021-11-0{day}T21:50:06Z") for day in [1, 2, 3]],
+        )
+        # last data frame overwrites the first on overlapping timestamps
+        self.assertEqual(merged.series["INPUT_ID_1"], [5, 2, 6])
+        self.assertEqual(merged.series["INPUT_ID_2"], [3, 4, None])
+        self.assertEqual(merged.series["INPUT_ID_3"], [7, None, 8])
+        self.assertEqual(merged, df1 + df2)
+
 
 class TestPandas(unittest.TestCase):
     def setUp(self):
@@ -93,6 +115,20 @@ class TestPandas(unittest.TestCase):
             },
         )
 
+    def test_edit_from_pandas(self):
+        pdf = self.pd.DataFrame(
+            {"a": [1.0, 2.0]},
+            index=self.pd.to_datetime(["2021-11-01T21:50:06Z", "2021-11-02T21:50:06Z"]),
+        )
+        df = DataFrame.from_pandas(pdf)
+        df.series["a"][0] = 99.0
+        df.times.append(parse_datetime("2021-11-03T21:50:06Z"))
+        df.series["a"].append(3.0)
+
+        data = json.loads(InsertParams(integration="c618rbfqfsj7mjkj0ss1", data=df).model_dump_json())["data"]
+        self.assertEqual(len(data["times"]), 3)
+        self.assertEqual(data["series"], {"a": [99.0, 2.0, 3.0]})
+
     def test_convert_single_signal(self):
         df = self.cdf.to_pandas()
 
@@ -408,6 +444,19 @@ class TestInsertResponse(unittest.TestCase):
         except ValidationError:
             self.fail("InsertResponse raised ValidationError unexpectedly!")
 
+    def test_merge(self):
+        first = InsertResponse(signalsByInput={"a": {"id": "c5vv12btaf7d0qbk0l0e", "created": False}})
+        second = InsertResponse(
+            signalsByInput={
+                "a": {"id": "c5vv12btaf7d0qbk0l0e", "created": True},
+                "b": {"id": "c5vv12btaf7d0qbk0l0g", "created": False},
+            }
+        )
+        merged = InsertResponse.merge([first, second])
+        self.assertEqual(list(merged.signalsByInput), ["a", "b"])
+        self.assertTrue(merged.signalsByInput["a"].created)
+        self.assertFalse(merged.signalsByInput["b"].created)
+
 
 class TestInsertParams(unittest.TestCase):
     def setUp(self):
@@ -432,5 +481,259 @@ class TestInsertParams(unittest.TestCase):
         with self.assertRaises(ValidationError):
             InsertParams(data="string")
 
+class TestColumnar(unittest.TestCase):
+    def setUp(self):
+        self.np = local_import("numpy")
+        self.times = ["2021-11-01T21:50:06Z", "2021-11-02T21:50:06Z"]
+        self.cdf = DataFrame.from_arrays(
+            times=self.np.array(
+                ["2021-11-01T21:50:06", "2021-11-02T21:50:06"], dtype="datetime64[ns]"
+            ),
+            series={"INPUT_ID_1": self.np.array([1.0, self.np.nan])},
+        )
+
+    def test_model_api(self):
+        self.assertTrue(self.cdf.is_columnar)
+        self.assertEqual(self.cdf.times, [parse_datetime(t) for t in self.times])
+        self.assertEqual(self.cdf.series, {"INPUT_ID_1": [1.0, None]})
+        self.assertEqual(
+            self.cdf, DataFrame(times=self.times, series={"INPUT_ID_1": [1, None]})
+        )
+
+    def test_edit_in_place(self):
+        self.cdf.series["INPUT_ID_1"][0] = 99.0
+        self.cdf.times.append(parse_datetime("2021-11-03T21:50:06Z"))
+        self.cdf.series["INPUT_ID_1"].append(3.0)
+
+        # the lists replace the arrays once they are created
+        self.assertFalse(self.cdf.is_columnar)
+        data = json.loads(self.cdf.model_dump_json())
+        self.assertEqual(len(data["times"]), 3)
+        self.assertEqual(data["series"], {"INPUT_ID_1": [99.0, None, 3.0]})
+
+    def test_fields(self):
+        self.assertEqual(self.cdf.model_fields_set, {"times", "series"})
+        self.assertIn("INPUT_ID_1", repr(self.cdf))
+        self.assertTrue(self.cdf.is_columnar)
+        self.assertEqual(dict(self.cdf), {"times": self.cdf.times, "series": self.cdf.series})
+
+    def test_arrays_round_trip(self):
+        times, series = self.cdf.to_arrays()
+        self.assertEqual(times.dtype, self.np.int64)
+        self.assertEqual(times[0], 1635803406 * 10**9)
+        self.assertTrue(self.np.isnan(series["INPUT_ID_1"][1]))
+
+        df = DataFrame(times=self.times, series={"INPUT_ID_1": [1, None]})
+        list_times, list_series = df.to_arrays()
+        self.assertTrue((list_times == times).all())
+        self.assertTrue(self.np.isnan(list_series["INPUT_ID_1"][1]))
+
+    def test_invalid_arrays(self):
+        with self.assertRaises(ValueError):
+            DataFrame.from_arrays(self.cdf.to_arrays()[0], {"INPUT_ID_1": [1.0]})
+        with self.assertRaises(ValidationError):
+            DataFrame.from_arrays(self.cdf.to_arrays()[0], {"invalid id!": [1.0, 2.0]})
+
+    def test_insert_serialization(self):
+        params = InsertParams(integration="c618rbfqfsj7mjkj0ss1", data=self.cdf)
+        data = json.loads(params.model_dump_json())["data"]
+
+        self.assertEqual(
+            [parse_datetime(t) for t in data["times"]],
+            [parse_datetime(t) for t in self.times],
+        )
+        self.assertEqual(data["series"], {"INPUT_ID_1": [1.0, None]})
+
+    def test_merge(self):
+        df = DataFrame(
+            times=["2021-11-02T21:50:06Z", "2021-11-03T21:50:06Z"],
+            series={"INPUT_ID_1": [5, 6], "INPUT_ID_2": [7, 8]},
+        )
+        merged = DataFrame.merge([self.cdf, df])
+        expected = DataFrame.merge(
+            [DataFrame(times=self.times, series={"INPUT_ID_1": [1, None]}), df]
+        )
+
+        self.assertTrue(merged.is_columnar)
+        self.assertFalse(expected.is_columnar)
+        self.assertEqual(merged, expected)
+        self.assertEqual(merged.series["INPUT_ID_1"], [1.0, 5.0, 6.0])
+        self.assertEqual(merged.series["INPUT_ID_2"], [None, 7.0, 8.0])
+
+    def test_to_pandas(self):
+        pd = local_import("pandas")
+        df = self.cdf.to_pandas()
+
+        self.assertEqual(list(df.index), list(pd.to_datetime(self.times)))
+        self.assertEqual(str(df.index.tz), "UTC")
+        self.assertEqual(df["INPUT_ID_1"].dtype, self.np.float64)
+
+        # columnar data frames are not copied
+        times, series = self.cdf.to_arrays()
+        self.assertTrue(self.np.shares_memory(df.index.asi8, times))
+        self.assertTrue(self.np.shares_memory(df["INPUT_ID_1"].to_numpy(), series["INPUT_ID_1"]))
+
+    def test_to_pandas_from_lists(self):
+        pd = local_import("pandas")
+        df = DataFrame(
+            times=["2021-11-01T23:50:06+02:00", "2021-11-02T21:50:06Z"],
+            series={"INPUT_ID_1": [1, None]},
+        ).to_pandas()
+
+        self.assertEqual(list(df.index), list(pd.to_datetime(self.times)))
+        self.assertEqual(str(df.index.tz), "UTC")
+        self.assertEqual(df["INPUT_ID_1"].dtype, self.np.float64)
+        self.assertTrue(self.np.isnan(df["INPUT_ID_1"].iloc[1]))
+
+    def test_from_pandas(self):
+        pd = local_import("pandas")
+        index = pd.to_datetime(self.times).tz_convert("Europe/Oslo")
+        df = DataFrame.from_pandas(
+            pd.DataFrame({"INPUT_ID_1": [1, None]}, index=index)
+        )
+
+        self.assertTrue(df.is_columnar)
+        self.assertEqual(df, self.cdf)
+
+    def test_from_pandas_time_column(self):
+        pd = local_import("pandas")
+        with self.assertWarns(UserWarning):
+            df = DataFrame.from_pandas(
+                pd.DataFrame({"INPUT_ID_1": [1.0, self.np.nan], "timestamps": self.times})
+            )
+
+        self.assertEqual(df, self.cdf)
+
+    def test_assign_fields(self):
+        self.cdf.series = {"INPUT_ID_1": [2.0, 3.0]}
+
+        self.assertFalse(self.cdf.is_columnar)
+        self.assertEqual(len(self.cdf.times), 2)
+        self.assertEqual(self.cdf.series, {"INPUT_ID_1": [2.0, 3.0]})
+
+
+class TestSplit(unittest.TestCase):
+    def setUp(self):
+        self.np = local_import("numpy")
+        self.times = self.np.arange(10, dtype=self.np.int64) * 10**9
+        self.df = DataFrame.from_arrays(
+            self.times,
+            {
+                "a": self.np.arange(10, dtype=float),
+                "b": self.np.where(self.np.arange(10) < 5, 1.0, self.np.nan),
+                "c": self.np.where(self.np.arange(10) >= 5, 2.0, self.np.nan),
+            },
+        )
+
+    def assert_round_trip(self, parts):
+        times, series = DataFrame.merge(parts).to_arrays()
+        expected_times, expected_series = self.df.to_arrays()
+        self.np.testing.assert_array_equal(times, expected_times)
+        self.assertEqual(set(series), set(expected_series))
+        for input_id, values in expected_series.items():
+            self.np.testing.assert_array_equal(series[input_id], values)
+
+    def test_within_limits(self):
+        self.assertEqual(self.df.split(), [self.df])
+        self.assertEqual(self.df.split(max_points=30, max_bytes=10000), [self.df])
+        small = DataFrame(series={"a": [1.0]}, times=["2021-11-01T21:50:06Z"])
+        self.assertIs(small.split(max_points=1)[0], small)
+
+    def test_split_by_time(self):
+        parts = self.df.split(max_points=12)
+        self.assertEqual([len(part.to_arrays()[0]) for part in parts], [4, 4, 2])
+        for part in parts:
+            self.assertEqual(list(part.series), ["a", "b", "c"])
+        self.assert_round_trip(parts)
+
+    def test_split_by_series(self):
+        parts = self.df.split(max_points=2)
+        for part in parts:
+            times, series = part.to_arrays()
+            self.assertLessEqual(len(times) * len(series), 2)
+        # rows where the series of a part have no values are left out
+        c_rows = sum(len(part.to_arrays()[0]) for part in parts if list(part.series) == ["c"])
+        self.assertEqual(c_rows, 5)
+        self.assertEqual(list(parts[0].series), ["a", "b"])
+        self.assert_round_trip(parts)
+
+    def test_split_by_bytes(self):
+        parts = self.df.split(max_bytes=250)
+        for part in parts:
+            times, series = part.to_arrays()
+            self.assertLessEqual(len(times) * (30 + 25 * len(series)), 250)
+        self.assert_round_trip(parts)
+
+    def test_split_lists(self):
+        df = DataFrame(series={"a": [1.0, None, 3.0]}, times=[0, 1, 2])
+        parts = df.split(max_points=2)
+        self.assertEqual([part.series for part in parts], [{"a": [1.0, None]}, {"a": [3.0]}])
+
+    def test_split_lists_without_numpy(self):
+        df = DataFrame(times=self.df.times, series=self.df.series)
+        for limits in [{"max_points": 12}, {"max_points": 2}, {"max_bytes": 250}]:
+            expected = [(part.times, part.series) for part in df.split(**limits)]
+            with patch.dict(sys.modules, {"numpy": None}):
+                parts = df.split(**limits)
+            self.assertFalse(any(part.is_columnar for part in parts))
+            self.assertEqual([(part.times, part.series) for part in parts], expected)
+
+
+class TestTimeEncoding(unittest.TestCase):
+    def setUp(self):
+        self.np = local_import("numpy")
+
+    def test_shortest_form(self):
+        times = self.np.array(
+            [0, 1_500_000, 2_000_000_001, 86_400 * 10**9 - 1_000, -1_000, 1_250_000_000], dtype=self.np.int64
+        )
+        self.assertEqual(
+            epoch_ns_to_strings(times),
+            [
+                "1970-01-01T00:00:00Z",
+                "1970-01-01T00:00:00.001500Z",
+                "1970-01-01T00:00:02Z",
+                "1970-01-01T23:59:59.999999Z",
+                "1969-12-31T23:59:59.999999Z",
+                "1970-01-01T00:00:01.250Z",
+            ],
+        )
+        self.assertEqual(epoch_ns_to_strings(self.np.array([], dtype=self.np.int64)), [])
+
+    def test_matches_numpy(self):
+        # unsorted times over several days, with and without fractions of a second
+        times = self.np.random.default_rng(1).integers(16 * 10**17, 17 * 10**17, 1000) // 1000 * 1000
+        times[::3] = times[::3] // 10**9 * 10**9
+        self.assertEqual(
+            [parse_datetime(t) for t in epoch_ns_to_strings(times)],
+            [parse_datetime(t) for t in self.np.datetime_as_string(times.astype("datetime64[ns]"), timezone="UTC")],
+        )
+
+    def test_list_serialization(self):
+        data = DataFrame(
+            times=["2021-11-01T23:50:06+02:00", "2021-11-01T21:50:07.5Z", "2021-11-02T00:00:00Z"],
+            series={"INPUT_ID_1": [1, None, 2.5]},
+        )
+        self.assertEqual(
+            json.loads(data.model_dump_json()),
+            {
+                "times": ["2021-11-01T21:50:06Z", "2021-11-01T21:50:07.500Z", "2021-11-02T00:00:00Z"],
+                "series": {"INPUT_ID_1": [1, None, 2.5]},
+            },
+        )
+        self.assertEqual(data.model_dump()["times"], data.times)
+
+    def test_list_serialization_without_numpy(self):
+        data = DataFrame(
+            times=["2021-11-01T23:50:06+02:00", "2021-11-01T21:50:07.5Z"],
+            series={"INPUT_ID_1": [1, None]},
+        )
+        with patch.dict(sys.modules, {"numpy": None}):
+            serialized = json.loads(data.model_dump_json())
+        # falls back to time_to_string per timestamp
+        self.assertEqual([parse_datetime(t) for t in serialized["times"]], data.times)
+        self.assertEqual(serialized["series"], {"INPUT_ID_1": [1, None]})
+
+
 if __name__ == "__main__":
     unittest.main()
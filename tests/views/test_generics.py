@@ -203,5 +203,59 @@ class TestResponse(unittest.TestCase):
         self.assertIsInstance(res.result, SignalSelection)
 
 
+class TestMergeResponses(unittest.TestCase):
+    def setUp(self):
+        with open("./tests/mock_data/dataframe.json") as f:
+            mock_data = json.load(f)
+            self.data_frame_response = mock_data["data_frame"]["response"]
+            self.error = mock_data["data_frame"]["error"]
+
+        with open("./tests/mock_data/items.json") as f:
+            mock_data = json.load(f)
+            self.select_items_response = mock_data["select_items"]["response"]
+
+    def test_merge_data_frame_pages(self):
+        pages = [
+            Response(**self.data_frame_response, method=ApiMethod.data_frame)
+            for _ in range(3)
+        ]
+        merged = Response.merge(pages)
+
+        self.assertIsInstance(merged.result, DataSelection)
+        self.assertEqual(merged.result.data, pages[0].result.data)
+
+        # assert included resources are only kept once
+        items = merged.result.included.items
+        self.assertEqual(len(items), len(pages[0].result.included.items))
+
+        # assert same result as adding one by one
+        added = Response(**self.data_frame_response, method=ApiMethod.data_frame)
+        for page in pages[1:]:
+            added += page
+        self.assertEqual(merged.result.data, added.result.data)
+
+    def test_merge_item_pages(self):
+        pages = [
+            Response(**self.select_items_response, method=ApiMethod.select_items)
+            for _ in range(2)
+        ]
+        merged = Response.merge(pages)
+
+        self.assertIsInstance(merged.result, ItemSelection)
+        self.assertEqual(len(merged.result.data), 2 * len(pages[0].result.data))
+
+    def test_merge_errors(self):
+        pages = [
+            Response(**self.data_frame_response, method=ApiMethod.data_frame),
+            Response(**self.error),
+            Response(**self.error),
+        ]
+        merged = Response.merge(pages)
+
+        self.assertIsInstance(merged.result, DataSelection)
+        self.assertEqual(len(merged.error), 2)
+        self.assertEqual(Response.merge(pages[:2]).error, pages[1].error)
+
+
 if __name__ == "__main__":
     unittest.main()